@@ -0,0 +1,514 @@
+"""Headless benchmarks of the game's hot paths (map generation, FOV, AI, rendering and saving).
+
+Every benchmark runs on fixed random seeds under the SDL dummy video and audio drivers, so no
+window is opened and repeated runs do exactly the same work. The results are written as JSON and,
+if --baseline is given, compared against a baseline recorded on the same machine, which fails the
+run if a benchmark got slower than the allowed tolerance.
+
+Usage (from the project root):
+    python -m benchmarks.hotpaths [--repeat N] [--only NAME ...] [--output FILE]
+                                  [--baseline [FILE]] [--save-baseline] [--tolerance PCT]
+"""
+import os
+
+# must be set before pygame opens the display or the mixer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import contextlib
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy
+import pygame
+import tcod
+
+from src import constants, globalvars, game, map, draw, hud, data, camera, assets, autosave, runtime, \
+    minimap, console, hudlayer, entities, events, modal, controls
+from src.generators import creaturegen, itemgen
+
+# the seed every benchmark run starts from
+SEED = 1234
+
+# the camera (window) sizes that the render benchmarks are run at
+CAMERA_SIZES = ((640, 480), (900, 700), (1280, 720), (1920, 1080))
+
+# number of turns simulated by the AI benchmark
+AI_TURNS = 1000
+
+# number of frames drawn per render benchmark run
+RENDER_FRAMES = 20
+
+# the share of a floor's tiles that the render benchmarks mark explored (as if the PLAYER had
+# walked around most of the floor), so that how much of the map the camera shows matters
+EXPLORED_SHARE = 0.6
+
+# number of mobs/items generated per population benchmark run
+POPULATION_COUNT = 200
+
+# number of times the PLAYER's combat stats are read per stats benchmark run
+STAT_READS = 10000
+
+# the area of effect radii that the aoe benchmark queries every floor tile with
+AOE_RADII = (1, 2, 4, 8)
+
+# where --save-baseline writes the results and where --baseline compares against by default (the
+# timings depend on the machine, so the baseline is a local untracked file)
+BASELINE_PATH = os.path.join("data", "cache", "benchmark_baseline.json")
+
+# the slowdown (percent of the fastest baseline run) that is allowed before a benchmark fails
+DEFAULT_TOLERANCE = 15.0
+
+
+def seed_all(seed=SEED):
+    """Seeds every random number generator the game uses (random, numpy and the tcod default)."""
+    random.seed(seed)
+    numpy.random.seed(seed)
+    tcod.random_restore(None, tcod.random_new_from_seed(seed))
+
+
+def init_headless():
+    """Sets up the globals that startup.game_initialize would, without any window or user files.
+
+    Default preferences are used instead of the player's preferences file so the camera size and
+    every other setting is the same on every machine.
+
+    Returns
+    -------
+    None
+    """
+    runtime.init()
+    tcod.namegen_parse(os.path.join("data", "namegen", "jice_fantasy.cfg"))
+
+    globalvars.PREFERENCES = data.StructPreferences()
+    game.game_compile_keybindings()
+    globalvars.SURFACE_MAIN = pygame.display.set_mode((constants.CAMERA_WIDTH,
+                                                       constants.CAMERA_HEIGHT))
+    globalvars.SURFACE_MAP = pygame.Surface((constants.MAP_WIDTH * constants.CELL_WIDTH,
+                                            constants.MAP_HEIGHT * constants.CELL_HEIGHT))
+    globalvars.CAMERA = camera.ObjCamera()
+    globalvars.MINI_MAP = minimap.ObjMiniMap()
+    globalvars.MESSAGE_CONSOLE = console.ObjMessageConsole()
+    globalvars.HUD_LAYER = hudlayer.ObjHudLayer()
+    globalvars.EVENT_BUS = events.ObjEventBus()
+    game.game_subscribe_events()
+    globalvars.INPUT_QUEUE = controls.ObjInputQueue()
+    globalvars.ASSETS = assets.ObjAssets()
+    globalvars.CLOCK = pygame.time.Clock()
+    globalvars.SAVE_WRITER = autosave.ObjSaveWriter()
+    globalvars.FOV_CALCULATE = True
+    globalvars.FLOOR_CHANGED = False
+
+
+def new_game():
+    """Starts a new seeded game on floor 1 with the FOV computed and the camera on the PLAYER."""
+    seed_all()
+    game.game_new()
+    globalvars.FOV_CALCULATE = True
+    map.update_fov()
+    globalvars.CAMERA.update_pos()
+
+
+def set_camera_size(size):
+    """Resizes the window (and so the camera and the mini map) to `size` (width, height)."""
+    constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT = size
+    globalvars.SURFACE_MAIN = pygame.display.set_mode(size)
+    globalvars.CAMERA = camera.ObjCamera()
+    globalvars.CAMERA.update_pos()
+
+
+def explore_floor(share=EXPLORED_SHARE):
+    """Marks `share` of the tiles of the current floor explored (picked on the fixed seed)."""
+    target_map = globalvars.GAME.current_map
+    rng = random.Random(SEED)
+
+    for column in target_map:
+        for tile in column:
+            tile.explored = tile.explored or rng.random() < share
+
+    # the explored tiles are cached by the map renderer and the mini map
+    explored = numpy.array([[tile.explored for tile in column] for column in target_map],
+                           dtype=bool)
+    map.floor_arrays(target_map)[1][...] = explored
+    globalvars.MINI_MAP.reset(target_map)
+
+
+def floor_tiles(target_map):
+    """Returns the (x, y) coordinates of every walkable tile in `target_map`."""
+    return [(x, y) for x in range(constants.MAP_WIDTH) for y in range(constants.MAP_HEIGHT)
+            if not target_map[x][y].block_path]
+
+
+# ==================== BENCHMARKS ==================== #
+# Each benchmark function does its own (untimed) setup and returns the function to time.
+
+def bench_map_create():
+    return map.map_create
+
+
+def bench_assign_tiles():
+    target_map, _ = map.map_create()
+    return lambda: map.assign_tiles(target_map)
+
+
+def bench_create_fov_map():
+    target_map, _ = map.map_create()
+    return lambda: map.create_fov_map(target_map)
+
+
+def bench_update_fov():
+    new_game()
+    positions = floor_tiles(globalvars.GAME.current_map)[::10]
+
+    def run():
+        for globalvars.PLAYER.x, globalvars.PLAYER.y in positions:
+            globalvars.FOV_CALCULATE = True
+            map.update_fov()
+
+    return run
+
+
+def bench_ai_turns():
+    def run():
+        new_game()
+        player = globalvars.PLAYER
+
+        # the PLAYER can't die (or the game over screen would open) and wanders around randomly
+        player.creature.death_function = None
+        for turn in range(AI_TURNS):
+            player.creature.current_hp = player.creature.max_hp
+            player.creature.move(random.choice((-1, 0, 1)), random.choice((-1, 0, 1)))
+
+            globalvars.FOV_CALCULATE = True
+            map.update_fov()
+
+            for obj in globalvars.GAME.current_objects.turn_takers():
+                if obj.ai is not None:
+                    obj.ai.take_turn()
+
+    return run
+
+
+def bench_draw_map(size):
+    def setup():
+        new_game()
+        set_camera_size(size)
+        explore_floor()
+
+        def run():
+            for frame in range(RENDER_FRAMES):
+                draw.draw_map(globalvars.GAME.current_map)
+
+        return run
+
+    return setup
+
+
+def bench_draw_mini_map(size):
+    def setup():
+        new_game()
+        set_camera_size(size)
+        explore_floor()
+
+        def run():
+            for frame in range(RENDER_FRAMES):
+                hud.draw_mini_map(globalvars.GAME.current_map)
+
+        return run
+
+    return setup
+
+
+def bench_modal_backdrop(size):
+    def setup():
+        new_game()
+        set_camera_size(size)
+        explore_floor()
+        backdrop = modal.ObjModalBackdrop()
+
+        def run():
+            # the frames of a menu (eg. the inventory) over the game
+            for frame in range(RENDER_FRAMES):
+                backdrop.draw()
+
+        return run
+
+    return setup
+
+
+def bench_aoe_query():
+    new_game()
+    tiles = floor_tiles(globalvars.GAME.current_map)[::10]
+
+    def run():
+        # the tiles and the creatures an area of effect centered on a tile covers
+        for radius in AOE_RADII:
+            for coords in tiles:
+                map.tiles_in_radius(coords, radius)
+                globalvars.GAME.current_objects.creatures_in_radius(coords, radius)
+
+    return run
+
+
+def bench_gen_enemy():
+    new_game()
+    room = globalvars.GAME.current_rooms[-1]
+    room_range = ((room.x1, room.x2), (room.y1, room.y2))
+
+    def run():
+        globalvars.GAME.current_objects = entities.ObjEntityStore([globalvars.PLAYER])
+        for mob in range(POPULATION_COUNT):
+            creaturegen.gen_enemy(*room_range, globalvars.GAME.cur_floor)
+
+    return run
+
+
+def bench_gen_item():
+    new_game()
+    coord = globalvars.GAME.current_rooms[-1].center
+
+    def run():
+        globalvars.GAME.current_objects = entities.ObjEntityStore([globalvars.PLAYER])
+        for item in range(POPULATION_COUNT):
+            itemgen.gen_item(globalvars.GAME.cur_floor, coord)
+
+    return run
+
+
+def bench_populate_floor():
+    new_game()
+
+    def run():
+        globalvars.GAME.current_objects = entities.ObjEntityStore([globalvars.PLAYER])
+        map.map_place_items_creatures(globalvars.GAME.current_rooms)
+
+    return run
+
+
+def bench_entity_churn():
+    new_game()
+    coord = globalvars.GAME.current_rooms[-1].center
+    for item in range(POPULATION_COUNT):
+        itemgen.gen_item(globalvars.GAME.cur_floor, coord)
+    items = [obj for obj in globalvars.GAME.current_objects if obj.item is not None]
+
+    def run():
+        # every item on a crowded floor is picked up and dropped again
+        for obj in items:
+            globalvars.GAME.current_objects.remove(obj)
+            globalvars.GAME.current_objects.add(obj)
+
+    return run
+
+
+def bench_combat_stats():
+    new_game()
+    player = globalvars.PLAYER
+    coord = (player.x, player.y)
+
+    # a full set of equipment, as the stats add up the bonuses of every equipped item
+    for equipment in (itemgen.gen_weapon_sword_iron(coord),
+                      itemgen.gen_defence_shield_bronze(coord)):
+        globalvars.GAME.current_objects.add(equipment)
+        equipment.item.pick_up(player)
+        equipment.equipment.equip()
+
+    def run():
+        for read in range(STAT_READS):
+            player.creature.power
+            player.creature.defence
+
+    return run
+
+
+def bench_game_snapshot():
+    new_game()
+    # the part of an autosave that runs on the main thread
+    return game.game_snapshot
+
+
+def bench_game_save():
+    new_game()
+    return game.game_save
+
+
+def bench_game_load():
+    new_game()
+    game.game_save()
+    slot = globalvars.GAME.save_slot
+    return lambda: game.game_load(slot)
+
+
+BENCHMARKS = {
+    "map.map_create": bench_map_create,
+    "map.assign_tiles": bench_assign_tiles,
+    "map.create_fov_map": bench_create_fov_map,
+    "map.update_fov": bench_update_fov,
+    f"ai {AI_TURNS} turns": bench_ai_turns,
+    **{f"draw.draw_map {width}x{height}": bench_draw_map((width, height))
+       for width, height in CAMERA_SIZES},
+    **{f"hud.draw_mini_map {width}x{height}": bench_draw_mini_map((width, height))
+       for width, height in CAMERA_SIZES},
+    **{f"modal backdrop {width}x{height}": bench_modal_backdrop((width, height))
+       for width, height in CAMERA_SIZES},
+    "map.tiles_in_radius": bench_aoe_query,
+    "creaturegen.gen_enemy": bench_gen_enemy,
+    "itemgen.gen_item": bench_gen_item,
+    "map.map_place_items_creatures": bench_populate_floor,
+    "entities add/remove": bench_entity_churn,
+    f"creature stats {STAT_READS} reads": bench_combat_stats,
+    "game.game_snapshot": bench_game_snapshot,
+    "game.game_save": bench_game_save,
+    "game.game_load": bench_game_load,
+}
+
+
+def run_benchmark(setup, repeat):
+    """Times a benchmark `repeat` times, reseeding the random number generators before each run.
+
+    Parameters
+    ----------
+    setup : function
+        The benchmark function that returns the function to time.
+    repeat : int
+        The number of timed runs.
+
+    Returns
+    -------
+    dict
+        The min, median and mean run time in ms and every run time ("runs_ms").
+    """
+    default_camera = (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT)
+
+    seed_all()
+    run = setup()
+
+    times = []
+    for run_num in range(repeat):
+        seed_all(SEED + run_num)
+        start = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - start) * 1000)
+
+    if (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT) != default_camera:
+        set_camera_size(default_camera)
+
+    return {"min_ms": min(times), "median_ms": statistics.median(times),
+            "mean_ms": statistics.mean(times), "runs_ms": times}
+
+
+def compare(results, baseline, tolerance):
+    """Prints how every benchmark compares to the baseline and returns the ones that regressed.
+
+    The fastest runs are compared, as they are the least affected by whatever else the machine is
+    doing at the time.
+
+    Parameters
+    ----------
+    results : dict
+        The benchmark results of this run (name -> result).
+    baseline : dict
+        The baseline benchmark results (name -> result).
+    tolerance : float
+        The allowed slowdown in percent of the baseline.
+
+    Returns
+    -------
+    list
+        The names of the benchmarks that are slower than the baseline by more than `tolerance`.
+    """
+    regressions = []
+
+    print(f"\n{'benchmark':<36}{'baseline':>12}{'now':>12}{'change':>10}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<36}{'-':>12}{result['min_ms']:10.2f}ms{'new':>10}")
+            continue
+
+        before = baseline[name]["min_ms"]
+        change = (result["min_ms"] - before) / before * 100
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  SLOWER"
+
+        print(f"{name:<36}{before:10.2f}ms{result['min_ms']:10.2f}ms{change:+9.1f}%{flag}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks of the game's hot paths.")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="+", metavar="NAME",
+                        help="only run the benchmarks whose names start with one of these")
+    parser.add_argument("--output", help="file to write the JSON results to")
+    parser.add_argument("--baseline", nargs="?", const=BASELINE_PATH,
+                        help=f"JSON results to compare against (default {BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results to the baseline file instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown against the baseline in percent")
+    args = parser.parse_args()
+
+    init_headless()
+
+    # saves made by the benchmarks must never touch the player's own saves
+    with tempfile.TemporaryDirectory() as save_dir:
+        constants.SAVE_DIR = save_dir
+        constants.SAVE_INDEX_PATH = os.path.join(save_dir, "index.json")
+
+        results = {}
+        for name, setup in BENCHMARKS.items():
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+
+            # the game's own debug output is discarded so it neither floods nor slows the results
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                results[name] = run_benchmark(setup, args.repeat)
+            print(f"{name:<36}{results[name]['median_ms']:10.2f} ms  "
+                  f"(min {results[name]['min_ms']:.2f} ms)")
+
+        globalvars.SAVE_WRITER.wait()
+
+    report = {"meta": {"python": platform.python_version(),
+                       "pygame": pygame.version.ver,
+                       "platform": platform.platform(),
+                       "seed": SEED,
+                       "repeat": args.repeat},
+              "results": results}
+
+    output_path = BASELINE_PATH if args.save_baseline else args.output
+    if output_path:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        with open(output_path, "w") as output_file:
+            json.dump(report, output_file, indent=1)
+        print(f"\nResults written to {output_path}")
+
+    if args.save_baseline or args.baseline is None:
+        return
+
+    if not os.path.isfile(args.baseline):
+        print(f"FAIL: there is no baseline at {args.baseline}, record one with --save-baseline")
+        sys.exit(1)
+
+    with open(args.baseline, "r") as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"FAIL: {len(regressions)} benchmark(s) are over {args.tolerance:.0f}% slower "
+              f"than the baseline")
+        sys.exit(1)
+
+    print(f"OK: no benchmark is over {args.tolerance:.0f}% slower than the baseline")
+
+
+if __name__ == "__main__":
+    main()
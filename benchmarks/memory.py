@@ -0,0 +1,111 @@
+"""Memory benchmark of the game state kept for every floor (tiles and actors).
+
+Generates a seeded game, climbs a number of floors (so that the floors below are kept in
+GAME.maps_prev like in a real game) and measures the memory allocated for the tiles and actors with
+tracemalloc, along with the size of the save.
+
+Usage (from the project root):
+    python -m benchmarks.memory [--floors N] [--output FILE]
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import pickle
+import tracemalloc
+
+from benchmarks import hotpaths
+from src import globalvars, map, entities
+
+# number of floors generated by default (the first floor and the ones climbed to)
+DEFAULT_FLOORS = 5
+
+
+def traced_bytes(function):
+    """Calls `function` and returns (its return value, the bytes it allocated and kept alive)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, allocated
+
+
+def measure(num_floors):
+    """Generates a game with `num_floors` floors and measures the memory used by its floors.
+
+    Parameters
+    ----------
+    num_floors : int
+        The number of floors to generate.
+
+    Returns
+    -------
+    dict
+        The results in bytes (per floor tiles and actors, all floors and the pickled game).
+    """
+    hotpaths.seed_all()
+    tiles_map, tiles_bytes = traced_bytes(lambda: map.map_create()[0])
+    del tiles_map
+
+    hotpaths.new_game()
+    rooms = globalvars.GAME.current_rooms
+
+    def populate():
+        globalvars.GAME.current_objects = entities.ObjEntityStore([globalvars.PLAYER])
+        map.map_place_items_creatures(rooms)
+        return globalvars.GAME.current_objects
+
+    actors, actors_bytes = traced_bytes(populate)
+
+    def climb():
+        for floor in range(num_floors - 1):
+            globalvars.GAME.map_transition_next()
+
+    hotpaths.new_game()
+    _, floors_bytes = traced_bytes(climb)
+
+    for obj in globalvars.GAME.current_objects:
+        obj.animation_del()
+    save_bytes = len(pickle.dumps([globalvars.GAME, globalvars.PLAYER]))
+    for obj in globalvars.GAME.current_objects:
+        obj.animation_init()
+
+    return {"floor_tiles_bytes": tiles_bytes,
+            "floor_actors_bytes": actors_bytes,
+            "floor_actors": len(actors),
+            "bytes_per_actor": actors_bytes / len(actors),
+            f"{num_floors - 1}_more_floors_bytes": floors_bytes,
+            "save_pickle_bytes": save_bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory benchmark of the game's floors.")
+    parser.add_argument("--floors", type=int, default=DEFAULT_FLOORS,
+                        help="number of floors to generate")
+    parser.add_argument("--output", help="file to write the JSON results to")
+    args = parser.parse_args()
+
+    hotpaths.init_headless()
+
+    # the game's own debug output is discarded so it doesn't flood the results
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        results = measure(args.floors)
+
+    for name, value in results.items():
+        print(f"{name:<28}{value:14,.0f}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"seed": hotpaths.SEED, "floors": args.floors, "results": results},
+                      output_file, indent=1)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
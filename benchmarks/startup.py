@@ -0,0 +1,69 @@
+"""Startup time regression benchmark.
+
+Starts the game several times in fresh processes with startup tracing on (see src/startuptrace.py)
+and fails if the median time from launch to the first main menu frame is over the budget.
+
+Usage (from the project root):
+    python -m benchmarks.startup [--runs N] [--budget MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# the startup time (ms) that the median run must stay under
+STARTUP_BUDGET_MS = 1500
+
+
+def run_startup(trace_path):
+    """Launches the game once and returns its startup trace summary.
+
+    Parameters
+    ----------
+    trace_path : str
+        The file the startup trace is written to.
+
+    Returns
+    -------
+    dict
+        The trace summary ("total_ms", "imports_ms" and "phases_ms").
+    """
+    subprocess.run([sys.executable, "main.py", f"--trace-startup={trace_path}",
+                    "--exit-after-startup"], check=True, stdout=subprocess.DEVNULL)
+
+    with open(trace_path, "r") as trace_file:
+        return json.load(trace_file)["otherData"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup time regression benchmark.")
+    parser.add_argument("--runs", type=int, default=5, help="number of cold starts to measure")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS,
+                        help="startup time budget for the median run in ms")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        summaries = [run_startup(os.path.join(temp_dir, f"trace_{run}.json"))
+                     for run in range(args.runs)]
+
+    median_total = statistics.median(summary["total_ms"] for summary in summaries)
+    median_imports = statistics.median(summary["imports_ms"] for summary in summaries)
+
+    print(f"startup (median of {args.runs}): {median_total:.1f} ms, imports {median_imports:.1f} ms")
+    for phase_name in summaries[0]["phases_ms"]:
+        phase_ms = statistics.median(summary["phases_ms"].get(phase_name, 0)
+                                     for summary in summaries)
+        print(f"    {phase_name:<30} {phase_ms:8.1f} ms")
+
+    if median_total > args.budget:
+        print(f"FAIL: startup is over the {args.budget:.0f} ms budget")
+        sys.exit(1)
+
+    print(f"OK: startup is within the {args.budget:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,18 @@
 #     |_|\___/ \_/\_/ \___|_|     \___/|_|   |_|  \_\__,_|_|\_\
 #
 
-from src.menu import mainmenu
+import sys
+
+from src import startuptrace
 
 if __name__ == '__main__':
+    # --trace-startup[=PATH] writes a startup timeline (Chrome trace format) once the main menu is up
+    for arg in sys.argv[1:]:
+        if arg == "--trace-startup" or arg.startswith("--trace-startup="):
+            trace_path = arg.partition("=")[2] or "startup_trace.json"
+            startuptrace.start(trace_path, exit_when_done="--exit-after-startup" in sys.argv)
+
+    with startuptrace.phase("import game modules"):
+        from src.menu import mainmenu
+
     mainmenu.menu_main()
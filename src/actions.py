@@ -45,7 +45,6 @@ def move_one_tile(direction):
     elif direction == "right":
         dx, dy = 1, 0
     globalvars.PLAYER.creature.move(dx, dy)
-    globalvars.FOV_CALCULATE = True
 
 
 def grab_item():
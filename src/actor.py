@@ -1,11 +1,12 @@
 import math
+import random
 
 import tcod
 
-from src import constants, globalvars, game
+from src import constants, globalvars, game, animclock, slotted, events
 
 
-class ObjActor:
+class ObjActor(slotted.Slotted):
     """An actor object class that essentially represents every entity in the game.
 
     This is an object that can be anything that appears in the game (except for walls and floors)
@@ -18,6 +19,11 @@ class ObjActor:
         The x-coordinate of the object in terms of map tiles (grid not pixels).
     y : int
         The y-coordinate of the object in terms of map tiles (grid not pixels).
+    entity_table : ObjComponentTable obj or None
+        The component table (of the entity store of the current floor) that the actor's position
+        and creature stats are written to (see entities.ObjComponentTable).
+    entity_id : int or None
+        The row of the actor in `entity_table`.
     object_name : str
         Name of the object.
     _animation_key :  str
@@ -25,17 +31,19 @@ class ObjActor:
     _animation_seq : list
         The sequence of sprites to be cycled through that make up the animation of the object.
     animation_index : int
-        The current index of the animation sequence list to be displayed (a single still sprite).
+        The index of the animation sequence list that was last displayed (a single still sprite).
     animation_speed : float, optional
         Time in seconds it takes to loop through one object animation iteration.
-    sprite_time_elapsed : float
-        Time in seconds the current sprite has been displayed for.
+    animation_phase : float
+        Time in seconds the actor's animation is ahead of the animation clock (see animclock), so
+        that actors don't all animate in step.
     _exp_total : int, optional
         Total experience points of the actor object (mainly for creatures).
     gold : int, optional
         Total gold value the actor object currently contains/owns.
     status : str, optional
-        The actor's status that dictates different behaviours (eg. STATUS_OPEN).
+        The actor's status that dictates different behaviours (eg. STATUS_OPEN). Setting it
+        publishes events.StatusChanged.
     _level : int
         Current level of actor (usually PLAYER).
     exp_to_next_total : int
@@ -56,6 +64,18 @@ class ObjActor:
         A ComPortal component that gives the object portal attributes (enter/win the game).
     """
 
+    __slots__ = ("_x", "_y", "entity_table", "entity_id", "object_name", "_animation_key",
+                 "_animation_seq", "animation_index", "animation_speed", "animation_phase",
+                 "_exp_total", "gold", "_status", "_level", "exp_to_next_total", "creature", "ai",
+                 "container", "item", "equipment", "stairs", "portal", "dmg_taken_posx",
+                 "dmg_taken_posy")
+
+    # actors saved before the animation clock existed have no phase of their own, actors saved
+    # before the component table existed aren't bound to one and kept their position in x and y,
+    # and actors saved before status changes were published kept their status in status
+    state_defaults = {"animation_phase": 0.0, "entity_table": None, "entity_id": None}
+    state_renames = {"x": "_x", "y": "_y", "status": "_status"}
+
     def __init__(self, x, y, object_name,
                  animation_key, animation_speed=0.5,
                  exp_total=0, gold=0,
@@ -68,6 +88,8 @@ class ObjActor:
                  stairs=None,
                  portal=None):
 
+        self.entity_table = None
+        self.entity_id = None
         self.x = x
         self.y = y
         self.object_name = object_name
@@ -76,11 +98,11 @@ class ObjActor:
         self._animation_seq = globalvars.ASSETS.animation_dict[self._animation_key]
         self.animation_index = 0
         self.animation_speed = animation_speed
-        self.sprite_time_elapsed = 0.0
+        self.animation_phase = random.uniform(0.0, animation_speed)
 
         self._exp_total = exp_total
         self.gold = gold
-        self.status = status
+        self._status = status
         self._level = 1
         self.exp_to_next_total = exp_chart[self._level]
 
@@ -117,6 +139,38 @@ class ObjActor:
         if self.portal:
             self.portal.owner = self
 
+    @property
+    def x(self):
+        """int: Gets the map-grid x-coordinate (also written to the component table when set)."""
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+        if self.entity_table is not None:
+            self.entity_table.x[self.entity_id] = value
+
+    @property
+    def y(self):
+        """int: Gets the map-grid y-coordinate (also written to the component table when set)."""
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+        if self.entity_table is not None:
+            self.entity_table.y[self.entity_id] = value
+
+    @property
+    def status(self):
+        """str: Gets the actor's status (publishing events.StatusChanged when it's set)."""
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+        globalvars.EVENT_BUS.publish(events.StatusChanged(self, value))
+
     @property
     def animation_key(self):
         """str: Gets the animation key that accesses the sprite sequence.
@@ -163,6 +217,7 @@ class ObjActor:
     def level(self, new_level):
         self._level = new_level
         self.exp_to_next_total = exp_chart[self._level]
+        globalvars.EVENT_BUS.publish(events.StatsChanged(self))
 
     @property
     def exp_total(self):
@@ -173,6 +228,7 @@ class ObjActor:
         gained = new_exp - self._exp_total
         if self._level != constants.PLAYER_MAX_LV:
             self._exp_total = new_exp
+            globalvars.EVENT_BUS.publish(events.StatsChanged(self))
             game.game_message(f"Gained {gained} experience points.", constants.COLOR_BLUE3)
         else:
             game.game_message(f"Already at max level, no exp was gained", constants.COLOR_RED)
@@ -193,8 +249,8 @@ class ObjActor:
         """Draws the actor object to the screen.
 
         Draws the actor object to the map screen if it appears within the PLAYER's fov.
-        If the object has multiple sprites in its animation list, it keeps track of the timing of
-        the animations and triggers a transition to display the next image in the list.
+        If the object has multiple sprites in its animation list, the image to display is taken
+        from the animation clock (see animclock.frame_index).
         This will give off an "idle" animation look, where creatures usually bob up and down.
 
         Parameters
@@ -215,20 +271,8 @@ class ObjActor:
             blit_y = self.y
 
         if self.is_visible:
-            if len(self._animation_seq) == 1:
-                self.animation_index = 0
-
-            elif len(self._animation_seq) > 1:
-                if globalvars.CLOCK.get_fps() > 0.0:
-                    self.sprite_time_elapsed += 1/globalvars.CLOCK.get_fps()
-
-                if self.sprite_time_elapsed >= self.time_per_sprite:
-                    self.sprite_time_elapsed = 0.0
-
-                    if self.animation_index >= len(self._animation_seq) - 1:
-                        self.animation_index = 0
-                    else:
-                        self.animation_index += 1
+            self.animation_index = animclock.frame_index(len(self._animation_seq),
+                                                         self.animation_speed, self.animation_phase)
 
             surface.blit(self._animation_seq[self.animation_index], (blit_x, blit_y))
 
@@ -0,0 +1,65 @@
+import pygame
+
+# the pygame tick (ms) of the earliest frame change of the animations drawn since begin_frame()
+_next_change_tick = None
+
+
+def begin_frame():
+    """Starts tracking the next animation frame change for a newly drawn frame.
+
+    Returns
+    -------
+    None
+    """
+    global _next_change_tick
+    _next_change_tick = None
+
+
+def frame_index(num_frames, animation_speed, phase=0.0):
+    """Returns the index of the frame that an animation shows right now.
+
+    The index is derived from the time since pygame was initialized, so every animation stays in
+    step with the real time no matter how often (or how steadily) it is drawn.
+
+    Parameters
+    ----------
+    num_frames : int
+        The number of sprites in the animation.
+    animation_speed : float
+        Time in seconds it takes to loop through the whole animation once.
+    phase : float, optional
+        Time in seconds the animation is ahead of the clock (so animations aren't all in step).
+
+    Returns
+    -------
+    int
+        The index of the sprite to display.
+    """
+    global _next_change_tick
+
+    if num_frames <= 1:
+        return 0
+
+    ms_per_frame = animation_speed * 1000 / num_frames
+    phase_ms = phase * 1000
+    frames_elapsed = int((pygame.time.get_ticks() + phase_ms) // ms_per_frame)
+
+    change_tick = (frames_elapsed + 1) * ms_per_frame - phase_ms
+    if _next_change_tick is None or change_tick < _next_change_tick:
+        _next_change_tick = change_tick
+
+    return frames_elapsed % num_frames
+
+
+def ms_until_next_frame():
+    """Returns how long until any animation drawn since begin_frame() shows its next sprite.
+
+    Returns
+    -------
+    float or None
+        The time in ms (0 if it's already due), or None if no animation has been drawn.
+    """
+    if _next_change_tick is None:
+        return None
+
+    return max(_next_change_tick - pygame.time.get_ticks(), 0)
@@ -1,9 +1,14 @@
+import collections
+import concurrent.futures
 import os
+import time
+import warnings
 
 import pygame
 
 from src import constants
 from src import globalvars
+from src import atlas
 
 
 class ObjSpriteSheet:
@@ -15,15 +20,17 @@ class ObjSpriteSheet:
     Attributes
     ----------
     sprite_sheet : pygame.Surface
-        The sprite sheet that is loaded from `file_dir` and `file_name`.
+        The sprite sheet that is loaded from `file_dir` and `file_name` (or the already decoded
+        `image` of that file).
     tileDict : dict
         Maps alphabetical letters to columns of the sprite sheet.
 
     """
 
-    def __init__(self, file_dir, file_name):
-        self.sprite_sheet = pygame.image.load(
-            os.path.join('data', 'graphics', file_dir, file_name)).convert()
+    def __init__(self, file_dir, file_name, image=None):
+        if image is None:
+            image = pygame.image.load(os.path.join('data', 'graphics', file_dir, file_name))
+        self.sprite_sheet = image.convert()
         self.tileDict = {
             'A': 0, 'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8, 'i': 9,
             'j': 10, 'k': 11, 'l': 12, 'm': 13, 'n': 14, 'o': 15, 'p': 16, 'q': 17, 'r': 18,
@@ -105,458 +112,474 @@ class ObjSpriteSheet:
         return animation_list
 
 
-class ObjAssets:
-    """A class which functions like a struct and contains all the assets used in the game.
+# sprite sheet name -> (folder in data/graphics, file name)
+SPRITE_SHEETS = {
+    # ---> Character folder
+    "player": ("Characters", "Player.png"),
+    "slime": ("Characters", "Slime.png"),
+    "death": ("Characters", "Death.png"),
+
+    # ---> Items folder
+    "weapon": ("Items", "Weapon.png"),
+    "defence": ("Items", "Defence.png"),
+    "scroll": ("Items", "Scroll.png"),
+    "special": ("Items", "Special.png"),
+    "money": ("Items", "Money.png"),
+
+    # ---> Objects folder
+    "wall": ("Objects", "Wall.png"),
+    "floor": ("Objects", "Floor.png"),
+    "tile": ("Objects", "Tile.png"),
+    "door": ("Objects", "Door.png"),
+    "dungeonTiles": ("Objects", "Dungeon_Tileset2.png"),
+
+    # ---> Menu folder
+    "menugui": ("menu", "menugui.png"),
+}
+
+# (width, height, scale) of the 16 x 16 sprites that are scaled up to the tile size
+SCALED_16 = (16, 16, (32, 32))
+
+# sprite name -> (kind, source, arguments)
+#   "animation": list of sprites from ObjSpriteSheet.get_animation(*arguments) of sheet `source`
+#   "image": list with one sprite from ObjSpriteSheet.get_image(*arguments) of sheet `source`
+#   "surface": the single sprite from ObjSpriteSheet.get_image(*arguments) of sheet `source`
+#   "file": a whole image file in data/graphics (`source`), scaled to `arguments` if given
+#   "screen": a whole image file in data/graphics (`source`), scaled to the game window size
+#   "fill": a 2 x 2 surface filled with the color `source` (mini map pixels)
+SPRITES = {
+    #                        ||| Animations |||
+
+    # ---> Player
+    "A_PLAYER_LEFT": ("animation", "player", ('A', 5, 4)),
+    "A_PLAYER_RIGHT": ("animation", "player", ('A', 4, 4)),
+    "S_PLAYER_PFP": ("file", os.path.join("menu", "pfp.png"), None),
+    "S_PLAYER_LVL": ("file", os.path.join("menu", "player_level.png"), None),
+
+    # ---> Enemy creatures
+    "A_DUNGO": ("animation", "slime", ('A', 1, 2)),
+    "A_DARKSOOT": ("animation", "slime", ('A', 2, 2)),
+    "A_BLAZEO": ("animation", "slime", ('e', 0, 2)),
+    "A_KELPCLOPSE": ("animation", "slime", ('e', 1, 2)),
+    "A_SHELK": ("animation", "slime", ('e', 2, 2)),
+
+    # friendly mobs
+    "A_ICESLIME": ("animation", "slime", ('A', 0, 2)),
+
+    # Soul sprites
+    "A_DEATH_RED": ("animation", "death", ('A', 0, 9)),
+    "A_DEATH_BLUE": ("animation", "death", ('A', 1, 9)),
+
+    #                        ||| Still Sprites |||
+
+    # ---> Dungeon structures (wall and floor tiles are declared from WALL_TILES and FLOOR_TILES)
+    "S_WALL": ("surface", "wall", ('d', 7) + SCALED_16),
+    "S_WALL_EXPLORED": ("surface", "wall", ('d', 13) + SCALED_16),
+
+    # ---> Items
+    "S_SCROLL_YELLOW": ("image", "scroll", ('A', 0)),
+    "S_SCROLL_GREEN": ("image", "scroll", ('a', 0)),
+    "S_SCROLL_RED": ("image", "scroll", ('b', 0)),
+    "S_SCROLL_BLUE": ("image", "scroll", ('c', 0)),
+    "S_SCROLL_BROWN": ("image", "scroll", ('d', 0)),
+    "S_SCROLL_WHITE": ("image", "scroll", ('A', 1)),
+    "S_SCROLL_GRAY": ("image", "scroll", ('a', 1)),
+    "S_SCROLL_MULTI": ("image", "scroll", ('b', 1)),
+    "S_GOLD": ("image", "money", ('A', 0)),
+
+    # ---> Equipment
+    "S_SWORD_BRONZE": ("image", "weapon", ('A', 0)),
+    "S_SWORD_IRON": ("image", "weapon", ('a', 0)),
+    "S_SWORD_STEEL": ("image", "weapon", ('b', 0)),
+    "S_SWORD_BLACK": ("image", "weapon", ('c', 0)),
+    "S_SWORD_RUNE": ("image", "weapon", ('d', 0)),
+    "S_SPEAR_BRONZE": ("image", "weapon", ('A', 1)),
+    "S_SPEAR_IRON": ("image", "weapon", ('a', 1)),
+    "S_SPEAR_STEEL": ("image", "weapon", ('b', 1)),
+    "S_SPEAR_BLACK": ("image", "weapon", ('c', 1)),
+    "S_SPEAR_RUNE": ("image", "weapon", ('d', 1)),
+
+    "S_SHIELD_WOODEN": ("image", "defence", ('A', 1)),
+    "S_SHIELD_BRONZE": ("image", "defence", ('A', 0)),
+    "S_SHIELD_IRON": ("image", "defence", ('a', 0)),
+    "S_SHIELD_STEEL": ("image", "defence", ('b', 0)),
+    "S_SHIELD_BLACK": ("image", "defence", ('c', 0)),
+    "S_SHIELD_RUNE": ("image", "defence", ('d', 0)),
+
+    # ---> Special
+    "S_STAIRS_UP": ("image", "tile", ('a', 2) + SCALED_16),
+    "S_STAIRS_DOWN": ("image", "tile", ('b', 2) + SCALED_16),
+
+    "S_MAGIC_ROCK": ("image", "special", ('a', 0)),
+    "A_PORTAL_OPEN": ("animation", "door", ('c', 6, 2) + SCALED_16),
+    "S_PORTAL_CLOSED": ("image", "door", ('b', 6) + SCALED_16),
+
+    # ---> Menus
+    "S_MAIN_MENU": ("screen", "landscape.png", None),
+    "S_INVENTORY": ("file", os.path.join("menu", "inventory.png"), None),
+    "S_INVENTORY_SELECT": ("file", os.path.join("menu", "inventory_selected.png"), None),
+    "S_GRAY_POPUP": ("file", os.path.join("menu", "gray_popup.png"), None),
+
+    "S_MINI_WALL": ("fill", pygame.Color("#d6871a"), None),
+    "S_MINI_WALL_EXPLORED": ("fill", pygame.Color("#6e4b1f"), None),
+    "S_MINI_FLOOR": ("fill", pygame.Color("#fffef5"), None),
+    "S_MINI_FLOOR_EXPLORED": ("fill", pygame.Color("#abaa9f"), None),
+    "S_MINI_STAIRS": ("fill", pygame.Color(*constants.COLOR_GREEN), None),
+    "S_MINI_PORTAL": ("fill", pygame.Color("#64c4ed"), None),
+
+    "S_TOP_L_MENU_LIGHT": ("surface", "menugui", ('b1', 8) + SCALED_16),
+    "S_TOP_R_MENU_LIGHT": ("surface", "menugui", ('e1', 8) + SCALED_16),
+    "S_TOP_MENU_LIGHT": ("surface", "menugui", ('c1', 8) + SCALED_16),
+    "S_BOT_L_MENU_LIGHT": ("surface", "menugui", ('b1', 10) + SCALED_16),
+    "S_BOT_R_MENU_LIGHT": ("surface", "menugui", ('e1', 10) + SCALED_16),
+    "S_BOT_MENU_LIGHT": ("surface", "menugui", ('c1', 10) + SCALED_16),
+    "S_SIDE_L_MENU_LIGHT": ("surface", "menugui", ('b1', 9) + SCALED_16),
+    "S_SIDE_R_MENU_LIGHT": ("surface", "menugui", ('e1', 9) + SCALED_16),
+    "S_MID_MENU_LIGHT": ("surface", "menugui", ('c1', 9) + SCALED_16),
+
+    "S_TOP_L_MENU_BROWN": ("surface", "menugui", ('b1', 14) + SCALED_16),
+    "S_TOP_R_MENU_BROWN": ("surface", "menugui", ('e1', 14) + SCALED_16),
+    "S_TOP_MENU_BROWN": ("surface", "menugui", ('c1', 14) + SCALED_16),
+    "S_BOT_L_MENU_BROWN": ("surface", "menugui", ('b1', 16) + SCALED_16),
+    "S_BOT_R_MENU_BROWN": ("surface", "menugui", ('e1', 16) + SCALED_16),
+    "S_BOT_MENU_BROWN": ("surface", "menugui", ('c1', 16) + SCALED_16),
+    "S_SIDE_L_MENU_BROWN": ("surface", "menugui", ('b1', 15) + SCALED_16),
+    "S_SIDE_R_MENU_BROWN": ("surface", "menugui", ('e1', 15) + SCALED_16),
+    "S_MID_MENU_BROWN": ("surface", "menugui", ('c1', 15) + SCALED_16),
+
+    "S_SIDE_L_BUTTON_BLUE": ("surface", "menugui", ('c1', 1) + SCALED_16),
+    "S_SIDE_R_BUTTON_BLUE": ("surface", "menugui", ('e1', 1) + SCALED_16),
+    "S_MID_BUTTON_BLUE": ("surface", "menugui", ('d1', 1) + SCALED_16),
+
+    "S_SIDE_L_BUTTON_BLUE_HOVER": ("surface", "menugui", ('y', 1) + SCALED_16),
+    "S_SIDE_R_BUTTON_BLUE_HOVER": ("surface", "menugui", ('a1', 1) + SCALED_16),
+    "S_MID_BUTTON_BLUE_HOVER": ("surface", "menugui", ('z', 1) + SCALED_16),
+
+    "S_TARGET_MARK": ("surface", "menugui", ('c1', 2) + SCALED_16),
+
+    # ---> GUI
+    "S_SLIDER_BUTTON": ("file", os.path.join("GUI", "buttons", "BTN_SLIDER_SM_(1).png"), (26, 20)),
+}
+
+# wall number (see map.assign_tiles) -> (col, row) of the wall sprite in the dungeonTiles sheet
+WALL_TILES = {
+    0: ('a', 0),
+    1: ('c', 0),
+    2: ('b', 0),  # need wall piece
+    3: ('A', 4),  # corner bot-left
+    4: ('e', 2),  # need wall piece
+    5: ('e', 1),
+    6: ('A', 0),  # corner top-left
+    7: ('e', 3),  # right (and left) side
+    8: ('a', 0),  # need wall piece
+    9: ('e', 4),  # corner bot-right
+    10: ('b', 0),  # need wall piece
+    11: ('a', 0),  # top side
+    12: ('e', 0),  # corner top-right
+    13: ('A', 1),  # left side
+    14: ('a', 4),  # bot side
+    15: ('a', 4),  # room corner
+    22: ('e', 4),  # room corner
+    33: ('A', 4),  # room corner
+    44: ('e', 0),  # room corner
+    55: ('A', 0),  # room corner
+    66: ('c', 5),  # room corner
+    77: ('d', 5),  # room corner
+    88: ('e', 5),  # room corner
+    99: ('f', 0),  # room corner
+    100: ('f', 1),  # room corner
+    111: ('f', 3),  # room corner
+    122: ('f', 2),  # room corner
+}
+
+# floor number (see map.assign_tiles) -> (col, row) of the floor sprite in the dungeonTiles sheet,
+# or a tuple of (col, row) variations that are picked from randomly
+FLOOR_TILES = {
+    0: (('f', 6), ('f', 7), ('f', 8), ('g', 6), ('g', 7), ('g', 8),
+        ('h', 6), ('h', 7), ('h', 8), ('i', 6), ('i', 7), ('i', 8)),
+    1: (('a', 6), ('b', 6), ('c', 6), ('d', 6)),
+    2: (('e', 6), ('e', 7), ('e', 8)),
+    3: ('d', 1),
+    4: (('a', 7), ('b', 7), ('c', 7), ('d', 7)),
+    5: ('b', 1),
+    6: ('d', 3),
+    7: ('d', 1),
+    8: (('A', 6), ('A', 7), ('A', 8)),
+    9: ('a', 1),
+    10: ('a', 2),
+    11: ('a', 1),
+    12: ('a', 3),
+    13: ('a', 1),
+    14: ('a', 3),
+    15: ('c', 2),
+}
+
+# the explored (darker) version of every dungeon tile is this many rows below the lit version
+EXPLORED_ROW_OFFSET = 10
+
+# sound effect name -> file name in data/audio/sfx
+SOUNDS = {
+    "sfx_hit_punch1": "hit_punch_1.wav",
+    "sfx_hit_punch2": "hit_punch_2.wav",
+    "sfx_hit_punch3": "hit_punch_3.wav",
+    "sfx_hit_punch4": "hit_punch_4.wav",
+    "sfx_hit_punch5": "hit_punch_5.wav",
+
+    "sfx_click1": "click3.wav",
+    "sfx_rollover": "rollover1.wav",
+    "sfx_coin_pickup": "coin_pickup.wav",
+    "sfx_soul_consume": "soul_consume.wav",
+    "sfx_pure_soul_consume": "pure_soul_consume.wav",
+    "sfx_item_pickup": "item_pickup.wav",
+    "sfx_level_up": "glassbell_levelup.wav",
+}
+
+# the time in milliseconds ObjAssetLoader.update may spend making assets per frame
+LOADER_FRAME_BUDGET_MS = 4
+
+# names of the sprites that can be used as an ObjActor animation_key
+ANIMATION_NAMES = (
+    "A_PLAYER_LEFT", "A_PLAYER_RIGHT", "A_DUNGO", "A_DARKSOOT", "A_BLAZEO", "A_KELPCLOPSE",
+    "A_SHELK", "A_ICESLIME", "A_DEATH_RED", "A_DEATH_BLUE",
+    "S_SCROLL_YELLOW", "S_SCROLL_GREEN", "S_SCROLL_RED", "S_SCROLL_BLUE", "S_SCROLL_BROWN",
+    "S_SCROLL_WHITE", "S_SCROLL_GRAY", "S_SCROLL_MULTI", "S_GOLD",
+    "S_SWORD_BRONZE", "S_SWORD_IRON", "S_SWORD_STEEL", "S_SWORD_BLACK", "S_SWORD_RUNE",
+    "S_SPEAR_BRONZE", "S_SPEAR_IRON", "S_SPEAR_STEEL", "S_SPEAR_BLACK", "S_SPEAR_RUNE",
+    "S_SHIELD_WOODEN", "S_SHIELD_BRONZE", "S_SHIELD_IRON", "S_SHIELD_STEEL", "S_SHIELD_BLACK",
+    "S_SHIELD_RUNE", "S_STAIRS_UP", "S_STAIRS_DOWN", "S_MAGIC_ROCK", "A_PORTAL_OPEN",
+    "S_PORTAL_CLOSED",
+)
+
+
+def declare_dungeon_tiles():
+    """Declares the wall and floor tile sprites (lit and explored) in SPRITES.
+
+    Returns
+    -------
+    tuple
+        The (wall, wall explored, floor, floor explored) dicts that map tile numbers to sprite
+        names (a tuple of sprite names for floors with random variations).
+    """
+    wall_names, wall_explored_names, floor_names, floor_explored_names = {}, {}, {}, {}
+
+    for wall_num, (col, row) in WALL_TILES.items():
+        wall_names[wall_num] = f"S_WALL_{wall_num}"
+        wall_explored_names[wall_num] = f"S_WALL_EXPLORED_{wall_num}"
+        SPRITES[wall_names[wall_num]] = ("surface", "dungeonTiles", (col, row) + SCALED_16)
+        SPRITES[wall_explored_names[wall_num]] = (
+            "surface", "dungeonTiles", (col, row + EXPLORED_ROW_OFFSET) + SCALED_16)
+
+    for floor_num, positions in FLOOR_TILES.items():
+        variations = (positions, ) if isinstance(positions[0], str) else positions
+        names = tuple(f"S_FLOOR_{floor_num}_{i}" for i in range(len(variations)))
+        explored_names = tuple(f"S_FLOOR_EXPLORED_{floor_num}_{i}" for i in range(len(variations)))
+
+        for name, explored_name, (col, row) in zip(names, explored_names, variations):
+            SPRITES[name] = ("surface", "dungeonTiles", (col, row) + SCALED_16)
+            SPRITES[explored_name] = (
+                "surface", "dungeonTiles", (col, row + EXPLORED_ROW_OFFSET) + SCALED_16)
+
+        floor_names[floor_num] = names if variations is positions else names[0]
+        floor_explored_names[floor_num] = (explored_names if variations is positions
+                                           else explored_names[0])
+
+    return wall_names, wall_explored_names, floor_names, floor_explored_names
+
 
-    Loads sprite sheets using the ObjSpriteSheet class and creates individual sprite images and
-    animations from the ObjActor class. Music and sound effects are included as assets.
+WALL_NAMES, WALL_EXPLORED_NAMES, FLOOR_NAMES, FLOOR_EXPLORED_NAMES = declare_dungeon_tiles()
+
+
+def declare_tile_sprite_ids():
+    """Numbers every wall and floor tile sprite so a whole map can be described by an int array.
+
+    Returns
+    -------
+    tuple
+        The dict that maps ("wall", wall number) and ("floor", floor number, variation index) to a
+        tile sprite ID, and the dict that maps each (ID * 2) to its lit sprite name and each
+        (ID * 2 + 1) to its explored sprite name.
     """
+    sprite_ids, sprite_names = {}, {}
 
-    def __init__(self):
+    tiles = [(("wall", wall_num), name, WALL_EXPLORED_NAMES[wall_num])
+             for wall_num, name in WALL_NAMES.items()]
 
-        # ========================== SPRITE SHEETS ========================== #
-
-        # ---> Character folder
-        self.player = ObjSpriteSheet("Characters", "Player.png")
-        self.slime = ObjSpriteSheet("Characters", "Slime.png")
-        self.death = ObjSpriteSheet("Characters", "Death.png")
-
-        # ---> Items folder
-        self.weapon = ObjSpriteSheet("Items", "Weapon.png")
-        self.defence = ObjSpriteSheet("Items", "Defence.png")
-        self.scroll = ObjSpriteSheet("Items", "Scroll.png")
-        self.special = ObjSpriteSheet("Items", "Special.png")
-        self.money = ObjSpriteSheet("Items", "Money.png")
-
-        # ---> Objects folder
-        self.wall = ObjSpriteSheet("Objects", "Wall.png")
-        self.floor = ObjSpriteSheet("Objects", "Floor.png")
-        self.tile = ObjSpriteSheet("Objects", "Tile.png")
-        self.door = ObjSpriteSheet("Objects", "Door.png")
-        self.dungeonTiles = ObjSpriteSheet("Objects", "Dungeon_Tileset2.png")
-
-        # ---> Menu folder
-        self.menugui = ObjSpriteSheet("menu", "menugui.png")
-
-        # ============================ SPRITES ============================= #
-
-        #                        ||| Animations |||
-
-        # ---> Player
-        self.A_PLAYER_LEFT = self.player.get_animation('A', 5, 4)
-        self.A_PLAYER_RIGHT = self.player.get_animation('A', 4, 4)
-        self.S_PLAYER_PFP = pygame.image.load(
-            os.path.join("data", "graphics", "menu", "pfp.png")).convert()
-        self.S_PLAYER_LVL = pygame.image.load(
-            os.path.join("data", "graphics", "menu", "player_level.png")).convert()
-
-        # ---> Enemy creatures
-        self.A_DUNGO = self.slime.get_animation('A', 1, 2)
-        self.A_DARKSOOT = self.slime.get_animation('A', 2, 2)
-        self.A_BLAZEO = self.slime.get_animation('e', 0, 2)
-        self.A_KELPCLOPSE = self.slime.get_animation('e', 1, 2)
-        self.A_SHELK = self.slime.get_animation('e', 2, 2)
-
-        # friendly mobs
-        self.A_ICESLIME = self.slime.get_animation('A', 0, 2)
-
-        # Soul sprites
-        self.A_DEATH_RED = self.death.get_animation('A', 0, 9)
-        self.A_DEATH_BLUE = self.death.get_animation('A', 1, 9)
-
-        #                        ||| Still Sprites |||
-
-        # ---> Dungeon structures
-        self.S_WALL = self.wall.get_image('d', 7, 16, 16, (32, 32))[0]
-        self.S_WALL_EXPLORED = self.wall.get_image('d', 13, 16, 16, (32, 32))[0]
-
-        self.S_WALL_0 = self.dungeonTiles.get_image('a', 0, 16, 16, (32, 32))[0]
-        self.S_WALL_1 = self.dungeonTiles.get_image('c', 0, 16, 16, (32, 32))[0]
-        self.S_WALL_2 = self.dungeonTiles.get_image('b', 0, 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_3 = self.dungeonTiles.get_image('A', 4, 16, 16, (32, 32))[0]  # corner bot-left
-        self.S_WALL_4 = self.dungeonTiles.get_image('e', 2, 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_5 = self.dungeonTiles.get_image('e', 1, 16, 16, (32, 32))[0]
-        self.S_WALL_6 = self.dungeonTiles.get_image('A', 0, 16, 16, (32, 32))[0]  # corner top-left
-        self.S_WALL_7 = self.dungeonTiles.get_image('e', 3, 16, 16, (32, 32))[0]  # right (and left) side
-        self.S_WALL_8 = self.dungeonTiles.get_image('a', 0, 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_9 = self.dungeonTiles.get_image('e', 4, 16, 16, (32, 32))[0]  # corner bot-right
-        self.S_WALL_10 = self.dungeonTiles.get_image('b', 0, 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_11 = self.dungeonTiles.get_image('a', 0, 16, 16, (32, 32))[0]  # top side
-        self.S_WALL_12 = self.dungeonTiles.get_image('e', 0, 16, 16, (32, 32))[0]  # corner top-right
-        self.S_WALL_13 = self.dungeonTiles.get_image('A', 1, 16, 16, (32, 32))[0]  # left side
-        self.S_WALL_14 = self.dungeonTiles.get_image('a', 4, 16, 16, (32, 32))[0]  # bot side
-        self.S_WALL_15 = self.dungeonTiles.get_image('a', 4, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_22 = self.dungeonTiles.get_image('e', 4, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_33 = self.dungeonTiles.get_image('A', 4, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_44 = self.dungeonTiles.get_image('e', 0, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_55 = self.dungeonTiles.get_image('A', 0, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_66 = self.dungeonTiles.get_image('c', 5, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_77 = self.dungeonTiles.get_image('d', 5, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_88 = self.dungeonTiles.get_image('e', 5, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_99 = self.dungeonTiles.get_image('f', 0, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_100 = self.dungeonTiles.get_image('f', 1, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_111 = self.dungeonTiles.get_image('f', 3, 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_122 = self.dungeonTiles.get_image('f', 2, 16, 16, (32, 32))[0]  # room corner
-
-        self.S_WALL_EXPLORED_0 = self.dungeonTiles.get_image('a', (0 + 10), 16, 16, (32, 32))[0]
-        self.S_WALL_EXPLORED_1 = self.dungeonTiles.get_image('c', (0 + 10), 16, 16, (32, 32))[0]
-        self.S_WALL_EXPLORED_2 = self.dungeonTiles.get_image('b', (0 + 10), 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_EXPLORED_3 = self.dungeonTiles.get_image('A', (4 + 10), 16, 16, (32, 32))[0]  # corner bot-left
-        self.S_WALL_EXPLORED_4 = self.dungeonTiles.get_image('e', (2 + 10), 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_EXPLORED_5 = self.dungeonTiles.get_image('e', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_WALL_EXPLORED_6 = self.dungeonTiles.get_image('A', (0 + 10), 16, 16, (32, 32))[0]  # corner top-left
-        self.S_WALL_EXPLORED_7 = self.dungeonTiles.get_image('e', (3 + 10), 16, 16, (32, 32))[0]  # right (and left) side
-        self.S_WALL_EXPLORED_8 = self.dungeonTiles.get_image('a', (0 + 10), 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_EXPLORED_9 = self.dungeonTiles.get_image('e', (4 + 10), 16, 16, (32, 32))[0]  # corner bot-right
-        self.S_WALL_EXPLORED_10 = self.dungeonTiles.get_image('b', (0 + 10), 16, 16, (32, 32))[0]  # need wall piece
-        self.S_WALL_EXPLORED_11 = self.dungeonTiles.get_image('a', (0 + 10), 16, 16, (32, 32))[0]  # top side
-        self.S_WALL_EXPLORED_12 = self.dungeonTiles.get_image('e', (0 + 10), 16, 16, (32, 32))[0]  # corner top-right
-        self.S_WALL_EXPLORED_13 = self.dungeonTiles.get_image('A', (1 + 10), 16, 16, (32, 32))[0]  # left side
-        self.S_WALL_EXPLORED_14 = self.dungeonTiles.get_image('a', (4 + 10), 16, 16, (32, 32))[0]  # bot side
-        self.S_WALL_EXPLORED_15 = self.dungeonTiles.get_image('a', (4 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_22 = self.dungeonTiles.get_image('e', (4 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_33 = self.dungeonTiles.get_image('A', (4 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_44 = self.dungeonTiles.get_image('e', (0 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_55 = self.dungeonTiles.get_image('A', (0 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_66 = self.dungeonTiles.get_image('c', (5 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_77 = self.dungeonTiles.get_image('d', (5 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_88 = self.dungeonTiles.get_image('e', (5 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_99 = self.dungeonTiles.get_image('f', (0 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_100 = self.dungeonTiles.get_image('f', (1 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_111 = self.dungeonTiles.get_image('f', (3 + 10), 16, 16, (32, 32))[0]  # room corner
-        self.S_WALL_EXPLORED_122 = self.dungeonTiles.get_image('f', (2 + 10), 16, 16, (32, 32))[0]  # room corner
-
-        self.S_FLOOR_0_f6 = self.dungeonTiles.get_image('f', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_f7 = self.dungeonTiles.get_image('f', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_f8 = self.dungeonTiles.get_image('f', 8, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_g6 = self.dungeonTiles.get_image('g', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_g7 = self.dungeonTiles.get_image('g', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_g8 = self.dungeonTiles.get_image('g', 8, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_h6 = self.dungeonTiles.get_image('h', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_h7 = self.dungeonTiles.get_image('h', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_h8 = self.dungeonTiles.get_image('h', 8, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_i6 = self.dungeonTiles.get_image('i', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_i7 = self.dungeonTiles.get_image('i', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_0_i8 = self.dungeonTiles.get_image('i', 8, 16, 16, (32, 32))[0]
-
-        self.S_FLOOR_1_a1 = self.dungeonTiles.get_image('a', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_1_b1 = self.dungeonTiles.get_image('b', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_1_c1 = self.dungeonTiles.get_image('c', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_1_d1 = self.dungeonTiles.get_image('d', 6, 16, 16, (32, 32))[0]
-
-        self.S_FLOOR_2_e6 = self.dungeonTiles.get_image('e', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_2_e7 = self.dungeonTiles.get_image('e', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_2_e8 = self.dungeonTiles.get_image('e', 8, 16, 16, (32, 32))[0]
-
-        self.S_FLOOR_3 = self.dungeonTiles.get_image('d', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_4_a3 = self.dungeonTiles.get_image('a', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_4_b3 = self.dungeonTiles.get_image('b', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_4_c3 = self.dungeonTiles.get_image('c', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_4_d3 = self.dungeonTiles.get_image('d', 7, 16, 16, (32, 32))[0]
-
-
-        self.S_FLOOR_5 = self.dungeonTiles.get_image('b', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_6 = self.dungeonTiles.get_image('d', 3, 16, 16, (32, 32))[0]
-        self.S_FLOOR_7 = self.dungeonTiles.get_image('d', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_8_A6 = self.dungeonTiles.get_image('A', 6, 16, 16, (32, 32))[0]
-        self.S_FLOOR_8_A7 = self.dungeonTiles.get_image('A', 7, 16, 16, (32, 32))[0]
-        self.S_FLOOR_8_A8 = self.dungeonTiles.get_image('A', 8, 16, 16, (32, 32))[0]
-
-        self.S_FLOOR_9 = self.dungeonTiles.get_image('a', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_10 = self.dungeonTiles.get_image('a', 2, 16, 16, (32, 32))[0]
-        self.S_FLOOR_11 = self.dungeonTiles.get_image('a', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_12 = self.dungeonTiles.get_image('a', 3, 16, 16, (32, 32))[0]
-        self.S_FLOOR_13 = self.dungeonTiles.get_image('a', 1, 16, 16, (32, 32))[0]
-        self.S_FLOOR_14 = self.dungeonTiles.get_image('a', 3, 16, 16, (32, 32))[0]
-        self.S_FLOOR_15 = self.dungeonTiles.get_image('c', 2, 16, 16, (32, 32))[0]
-
-        self.S_FLOOR_EXPLORED_0_f6 = self.dungeonTiles.get_image('f', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_f7 = self.dungeonTiles.get_image('f', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_f8 = self.dungeonTiles.get_image('f', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_g6 = self.dungeonTiles.get_image('g', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_g7 = self.dungeonTiles.get_image('g', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_g8 = self.dungeonTiles.get_image('g', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_h6 = self.dungeonTiles.get_image('h', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_h7 = self.dungeonTiles.get_image('h', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_h8 = self.dungeonTiles.get_image('h', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_i6 = self.dungeonTiles.get_image('i', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_i7 = self.dungeonTiles.get_image('i', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_0_i8 = self.dungeonTiles.get_image('i', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_1_a1 = self.dungeonTiles.get_image('a', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_1_b1 = self.dungeonTiles.get_image('b', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_1_c1 = self.dungeonTiles.get_image('c', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_1_d1 = self.dungeonTiles.get_image('d', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_2_e6 = self.dungeonTiles.get_image('e', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_2_e7 = self.dungeonTiles.get_image('e', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_2_e8 = self.dungeonTiles.get_image('e', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_3 = self.dungeonTiles.get_image('d', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_4_a3 = self.dungeonTiles.get_image('a', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_4_b3 = self.dungeonTiles.get_image('b', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_4_c3 = self.dungeonTiles.get_image('c', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_4_d3 = self.dungeonTiles.get_image('d', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_5 = self.dungeonTiles.get_image('b', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_6 = self.dungeonTiles.get_image('d', (3 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_7 = self.dungeonTiles.get_image('d', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_8_A6 = self.dungeonTiles.get_image('A', (6 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_8_A7 = self.dungeonTiles.get_image('A', (7 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_8_A8 = self.dungeonTiles.get_image('A', (8 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_9 = self.dungeonTiles.get_image('a', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_10 = self.dungeonTiles.get_image('a', (2 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_11 = self.dungeonTiles.get_image('a', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_12 = self.dungeonTiles.get_image('a', (3 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_13 = self.dungeonTiles.get_image('a', (1 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_14 = self.dungeonTiles.get_image('a', (3 + 10), 16, 16, (32, 32))[0]
-        self.S_FLOOR_EXPLORED_15 = self.dungeonTiles.get_image('c', (2 + 10), 16, 16, (32, 32))[0]
-
-        # ---> Items
-        self.S_SCROLL_YELLOW = self.scroll.get_image('A', 0)
-        self.S_SCROLL_GREEN = self.scroll.get_image('a', 0)
-        self.S_SCROLL_RED = self.scroll.get_image('b', 0)
-        self.S_SCROLL_BLUE = self.scroll.get_image('c', 0)
-        self.S_SCROLL_BROWN = self.scroll.get_image('d', 0)
-        self.S_SCROLL_WHITE = self.scroll.get_image('A', 1)
-        self.S_SCROLL_GRAY = self.scroll.get_image('a', 1)
-        self.S_SCROLL_MULTI = self.scroll.get_image('b', 1)
-        self.S_GOLD = self.money.get_image('A', 0)
-
-        # ---> Equipment
-        self.S_SWORD_BRONZE = self.weapon.get_image('A', 0)
-        self.S_SWORD_IRON = self.weapon.get_image('a', 0)
-        self.S_SWORD_STEEL = self.weapon.get_image('b', 0)
-        self.S_SWORD_BLACK = self.weapon.get_image('c', 0)
-        self.S_SWORD_RUNE = self.weapon.get_image('d', 0)
-        self.S_SPEAR_BRONZE = self.weapon.get_image('A', 1)
-        self.S_SPEAR_IRON = self.weapon.get_image('a', 1)
-        self.S_SPEAR_STEEL = self.weapon.get_image('b', 1)
-        self.S_SPEAR_BLACK = self.weapon.get_image('c', 1)
-        self.S_SPEAR_RUNE = self.weapon.get_image('d', 1)
-
-        self.S_SHIELD_WOODEN = self.defence.get_image('A', 1)
-        self.S_SHIELD_BRONZE = self.defence.get_image('A', 0)
-        self.S_SHIELD_IRON = self.defence.get_image('a', 0)
-        self.S_SHIELD_STEEL = self.defence.get_image('b', 0)
-        self.S_SHIELD_BLACK = self.defence.get_image('c', 0)
-        self.S_SHIELD_RUNE = self.defence.get_image('d', 0)
-
-        # ---> Special
-        self.S_STAIRS_UP = self.tile.get_image('a', 2, 16, 16, (32, 32))
-        self.S_STAIRS_DOWN = self.tile.get_image('b', 2, 16, 16, (32, 32))
-
-        self.S_MAIN_MENU = pygame.image.load(os.path.join("data", "graphics", "landscape.png")).convert()
-        self.S_MAIN_MENU = pygame.transform.scale(self.S_MAIN_MENU, (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT))
-
-        self.S_INVENTORY = pygame.image.load(os.path.join("data", "graphics", "menu", "inventory.png")).convert()
-        self.S_INVENTORY_SELECT = \
-            pygame.image.load(os.path.join("data", "graphics", "menu", "inventory_selected.png")).convert()
-        self.S_GRAY_POPUP = pygame.image.load(os.path.join("data", "graphics", "menu", "gray_popup.png")).convert()
-
-        self.S_MINI_WALL = pygame.Surface((2, 2))
-        self.S_MINI_WALL.fill(pygame.Color("#d6871a"))
-        self.S_MINI_WALL_EXPLORED = pygame.Surface((2, 2))
-        self.S_MINI_WALL_EXPLORED.fill(pygame.Color("#6e4b1f"))
-
-        self.S_MINI_FLOOR = pygame.Surface((2, 2))
-        self.S_MINI_FLOOR.fill(pygame.Color("#fffef5"))
-        self.S_MINI_FLOOR_EXPLORED = pygame.Surface((2, 2))
-        self.S_MINI_FLOOR_EXPLORED.fill(pygame.Color("#abaa9f"))
-
-        self.S_MINI_STAIRS = pygame.Surface((2, 2))
-        self.S_MINI_STAIRS.fill(constants.COLOR_GREEN)
-        self.S_MINI_PORTAL = pygame.Surface((2, 2))
-        self.S_MINI_PORTAL.fill(pygame.Color("#64c4ed"))
-
-        self.S_TOP_L_MENU_LIGHT = self.menugui.get_image('b1', 8, 16, 16, (32, 32))[0]
-        self.S_TOP_R_MENU_LIGHT = self.menugui.get_image('e1', 8, 16, 16, (32, 32))[0]
-        self.S_TOP_MENU_LIGHT = self.menugui.get_image('c1', 8, 16, 16, (32, 32))[0]
-        self.S_BOT_L_MENU_LIGHT = self.menugui.get_image('b1', 10, 16, 16, (32, 32))[0]
-        self.S_BOT_R_MENU_LIGHT = self.menugui.get_image('e1', 10, 16, 16, (32, 32))[0]
-        self.S_BOT_MENU_LIGHT = self.menugui.get_image('c1', 10, 16, 16, (32, 32))[0]
-        self.S_SIDE_L_MENU_LIGHT = self.menugui.get_image('b1', 9, 16, 16, (32, 32))[0]
-        self.S_SIDE_R_MENU_LIGHT = self.menugui.get_image('e1', 9, 16, 16, (32, 32))[0]
-        self.S_MID_MENU_LIGHT = self.menugui.get_image('c1', 9, 16, 16, (32, 32))[0]
-
-        self.S_TOP_L_MENU_BROWN = self.menugui.get_image('b1', 14, 16, 16, (32, 32))[0]
-        self.S_TOP_R_MENU_BROWN = self.menugui.get_image('e1', 14, 16, 16, (32, 32))[0]
-        self.S_TOP_MENU_BROWN = self.menugui.get_image('c1', 14, 16, 16, (32, 32))[0]
-        self.S_BOT_L_MENU_BROWN = self.menugui.get_image('b1', 16, 16, 16, (32, 32))[0]
-        self.S_BOT_R_MENU_BROWN = self.menugui.get_image('e1', 16, 16, 16, (32, 32))[0]
-        self.S_BOT_MENU_BROWN = self.menugui.get_image('c1', 16, 16, 16, (32, 32))[0]
-        self.S_SIDE_L_MENU_BROWN = self.menugui.get_image('b1', 15, 16, 16, (32, 32))[0]
-        self.S_SIDE_R_MENU_BROWN = self.menugui.get_image('e1', 15, 16, 16, (32, 32))[0]
-        self.S_MID_MENU_BROWN = self.menugui.get_image('c1', 15, 16, 16, (32, 32))[0]
-
-        self.S_SIDE_L_BUTTON_BLUE = self.menugui.get_image('c1', 1, 16, 16, (32, 32))[0]
-        self.S_SIDE_R_BUTTON_BLUE = self.menugui.get_image('e1', 1, 16, 16, (32, 32))[0]
-        self.S_MID_BUTTON_BLUE = self.menugui.get_image('d1', 1, 16, 16, (32, 32))[0]
-
-        self.S_SIDE_L_BUTTON_BLUE_HOVER = self.menugui.get_image('y', 1, 16, 16, (32, 32))[0]
-        self.S_SIDE_R_BUTTON_BLUE_HOVER = self.menugui.get_image('a1', 1, 16, 16, (32, 32))[0]
-        self.S_MID_BUTTON_BLUE_HOVER = self.menugui.get_image('z', 1, 16, 16, (32, 32))[0]
-
-        self.S_MAGIC_ROCK = self.special.get_image('a', 0)
-        self.A_PORTAL_OPEN = self.door.get_animation('c', 6, 2, 16, 16, (32, 32))
-        self.S_PORTAL_CLOSED = self.door.get_image('b', 6, 16, 16, (32, 32))
-
-        self.S_TARGET_MARK = self.menugui.get_image('c1', 2, 16, 16, (32, 32))[0]
+    for floor_num, names in FLOOR_NAMES.items():
+        explored_names = FLOOR_EXPLORED_NAMES[floor_num]
+        if not isinstance(names, tuple):
+            names, explored_names = (names, ), (explored_names, )
 
-        # ---> GUI
-        self.slider_button_size = (26, 20)
-        self.slider_btn_path = os.path.join(
-            "data", "graphics", "GUI", "buttons", "BTN_SLIDER_SM_(1).png")
-        self.S_SLIDER_BUTTON = pygame.image.load(self.slider_btn_path).convert()
-        self.S_SLIDER_BUTTON = pygame.transform.scale(self.S_SLIDER_BUTTON, self.slider_button_size)
-
-        self.animation_dict = {
-            "A_PLAYER_LEFT": self.A_PLAYER_LEFT,
-            "A_PLAYER_RIGHT": self.A_PLAYER_RIGHT,
-            "A_DUNGO": self.A_DUNGO,
-            "A_DARKSOOT": self.A_DARKSOOT,
-            "A_BLAZEO": self.A_BLAZEO,
-            "A_KELPCLOPSE": self.A_KELPCLOPSE,
-            "A_SHELK": self.A_SHELK,
-            "A_ICESLIME": self.A_ICESLIME,
-            "A_DEATH_RED": self.A_DEATH_RED,
-            "A_DEATH_BLUE": self.A_DEATH_BLUE,
-            "S_SCROLL_YELLOW": self.S_SCROLL_YELLOW,
-            "S_SCROLL_GREEN": self.S_SCROLL_GREEN,
-            "S_SCROLL_RED": self.S_SCROLL_RED,
-            "S_SCROLL_BLUE": self.S_SCROLL_BLUE,
-            "S_SCROLL_BROWN": self.S_SCROLL_BROWN,
-            "S_SCROLL_WHITE": self.S_SCROLL_WHITE,
-            "S_SCROLL_GRAY": self.S_SCROLL_GRAY,
-            "S_SCROLL_MULTI": self.S_SCROLL_MULTI,
-            "S_GOLD": self.S_GOLD,
-            "S_SWORD_BRONZE": self.S_SWORD_BRONZE,
-            "S_SWORD_IRON": self.S_SWORD_IRON,
-            "S_SWORD_STEEL": self.S_SWORD_STEEL,
-            "S_SWORD_BLACK": self.S_SWORD_BLACK,
-            "S_SWORD_RUNE": self.S_SWORD_RUNE,
-            "S_SPEAR_BRONZE": self.S_SPEAR_BRONZE,
-            "S_SPEAR_IRON": self.S_SPEAR_IRON,
-            "S_SPEAR_STEEL": self.S_SPEAR_STEEL,
-            "S_SPEAR_BLACK": self.S_SPEAR_BLACK,
-            "S_SPEAR_RUNE": self.S_SPEAR_RUNE,
-            "S_SHIELD_WOODEN": self.S_SHIELD_WOODEN,
-            "S_SHIELD_BRONZE": self.S_SHIELD_BRONZE,
-            "S_SHIELD_IRON": self.S_SHIELD_IRON,
-            "S_SHIELD_STEEL": self.S_SHIELD_STEEL,
-            "S_SHIELD_BLACK": self.S_SHIELD_BLACK,
-            "S_SHIELD_RUNE": self.S_SHIELD_RUNE,
-            "S_STAIRS_UP": self.S_STAIRS_UP,
-            "S_STAIRS_DOWN": self.S_STAIRS_DOWN,
-            "S_MAGIC_ROCK": self.S_MAGIC_ROCK,
-            "A_PORTAL_OPEN": self.A_PORTAL_OPEN,
-            "S_PORTAL_CLOSED": self.S_PORTAL_CLOSED
-        }
+        tiles += [(("floor", floor_num, index), name, explored_name)
+                  for index, (name, explored_name) in enumerate(zip(names, explored_names))]
 
-        self.wall_dict = {
-            0: self.S_WALL_0,
-            1: self.S_WALL_1,
-            2: self.S_WALL_2,
-            3: self.S_WALL_3,
-            4: self.S_WALL_4,
-            5: self.S_WALL_5,
-            6: self.S_WALL_6,
-            7: self.S_WALL_7,
-            8: self.S_WALL_8,
-            9: self.S_WALL_9,
-            10: self.S_WALL_10,
-            11: self.S_WALL_11,
-            12: self.S_WALL_12,
-            13: self.S_WALL_13,
-            14: self.S_WALL_14,
-            15: self.S_WALL_15,
-            22: self.S_WALL_22,
-            33: self.S_WALL_33,
-            44: self.S_WALL_44,
-            55: self.S_WALL_55,
-            66: self.S_WALL_66,
-            77: self.S_WALL_77,
-            88: self.S_WALL_88,
-            99: self.S_WALL_99,
-            100: self.S_WALL_100,
-            111: self.S_WALL_111,
-            122: self.S_WALL_122,
+    for sprite_id, (key, name, explored_name) in enumerate(tiles):
+        sprite_ids[key] = sprite_id
+        sprite_names[sprite_id * 2] = name
+        sprite_names[sprite_id * 2 + 1] = explored_name
 
-        }
+    return sprite_ids, sprite_names
 
-        self.wall_explored_dict = {
-            0: self.S_WALL_EXPLORED_0,
-            1: self.S_WALL_EXPLORED_1,
-            2: self.S_WALL_EXPLORED_2,
-            3: self.S_WALL_EXPLORED_3,
-            4: self.S_WALL_EXPLORED_4,
-            5: self.S_WALL_EXPLORED_5,
-            6: self.S_WALL_EXPLORED_6,
-            7: self.S_WALL_EXPLORED_7,
-            8: self.S_WALL_EXPLORED_8,
-            9: self.S_WALL_EXPLORED_9,
-            10: self.S_WALL_EXPLORED_10,
-            11: self.S_WALL_EXPLORED_11,
-            12: self.S_WALL_EXPLORED_12,
-            13: self.S_WALL_EXPLORED_13,
-            14: self.S_WALL_EXPLORED_14,
-            15: self.S_WALL_EXPLORED_15,
-            22: self.S_WALL_EXPLORED_22,
-            33: self.S_WALL_EXPLORED_33,
-            44: self.S_WALL_EXPLORED_44,
-            55: self.S_WALL_EXPLORED_55,
-            66: self.S_WALL_EXPLORED_66,
-            77: self.S_WALL_EXPLORED_77,
-            88: self.S_WALL_EXPLORED_88,
-            99: self.S_WALL_EXPLORED_99,
-            100: self.S_WALL_EXPLORED_100,
-            111: self.S_WALL_EXPLORED_111,
-            122: self.S_WALL_EXPLORED_122,
 
-        }
+TILE_SPRITE_IDS, TILE_SPRITE_NAMES = declare_tile_sprite_ids()
 
-        self.floor_dict = {
-            0: (self.S_FLOOR_0_f6, self.S_FLOOR_0_f7, self.S_FLOOR_0_f8,
-                self.S_FLOOR_0_g6, self.S_FLOOR_0_g7, self.S_FLOOR_0_g8,
-                self.S_FLOOR_0_h6, self.S_FLOOR_0_h7, self.S_FLOOR_0_h8,
-                self.S_FLOOR_0_i6, self.S_FLOOR_0_i7, self.S_FLOOR_0_i8),
-
-            1: (self.S_FLOOR_1_a1, self.S_FLOOR_1_b1, self.S_FLOOR_1_c1, self.S_FLOOR_1_d1,),
-            2: (self.S_FLOOR_2_e6, self.S_FLOOR_2_e7, self.S_FLOOR_2_e8),
-            3: self.S_FLOOR_3,
-            4: (self.S_FLOOR_4_a3, self.S_FLOOR_4_b3, self.S_FLOOR_4_c3, self.S_FLOOR_4_d3),
-            5: self.S_FLOOR_5,
-            6: self.S_FLOOR_6,
-            7: self.S_FLOOR_7,
-            8: (self.S_FLOOR_8_A6, self.S_FLOOR_8_A7, self.S_FLOOR_8_A8),
-            9: self.S_FLOOR_9,
-            10: self.S_FLOOR_10,
-            11: self.S_FLOOR_11,
-            12: self.S_FLOOR_12,
-            13: self.S_FLOOR_13,
-            14: self.S_FLOOR_14,
-            15: self.S_FLOOR_15,
-        }
 
-        self.floor_explored_dict = {
-            0: (self.S_FLOOR_EXPLORED_0_f6, self.S_FLOOR_EXPLORED_0_f7, self.S_FLOOR_EXPLORED_0_f8,
-                self.S_FLOOR_EXPLORED_0_g6, self.S_FLOOR_EXPLORED_0_g7, self.S_FLOOR_EXPLORED_0_g8,
-                self.S_FLOOR_EXPLORED_0_h6, self.S_FLOOR_EXPLORED_0_h7, self.S_FLOOR_EXPLORED_0_h8,
-                self.S_FLOOR_EXPLORED_0_i6, self.S_FLOOR_EXPLORED_0_i7, self.S_FLOOR_EXPLORED_0_i8),
-            1: (self.S_FLOOR_EXPLORED_1_a1, self.S_FLOOR_EXPLORED_1_b1,
-                self.S_FLOOR_EXPLORED_1_c1, self.S_FLOOR_EXPLORED_1_d1),
-            2: (self.S_FLOOR_EXPLORED_2_e6, self.S_FLOOR_EXPLORED_2_e7, self.S_FLOOR_EXPLORED_2_e8),
-            3: self.S_FLOOR_EXPLORED_3,
-            4: (self.S_FLOOR_EXPLORED_4_a3, self.S_FLOOR_EXPLORED_4_b3,
-                self.S_FLOOR_EXPLORED_4_c3, self.S_FLOOR_EXPLORED_4_d3),
-            5: self.S_FLOOR_EXPLORED_5,
-            6: self.S_FLOOR_EXPLORED_6,
-            7: self.S_FLOOR_EXPLORED_7,
-            8: (self.S_FLOOR_EXPLORED_8_A6, self.S_FLOOR_EXPLORED_8_A7, self.S_FLOOR_EXPLORED_8_A8),
-            9: self.S_FLOOR_EXPLORED_9,
-            10: self.S_FLOOR_EXPLORED_10,
-            11: self.S_FLOOR_EXPLORED_11,
-            12: self.S_FLOOR_EXPLORED_12,
-            13: self.S_FLOOR_EXPLORED_13,
-            14: self.S_FLOOR_EXPLORED_14,
-            15: self.S_FLOOR_EXPLORED_15,
-        }
+def load_sprite(kind, source, args, sheets, image=None):
+    """Loads a single declared sprite (see SPRITES for the meaning of each kind).
+
+    Parameters
+    ----------
+    kind : str
+        How the sprite is made ("animation", "image", "surface", "file", "screen" or "fill").
+    source : str or pygame Color obj
+        The sprite sheet name, the image file path or the fill color (depends on `kind`).
+    args : tuple or None
+        The sprite sheet arguments, or the scale of "file" sprites.
+    sheets : ObjSheetDict
+        The sprite sheets to slice sprites from.
+    image : pygame Surface obj, optional
+        The already decoded image file of a "file" or "screen" sprite.
+
+    Returns
+    -------
+    pygame Surface obj or list
+        The sprite (or list of sprites for "animation" and "image" kinds).
+    """
+    if kind == "animation":
+        return sheets[source].get_animation(*args)
+
+    if kind == "image":
+        return sheets[source].get_image(*args)
+
+    if kind == "surface":
+        return sheets[source].get_image(*args)[0]
+
+    if kind == "file" or kind == "screen":
+        if image is None:
+            image = pygame.image.load(os.path.join("data", "graphics", source))
+        sprite = image.convert()
+        if kind == "screen":
+            args = (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT)
+        if args is not None:
+            sprite = pygame.transform.scale(sprite, args)
+        return sprite
+
+    sprite = pygame.Surface((2, 2))
+    sprite.fill(source)
+    return sprite
+
+
+def placeholder_asset(name):
+    """Returns a stand-in for the sprite or sound effect `name` when its file can't be loaded.
+
+    Sprites are replaced by a magenta surface of the sprite's size (a list of one for the kinds
+    that are lists of sprites) and sound effects by a silent sound.
+
+    Parameters
+    ----------
+    name : str
+        The name of the sprite or sound effect.
+
+    Returns
+    -------
+    pygame Surface obj, list or pygame Sound obj
+        The placeholder.
+    """
+    if name in SOUNDS:
+        return pygame.mixer.Sound(buffer=bytes(4))
+
+    kind, source, args = SPRITES[name]
+    size = (constants.CELL_WIDTH, constants.CELL_HEIGHT)
+    if kind == "screen":
+        size = (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT)
+    elif kind == "file" and args is not None:
+        size = args
+
+    sprite = pygame.Surface(size)
+    sprite.fill(pygame.Color("magenta"))
+
+    return [sprite] if kind in ("animation", "image") else sprite
+
+
+class ObjSheetDict(dict):
+    """A dict of ObjSpriteSheet objects (keyed by SPRITE_SHEETS name) that loads sheets on demand."""
+
+    def __missing__(self, key):
+        sheet = ObjSpriteSheet(*SPRITE_SHEETS[key])
+        self[key] = sheet
+        return sheet
+
+
+class ObjAssetDict(dict):
+    """A dict of assets that loads each entry the first time its key is looked up.
+
+    Once loaded, entries are ordinary dict items, so later lookups cost the same as a plain dict.
+
+    Attributes
+    ----------
+    assets : ObjAssets
+        The asset registry the entries are loaded from.
+    names : dict
+        Maps each key to the asset name (or tuple of asset names) it resolves to.
+    """
+
+    def __init__(self, assets, names):
+        super().__init__()
+        self.assets = assets
+        self.names = names
+
+    def __missing__(self, key):
+        names = self.names[key]
+
+        if isinstance(names, tuple):
+            value = tuple(getattr(self.assets, name) for name in names)
+        else:
+            value = getattr(self.assets, names)
+
+        self[key] = value
+        return value
+
+
+class ObjAssets:
+    """A class which functions like a struct and contains all the assets used in the game.
+
+    Sprite sheets, sprites and sound effects are only declared up front (SPRITE_SHEETS, SPRITES and
+    SOUNDS). Each one is loaded the first time it is accessed as an attribute and kept afterwards,
+    so only the assets that are actually used get loaded (the main menu only needs a handful).
+    Sprites are taken from the pre-baked sprite atlas when there is an up to date one.
+
+    Attributes
+    ----------
+    animation_dict : ObjAssetDict
+        Maps ObjActor animation keys to their sprite lists.
+    wall_dict, wall_explored_dict : ObjAssetDict
+        Map wall numbers to wall tile sprites.
+    floor_dict, floor_explored_dict : ObjAssetDict
+        Map floor numbers to floor tile sprites (or tuples of variations).
+    tile_dict : ObjAssetDict
+        Maps (tile sprite ID * 2) to lit and (tile sprite ID * 2 + 1) to explored tile sprites
+        (see map.tile_sprite_ids).
+    sheets : ObjSheetDict
+        The sprite sheets that have been loaded so far.
+    atlas : ObjAtlas or None
+        The pre-baked sprite atlas (see src/atlas.py), None if it hasn't been built or is stale.
+    sfx_list : list
+        Every sound effect that has been loaded so far.
+    """
+
+    def __init__(self):
+
+        self.sheets = ObjSheetDict()
+        self.atlas = atlas.load_atlas()
+
+        self.animation_dict = ObjAssetDict(self, {name: name for name in ANIMATION_NAMES})
+        self.wall_dict = ObjAssetDict(self, WALL_NAMES)
+        self.wall_explored_dict = ObjAssetDict(self, WALL_EXPLORED_NAMES)
+        self.floor_dict = ObjAssetDict(self, FLOOR_NAMES)
+        self.floor_explored_dict = ObjAssetDict(self, FLOOR_EXPLORED_NAMES)
+        self.tile_dict = ObjAssetDict(self, TILE_SPRITE_NAMES)
+
+        # ---> GUI
+        self.slider_button_size = SPRITES["S_SLIDER_BUTTON"][2]
 
         # =============================== AUDIO ================================== #
 
@@ -569,44 +592,64 @@ class ObjAssets:
         #                          ||| Sound Effects |||
         self.sfx_list = []
 
-        self.sfx_hit_punch1 = self.sfx_add("hit_punch_1.wav")
-        self.sfx_hit_punch2 = self.sfx_add("hit_punch_2.wav")
-        self.sfx_hit_punch3 = self.sfx_add("hit_punch_3.wav")
-        self.sfx_hit_punch4 = self.sfx_add("hit_punch_4.wav")
-        self.sfx_hit_punch5 = self.sfx_add("hit_punch_5.wav")
-
-        self.sfx_click1 = self.sfx_add("click3.wav")
-        self.sfx_rollover = self.sfx_add("rollover1.wav")
-        self.sfx_coin_pickup = self.sfx_add("coin_pickup.wav")
-        self.sfx_soul_consume = self.sfx_add("soul_consume.wav")
-        self.sfx_pure_soul_consume = self.sfx_add("pure_soul_consume.wav")
-        self.sfx_item_pickup = self.sfx_add("item_pickup.wav")
-        self.sfx_level_up = self.sfx_add("glassbell_levelup.wav")
-
-        # sfx list for hitting creature
-        self.sfx_hit_punch_list = [self.sfx_hit_punch1,
-                                   self.sfx_hit_punch2,
-                                   self.sfx_hit_punch3,
-                                   self.sfx_hit_punch4,
-                                   self.sfx_hit_punch5]
-
         # adjust volume according to previous or default setting when first initialized
         self.volume_adjust()
 
-    def sfx_add(self, file_name):
+    def __getattr__(self, name):
+        """Loads a declared asset the first time it is accessed.
+
+        Only called when `name` isn't an instance attribute yet, so every asset is loaded once.
+
+        Parameters
+        ----------
+        name : str
+            The name of the sprite or sound effect.
+
+        Returns
+        -------
+        pygame Surface obj, list or pygame Sound obj
+            The loaded asset.
+        """
+        if name in SPRITES:
+            asset = self.atlas.sprite(name) if self.atlas is not None else None
+            if asset is None:
+                asset = load_sprite(*SPRITES[name], self.sheets)
+        elif name in SOUNDS:
+            asset = self.sfx_add(SOUNDS[name])
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        setattr(self, name, asset)
+        return asset
+
+    @property
+    def sfx_hit_punch_list(self):
+        """list: The sfx list for hitting a creature."""
+        return [self.sfx_hit_punch1,
+                self.sfx_hit_punch2,
+                self.sfx_hit_punch3,
+                self.sfx_hit_punch4,
+                self.sfx_hit_punch5]
+
+    def sfx_add(self, file_name, sound=None):
         """Loads a new sound effect and adds it to the master sfx list.
 
         Parameters
         ----------
         file_name : str
             The name of the desired sound effect's file.
+        sound : pygame Sound obj, optional
+            The already decoded sound effect file.
 
         Returns
         -------
         pygame Sound obj
             The sound effect that was loaded in as a pygame Sound object.
         """
-        new_sfx = pygame.mixer.Sound(os.path.join("data", "audio", "sfx", file_name))
+        new_sfx = sound
+        if new_sfx is None:
+            new_sfx = pygame.mixer.Sound(os.path.join("data", "audio", "sfx", file_name))
+        new_sfx.set_volume(globalvars.PREFERENCES.sfx_volume_val)
         self.sfx_list.append(new_sfx)
 
         return new_sfx
@@ -622,3 +665,187 @@ class ObjAssets:
             sfx.set_volume(globalvars.PREFERENCES.sfx_volume_val)
 
         pygame.mixer.music.set_volume(globalvars.PREFERENCES.music_volume_val)
+
+
+class ObjAssetLoader:
+    """An asset loader object class that loads every asset that isn't loaded yet in the background.
+
+    Decoding image and sound files is done by a pool of worker threads (one per core). Everything
+    that needs the display (converting, slicing and scaling sprites) is done on the main thread by
+    `update`, which is meant to be called once per frame so menus can keep drawing while loading.
+    Each call only does as much of that work as fits in LOADER_FRAME_BUDGET_MS, so that the frames
+    don't hitch. An asset whose file can't be decoded in the background is loaded on demand
+    instead, and replaced by a placeholder (see placeholder_asset) if that fails too.
+
+    Attributes
+    ----------
+    assets : ObjAssets
+        The asset registry that loaded assets are added to.
+    executor : concurrent.futures.ThreadPoolExecutor
+        The worker threads that decode the asset files.
+    jobs : dict
+        Maps each unfinished decode Future to its ("sheet", "sprite" or "sound", name) job.
+    waiting_sprites : dict
+        Maps sprite sheet names to the names of the sprites waiting for that sheet to be decoded.
+    ready_assets : collections.deque
+        Names of assets that can be made as soon as `update` runs (atlas and fill sprites, sprites
+        of decoded sheets and the assets whose file couldn't be decoded in the background).
+    num_jobs : int
+        The total number of decode jobs.
+    """
+
+    def __init__(self, assets):
+        self.assets = assets
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                              thread_name_prefix="asset-loader")
+        self.jobs = {}
+        self.waiting_sprites = {}
+        self.ready_assets = collections.deque()
+
+        loaded = vars(assets)
+
+        for name, (kind, source, args) in SPRITES.items():
+            if name in loaded:
+                continue
+
+            if kind == "fill" or (assets.atlas is not None and name in assets.atlas.rects):
+                self.ready_assets.append(name)
+
+            elif kind == "file" or kind == "screen":
+                self.submit("sprite", name, pygame.image.load,
+                            os.path.join("data", "graphics", source))
+
+            elif source in assets.sheets:
+                self.ready_assets.append(name)
+
+            else:
+                if source not in self.waiting_sprites:
+                    self.waiting_sprites[source] = []
+                    self.submit("sheet", source, pygame.image.load,
+                                os.path.join("data", "graphics", *SPRITE_SHEETS[source]))
+                self.waiting_sprites[source].append(name)
+
+        for name, file_name in SOUNDS.items():
+            if name not in loaded:
+                self.submit("sound", name, pygame.mixer.Sound,
+                            os.path.join("data", "audio", "sfx", file_name))
+
+        self.num_jobs = len(self.jobs)
+
+    @property
+    def progress(self):
+        """float: The fraction (0 to 1) of asset files that have been loaded."""
+        if self.num_jobs == 0:
+            return 1.0
+        return 1 - len(self.jobs) / self.num_jobs
+
+    @property
+    def done(self):
+        """bool: True if every asset has been loaded."""
+        return not self.jobs and not self.ready_assets
+
+    def submit(self, job_type, name, decode_func, file_path):
+        """Queues `file_path` to be decoded by `decode_func` on a worker thread.
+
+        Parameters
+        ----------
+        job_type : str
+            "sheet", "sprite" or "sound".
+        name : str
+            The name of the sprite sheet, sprite or sound effect.
+        decode_func : function
+            The function that decodes the file (pygame.image.load or pygame.mixer.Sound).
+        file_path : str
+            The path of the file to decode.
+
+        Returns
+        -------
+        None
+        """
+        self.jobs[self.executor.submit(decode_func, file_path)] = (job_type, name)
+
+    def update(self, budget_ms=LOADER_FRAME_BUDGET_MS):
+        """Adds the assets whose file has finished decoding to the asset registry.
+
+        Parameters
+        ----------
+        budget_ms : float or None, optional
+            The time in milliseconds the call may spend making assets (at least one asset is made
+            per call), None to make every asset that is ready.
+
+        Returns
+        -------
+        float
+            The loading progress (see `progress`).
+        """
+        deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+
+        for future in [future for future in self.jobs if future.done()]:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+            job_type, name = self.jobs.pop(future)
+            try:
+                decoded = future.result()
+            except (pygame.error, OSError) as error:
+                warnings.warn(f"couldn't decode the {job_type} {name} in the background ({error}), "
+                              f"loading it on demand", RuntimeWarning)
+                decoded = None
+
+            # assets can also be loaded on demand while their file is being decoded
+            if job_type == "sheet":
+                if name not in self.assets.sheets and decoded is not None:
+                    self.assets.sheets[name] = ObjSpriteSheet(*SPRITE_SHEETS[name], image=decoded)
+                self.ready_assets.extend(self.waiting_sprites.pop(name))
+
+            elif name in vars(self.assets):
+                continue
+
+            elif decoded is None:
+                self.ready_assets.append(name)
+
+            elif job_type == "sprite":
+                setattr(self.assets, name, load_sprite(*SPRITES[name], self.assets.sheets,
+                                                       image=decoded))
+
+            else:
+                setattr(self.assets, name, self.assets.sfx_add(SOUNDS[name], sound=decoded))
+
+        while self.ready_assets:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+            name = self.ready_assets.popleft()
+            if name not in vars(self.assets):
+                self.load_on_demand(name)
+
+        if not self.jobs:
+            self.executor.shutdown(wait=False)
+
+        return self.progress
+
+    def load_on_demand(self, name):
+        """Loads the asset `name` on the main thread, falling back to a placeholder if it fails.
+
+        Returns
+        -------
+        None
+        """
+        try:
+            getattr(self.assets, name)
+        except (pygame.error, OSError) as error:
+            warnings.warn(f"couldn't load {name} ({error}), using a placeholder", RuntimeWarning)
+            placeholder = placeholder_asset(name)
+            if name in SOUNDS:
+                placeholder = self.assets.sfx_add(SOUNDS[name], sound=placeholder)
+            setattr(self.assets, name, placeholder)
+
+    def finish(self):
+        """Blocks until every asset is loaded.
+
+        Returns
+        -------
+        None
+        """
+        concurrent.futures.wait(list(self.jobs))
+        self.update(budget_ms=None)
@@ -0,0 +1,293 @@
+import hashlib
+import json
+import mmap
+import os
+import warnings
+
+import pygame
+
+from src import constants, assets
+
+# sprite kinds baked into the atlas ("screen" sprites depend on the window size and "fill" sprites
+# are cheaper to make than to look up)
+ATLAS_KINDS = ("animation", "image", "surface", "file")
+ATLAS_WIDTH = 1024
+PIXEL_FORMAT = "RGBA"
+PIXEL_SIZE = 4
+
+
+class ObjAtlas:
+    """A sprite atlas object class that hands out the sprites stored in the pre-baked atlas.
+
+    Every sprite is a subsurface of one atlas surface, so no sprite needs its own pixel copy.
+
+    Attributes
+    ----------
+    surface : pygame Surface obj
+        The whole atlas (converted to the display pixel format).
+    rects : dict
+        Maps sprite names to the list of (x, y, w, h) rects of their frames in `surface`.
+    """
+
+    def __init__(self, surface, rects):
+        self.surface = surface
+        self.rects = rects
+
+    def sprite(self, name):
+        """Returns the sprite `name` shaped like assets.load_sprite would return it.
+
+        Parameters
+        ----------
+        name : str
+            The sprite name (a key of assets.SPRITES).
+
+        Returns
+        -------
+        pygame Surface obj, list or None
+            The sprite (or list of sprites), or None if the sprite isn't in the atlas.
+        """
+        if name not in self.rects:
+            return None
+
+        frames = [self.surface.subsurface(rect) for rect in self.rects[name]]
+
+        if assets.SPRITES[name][0] in ("surface", "file"):
+            return frames[0]
+        return frames
+
+
+def atlas_specs():
+    """Returns the declared sprites (name -> spec) that are baked into the atlas."""
+    return {name: spec for name, spec in assets.SPRITES.items() if spec[0] in ATLAS_KINDS}
+
+
+def source_files():
+    """Returns the paths of every image file the atlas is made from, sorted."""
+    file_paths = set()
+    for kind, source, args in atlas_specs().values():
+        if kind == "file":
+            file_paths.add(os.path.join("data", "graphics", source))
+        else:
+            file_paths.add(os.path.join("data", "graphics", *assets.SPRITE_SHEETS[source]))
+
+    return sorted(file_paths)
+
+
+def specs_hash():
+    """Returns the SHA-1 hex digest of the atlas sprite declarations.
+
+    Editing a sprite declaration has to invalidate the atlas just like editing an image file.
+    """
+    return hashlib.sha1(repr(sorted(atlas_specs().items())).encode("utf-8")).hexdigest()
+
+
+def file_hash(file_path):
+    """Returns the SHA-1 hex digest of the file `file_path`."""
+    with open(file_path, "rb") as source_file:
+        return hashlib.sha1(source_file.read()).hexdigest()
+
+
+def source_info():
+    """Describes every image file the atlas is made from (see sources_fresh).
+
+    Returns
+    -------
+    dict
+        Maps source file paths to their [size, mtime in nanoseconds, SHA-1 hex digest].
+    """
+    info = {}
+    for file_path in source_files():
+        stat = os.stat(file_path)
+        info[file_path.replace(os.sep, "/")] = [stat.st_size, stat.st_mtime_ns, file_hash(file_path)]
+
+    return info
+
+
+def sources_fresh(sources):
+    """Checks that the image files the atlas was made from haven't changed since.
+
+    Only the size and modification time of every file are compared, a file is only hashed when
+    they differ (eg. after a checkout that touched it without changing it). The size and time of
+    such files are updated in `sources` so they aren't hashed again.
+
+    Parameters
+    ----------
+    sources : dict
+        The "sources" of the atlas index (see source_info).
+
+    Returns
+    -------
+    bool
+        True if every source file is unchanged.
+    bool
+        True if `sources` was updated and should be saved.
+    """
+    file_paths = source_files()
+    if sorted(sources) != [file_path.replace(os.sep, "/") for file_path in file_paths]:
+        return False, False
+
+    updated = False
+    for file_path in file_paths:
+        size, mtime_ns, sha1 = sources[file_path.replace(os.sep, "/")]
+        stat = os.stat(file_path)
+        if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+            continue
+
+        if stat.st_size != size or file_hash(file_path) != sha1:
+            return False, False
+
+        sources[file_path.replace(os.sep, "/")] = [size, stat.st_mtime_ns, sha1]
+        updated = True
+
+    return True, updated
+
+
+def write_index(index):
+    """Writes the atlas index cache file.
+
+    Returns
+    -------
+    None
+    """
+    with open(constants.ATLAS_INDEX_PATH + ".tmp", "w") as index_file:
+        json.dump(index, index_file)
+    os.replace(constants.ATLAS_INDEX_PATH + ".tmp", constants.ATLAS_INDEX_PATH)
+
+
+def discard_atlas():
+    """Deletes the atlas cache files (if there are any).
+
+    Returns
+    -------
+    None
+    """
+    for file_path in (constants.ATLAS_INDEX_PATH, constants.ATLAS_PATH):
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+
+
+def build_atlas():
+    """Slices and scales every atlas sprite and packs them into the atlas and index cache files.
+
+    Sprites are packed tallest first into rows (shelves) of ATLAS_WIDTH pixels. The pixels are
+    stored raw so loading them is a memory map instead of a PNG decode.
+
+    Returns
+    -------
+    dict
+        The atlas index that was written.
+    """
+    sheets = assets.ObjSheetDict()
+    frames = []
+
+    for name, spec in sorted(atlas_specs().items()):
+        sprite = assets.load_sprite(*spec, sheets)
+        for frame_num, frame in enumerate(sprite if isinstance(sprite, list) else [sprite]):
+            frames.append((name, frame_num, frame))
+
+    frames.sort(key=lambda entry: entry[2].get_height(), reverse=True)
+
+    # shelf packing
+    positions = []
+    x, y, shelf_height = 0, 0, 0
+    for name, frame_num, frame in frames:
+        width, height = frame.get_size()
+        if x + width > ATLAS_WIDTH:
+            x, y, shelf_height = 0, y + shelf_height, 0
+
+        positions.append((name, frame_num, frame, (x, y, width, height)))
+        x += width
+        shelf_height = max(shelf_height, height)
+
+    atlas_surface = pygame.Surface((ATLAS_WIDTH, y + shelf_height))
+    rects = {}
+    for name, frame_num, frame, rect in sorted(positions, key=lambda entry: entry[:2]):
+        atlas_surface.blit(frame, rect[:2])
+        rects.setdefault(name, []).append(rect)
+
+    index = {"format_version": constants.ATLAS_FORMAT_VERSION,
+             "size": list(atlas_surface.get_size()),
+             "pixel_format": PIXEL_FORMAT,
+             "specs": specs_hash(),
+             "sources": source_info(),
+             "sprites": rects}
+
+    os.makedirs(constants.ATLAS_DIR, exist_ok=True)
+
+    # the index is written last so it never describes an atlas file that wasn't fully written
+    with open(constants.ATLAS_PATH + ".tmp", "wb") as atlas_file:
+        atlas_file.write(pygame.image.tostring(atlas_surface, PIXEL_FORMAT))
+    os.replace(constants.ATLAS_PATH + ".tmp", constants.ATLAS_PATH)
+
+    write_index(index)
+
+    return index
+
+
+def load_atlas():
+    """Loads the pre-baked sprite atlas if it exists and is up to date with its source files.
+
+    Must be called after the display mode is set (the atlas is converted to the display format).
+
+    Returns
+    -------
+    ObjAtlas or None
+        The atlas, or None if there is no usable atlas (sprites are then sliced from the sheets).
+    """
+    try:
+        with open(constants.ATLAS_INDEX_PATH, "r") as index_file:
+            index = json.load(index_file)
+
+        fresh, updated = False, False
+        if (index["format_version"] == constants.ATLAS_FORMAT_VERSION
+                and index["pixel_format"] == PIXEL_FORMAT
+                and index["specs"] == specs_hash()):
+            fresh, updated = sources_fresh(index["sources"])
+
+        if not fresh:
+            # the stale atlas is deleted so the warning is only given once
+            warnings.warn("the sprite atlas is out of date and was deleted, rebuild it with: "
+                          "python -m src.atlas", RuntimeWarning)
+            discard_atlas()
+            return None
+
+        if updated:
+            try:
+                write_index(index)
+            except OSError:
+                pass
+
+        width, height = index["size"]
+        with open(constants.ATLAS_PATH, "rb") as atlas_file:
+            atlas_map = mmap.mmap(atlas_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    try:
+        if len(atlas_map) != width * height * PIXEL_SIZE:
+            return None
+
+        raw_surface = pygame.image.frombuffer(atlas_map, (width, height), PIXEL_FORMAT)
+        atlas_surface = raw_surface.convert()
+        del raw_surface
+    finally:
+        atlas_map.close()
+
+    rects = {name: [tuple(rect) for rect in frame_rects]
+             for name, frame_rects in index["sprites"].items()}
+
+    return ObjAtlas(atlas_surface, rects)
+
+
+if __name__ == "__main__":
+    # the sprites only need a display to be converted, so no window is opened
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    atlas_index = build_atlas()
+    print(f"Built sprite atlas {constants.ATLAS_PATH} ({atlas_index['size'][0]} x "
+          f"{atlas_index['size'][1]}, {len(atlas_index['sprites'])} sprites)")
@@ -0,0 +1,138 @@
+import copyreg
+import io
+import pickle
+import threading
+
+from src import savefile
+
+
+def pickle_snapshot(snapshot):
+    """Pickles a game snapshot (see game.game_snapshot).
+
+    Every object whose state was copied for the snapshot is pickled with the copied state instead
+    of its live state, the rest of the objects are pickled as they are. The result is the same as
+    pickling the game at the moment the snapshot was taken.
+
+    Parameters
+    ----------
+    snapshot : tuple
+        The (objects to pickle, copied states) snapshot.
+
+    Returns
+    -------
+    bytes
+        The pickled objects.
+    """
+    root, states = snapshot
+
+    def reduce_snapshot(obj):
+        entry = states.get(id(obj))
+        if entry is None or entry[0] is not obj:
+            return obj.__reduce_ex__(pickle.DEFAULT_PROTOCOL)
+
+        return copyreg.__newobj__, (type(obj),), entry[1]
+
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, pickle.DEFAULT_PROTOCOL)
+    pickler.dispatch_table = copyreg.dispatch_table.copy()
+    for obj, state in states.values():
+        pickler.dispatch_table[type(obj)] = reduce_snapshot
+
+    pickler.dump(root)
+    return buffer.getvalue()
+
+
+class ObjSaveWriter:
+    """A save writer object class that pickles and writes game snapshots on a worker thread.
+
+    The expensive part of saving (pickling, gzip compression and disk I/O) is done away from the
+    main loop, which only takes the snapshot (see game.game_snapshot).
+    Only one worker thread exists at a time. If a new snapshot is submitted while a previous one is
+    still being written, the newer snapshot replaces any snapshot still waiting to be written, so
+    the save file always ends up holding the most recent state.
+
+    Attributes
+    ----------
+    _lock : threading.Lock
+        Guards `_pending` and `_thread` between the main thread and the worker.
+    _pending : tuple or None
+        The (slot, header, snapshot) waiting to be written, if any.
+    _thread : threading.Thread or None
+        The worker thread currently writing snapshots.
+    last_error : Exception or None
+        The error raised by the most recent failed write (None if the last write succeeded).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = None
+        self._thread = None
+        self.last_error = None
+
+    @property
+    def busy(self):
+        """bool: True if a snapshot is waiting to be written or is currently being written."""
+        with self._lock:
+            return self._pending is not None or self._thread is not None
+
+    def submit(self, slot, header, snapshot):
+        """Queues a game `snapshot` to be written to the `slot` save file in the background.
+
+        Parameters
+        ----------
+        slot : int
+            The save slot number.
+        header : dict
+            The save file metadata header (see savefile.make_header).
+        snapshot : tuple
+            The game snapshot to pickle (see game.game_snapshot).
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._pending = (slot, header, snapshot)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+                self._thread.start()
+
+    def wait(self):
+        """Blocks until every submitted snapshot has been written to disk.
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            with self._lock:
+                thread = self._thread
+            if thread is None:
+                return
+            thread.join()
+
+    def _run(self):
+        """Worker loop that writes pending snapshots until there are none left.
+
+        Returns
+        -------
+        None
+        """
+        while True:
+            with self._lock:
+                job = self._pending
+                self._pending = None
+
+                if job is None:
+                    self._thread = None
+                    return
+
+            slot, header, snapshot = job
+            try:
+                savefile.write_save(slot, header, pickle_snapshot(snapshot))
+                self.last_error = None
+            except (OSError, TypeError, pickle.PicklingError) as error:
+                self.last_error = error
+                print(f"{type(error).__name__}, couldn't save game: {error}")
+
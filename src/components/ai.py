@@ -1,9 +1,9 @@
 import tcod
 
-from src import constants, globalvars, game
+from src import constants, globalvars, game, slotted
 
 
-class AiConfuse:
+class AiConfuse(slotted.Slotted):
     """Ai component class that makes a creature actor walk in random directions.
 
     Attributes
@@ -14,9 +14,15 @@ class AiConfuse:
         Number of turns before the affected creature's ai is reset to `original_ai`.
     hurt_kin : bool
         True if the creature is allowed to hurt other creatures while confused. Default is True.
+    wake_radius : None
+        Class attribute, the ai acts every turn no matter where the PLAYER is.
 
     """
 
+    __slots__ = ("owner", "original_ai", "num_turns", "hurt_kin")
+
+    wake_radius = None
+
     def __init__(self, original_ai, num_turns):
         self.original_ai = original_ai
         self.num_turns = num_turns
@@ -36,18 +42,27 @@ class AiConfuse:
             self.num_turns -= 1
         else:
             self.owner.ai = self.original_ai
+            globalvars.GAME.current_objects.refresh(self.owner)
             game.game_message(f"{self.owner.display_name} has broken out of its confusion!",
                               constants.COLOR_YELLOW)
 
 
-class AiChase:
+class AiChase(slotted.Slotted):
     """Ai component class that chases the PLAYER and attacks when adjacent to the PLAYER.
 
     Attributes
     ----------
     hurt_kin : bool
         True if the creature is allowed to hurt other creatures when chasing. Default is False.
+    wake_radius : int
+        Class attribute, the distance from the PLAYER within which the ai acts even when it's out
+        of the PLAYER's fov.
     """
+
+    __slots__ = ("owner", "hurt_kin")
+
+    wake_radius = 6
+
     def __init__(self):
         self.hurt_kin = False
 
@@ -62,21 +77,28 @@ class AiChase:
         mob = self.owner
         distance = mob.distance_to(globalvars.PLAYER)
 
-        if tcod.map_is_in_fov(globalvars.FOV_MAP, mob.x, mob.y) or distance <= 6:
+        if tcod.map_is_in_fov(globalvars.FOV_MAP, mob.x, mob.y) or distance <= self.wake_radius:
             if distance >= 2:
                 mob.creature.move_towards(globalvars.PLAYER)
             else:
                 mob.creature.attack(globalvars.PLAYER)
 
 
-class AiFlee:
+class AiFlee(slotted.Slotted):
     """Ai component class that is non-aggressive and moves away from the PLAYER.
 
     Attributes
     ----------
     hurt_kin : bool
         True if the creature is allowed to hurt other creatures when fleeing. Default is False.
+    wake_radius : int
+        Class attribute, the ai only acts in the PLAYER's fov.
     """
+
+    __slots__ = ("owner", "hurt_kin")
+
+    wake_radius = 0
+
     def __init__(self):
         self.hurt_kin = False
 
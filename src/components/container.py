@@ -1,6 +1,15 @@
-class ComContainer:
+import collections
+
+from src import slotted
+
+
+class ComContainer(slotted.Slotted):
     """Container component gives actor objects an inventory that can hold item objects.
 
+    Besides the inventory lists (which keep the order items are displayed in), the container keeps
+    an index of what it holds, so that looking up an item, the number of items of a name or type,
+    or the item in an equipment slot doesn't scan the inventory.
+
     Attributes
     ----------
     inventory : list
@@ -13,17 +22,147 @@ class ComContainer:
         The maximum weight the container can carry (in wu - weight units).
     currently_displayed_item_info : ComItem obj
         The object that is currently displayed on the info menu in the inventory menu.
+    held_items : set
+        Every item object in either inventory list.
+    name_counts : collections.Counter
+        The number of held items of each object name.
+    type_counts : collections.Counter
+        The number of held items of each item type.
+    slot_items : dict
+        Maps each occupied equipment slot to the equipped item in it.
     """
 
+    __slots__ = ("owner", "inventory", "equipped_inventory", "weight", "max_weight",
+                 "currently_displayed_item_info", "held_items", "name_counts", "type_counts",
+                 "slot_items")
+
+    # containers saved before the inventory was indexed get their index built when loaded
+    state_defaults = {"held_items": None}
+
     def __init__(self, weight=0, max_weight=20):
         self.inventory = []
         self.equipped_inventory = []
         self.weight = weight
         self.max_weight = max_weight
         self.currently_displayed_item_info = None
+        self.reindex()
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        if self.held_items is None:
+            self.reindex()
+
+    def __contains__(self, item):
+        return item in self.held_items
 
     @property
     def equipped_items(self):
         """list: Gives a list of all items that are currently equipped on the character."""
-        return [obj for obj in self.inventory if obj.equipment and obj.equipment.equipped is True]
+        return list(self.slot_items.values())
+
+    def reindex(self):
+        """Builds the index of the held items from the inventory lists.
+
+        Returns
+        -------
+        None
+        """
+        held = self.equipped_inventory + self.inventory
+        self.held_items = set(held)
+        self.name_counts = collections.Counter(obj.object_name for obj in held)
+        self.type_counts = collections.Counter(obj.item.item_type for obj in held)
+        self.slot_items = {}
+        for obj in held:
+            if obj.equipment is not None and obj.equipment.equipped:
+                self.slot_items.setdefault(obj.equipment.slot, obj)
+
+    def count_name(self, object_name):
+        """Returns the number of held items named `object_name`."""
+        return self.name_counts[object_name]
+
+    def count_type(self, item_type):
+        """Returns the number of held items of the type `item_type`."""
+        return self.type_counts[item_type]
+
+    def add(self, item):
+        """Puts `item` at the end of the inventory and indexes it.
+
+        An item that is still equipped (dropped while it was equipped) takes its slot back, unless
+        the slot was filled in the meantime, in which case it is unequipped.
+
+        Parameters
+        ----------
+        item : ObjActor
+            The item object to add.
+
+        Returns
+        -------
+        None
+        """
+        self.inventory.append(item)
+        self.held_items.add(item)
+        self.name_counts[item.object_name] += 1
+        self.type_counts[item.item.item_type] += 1
+        item.item.container = self
+
+        if item.equipment is not None and item.equipment.equipped:
+            if self.slot_items.setdefault(item.equipment.slot, item) is not item:
+                item.equipment.equipped = False
+
+    def remove(self, item):
+        """Takes `item` out of whichever inventory list it is in and out of the index.
+
+        Parameters
+        ----------
+        item : ObjActor
+            The held item object to remove.
+
+        Returns
+        -------
+        None
+        """
+        if item.equipment is not None and item in self.equipped_inventory:
+            self.equipped_inventory.remove(item)
+        else:
+            self.inventory.remove(item)
+
+        self.held_items.discard(item)
+        self.name_counts[item.object_name] -= 1
+        self.type_counts[item.item.item_type] -= 1
+        if item.equipment is not None and self.slot_items.get(item.equipment.slot) is item:
+            del self.slot_items[item.equipment.slot]
+
+    def fill_slot(self, item):
+        """Puts the held equipment `item` in its slot, returning False if the slot is taken.
+
+        Parameters
+        ----------
+        item : ObjActor
+            The held item object with an equipment component.
+
+        Returns
+        -------
+        bool
+            True if the item is now in its slot.
+        """
+        return self.slot_items.setdefault(item.equipment.slot, item) is item
+
+    def empty_slot(self, item):
+        """Takes the held equipment `item` out of its slot.
+
+        Returns
+        -------
+        None
+        """
+        if self.slot_items.get(item.equipment.slot) is item:
+            del self.slot_items[item.equipment.slot]
+
+    def move_to_equipped(self, item):
+        """Moves `item` from the inventory list to the end of the equipped inventory list."""
+        self.inventory.remove(item)
+        self.equipped_inventory.append(item)
 
+    def move_to_inventory(self, item):
+        """Moves `item` from the equipped inventory list to the end of the inventory list."""
+        self.equipped_inventory.remove(item)
+        self.inventory.append(item)
@@ -4,11 +4,11 @@ import math
 import pygame
 import tcod
 
-from src import constants, globalvars, game, map, text
+from src import constants, globalvars, game, map, text, slotted, events
 from src.menu import popup
 
 
-class ComCreature:
+class ComCreature(slotted.Slotted):
     """Creature component which give actor objects creature-like properties and functionality.
 
     These creatures contain health and the ability to move and attack, etc.
@@ -33,63 +33,127 @@ class ComCreature:
         Function that the creature executes when its `current_hp` reaches 0 or less.
     dmg_received : int
         The amount of damaged received if this creature was attacked.
-    was_hit : bool
-        True if the creature was hit in the previous turn, regardless of the damage taken (even 0).
     dmg_alpha : int
         Alpha value [0, 255] of the fading damage number display on top of the creature when hit.
     health_bar_alpha : int
         Alpha value [0, 255] of the small health bar display on top of the creature when being hit.
     internal_timer : int
         The number of ticks (total since pygame init) at the moment this creature was hit.
+    effects : tuple
+        The (attack bonus, defence bonus) of every temporary effect on the creature.
+    _stat_totals : tuple or None
+        The cached (attack points, defence) totals, None if they have to be added up again.
     """
 
+    __slots__ = ("owner", "personal_name", "_max_hp", "_base_atk", "crit_chance", "crit_dmg",
+                 "_base_def", "_current_hp", "death_function", "dmg_received", "dmg_alpha",
+                 "health_bar_alpha", "internal_timer", "effects", "_stat_totals")
+
+    # creatures saved before the stat modifiers existed have no effects and no cached totals
+    state_defaults = {"effects": (), "_stat_totals": None}
+
+    # creatures saved before the component table existed kept their stats in public attributes
+    state_renames = {"max_hp": "_max_hp", "base_atk": "_base_atk", "base_def": "_base_def",
+                     "current_hp": "_current_hp"}
+
     def __init__(self, personal_name,
                  max_hp=10,
                  base_atk=2,
                  base_def=0,
                  death_function=None):
 
+        self.owner = None
+        self.effects = ()
+        self._stat_totals = None
         self.personal_name = personal_name
-        self.max_hp = max_hp
+        # there is no owner (and so no component table or event) yet, the setters aren't needed
+        self._max_hp = max_hp
         self.base_atk = base_atk
         self.crit_chance = 5
         self.crit_dmg = 1.5
         self.base_def = base_def
-        self.current_hp = max_hp
+        self._current_hp = max_hp
         self.death_function = death_function
         self.dmg_received = None
-        self.was_hit = False
         self.dmg_alpha = 0
         self.health_bar_alpha = 0
         self.internal_timer = 0
 
+    @property
+    def current_hp(self):
+        """int: Gets the current health points (also written to the component table when set)."""
+        return self._current_hp
+
+    @current_hp.setter
+    def current_hp(self, value):
+        changed = value != self._current_hp
+        self._current_hp = value
+        self._write_table("hp", value)
+        if changed:
+            self._stats_changed()
+
+    @property
+    def max_hp(self):
+        """int: Gets the max health points (also written to the component table when set)."""
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value):
+        changed = value != self._max_hp
+        self._max_hp = value
+        self._write_table("max_hp", value)
+        if changed:
+            self._stats_changed()
+
+    @property
+    def base_atk(self):
+        """int: Gets the base attack points (also written to the component table when set)."""
+        return self._base_atk
+
+    @base_atk.setter
+    def base_atk(self, value):
+        self._base_atk = value
+        self._write_table("atk", value)
+        self.invalidate_stats()
+
+    @property
+    def base_def(self):
+        """int: Gets the base defence points (also written to the component table when set)."""
+        return self._base_def
+
+    @base_def.setter
+    def base_def(self, value):
+        self._base_def = value
+        self._write_table("defence", value)
+        self.invalidate_stats()
+
+    def _write_table(self, column, value):
+        """Writes a stat to the owner's row of the component table it's bound to (if any)."""
+        if self.owner is not None and self.owner.entity_table is not None:
+            getattr(self.owner.entity_table, column)[self.owner.entity_id] = value
+
+    def _stats_changed(self):
+        """Publishes that the owner's health changed if the owner is the PLAYER."""
+        if self.owner is not None and self.owner is globalvars.PLAYER:
+            globalvars.EVENT_BUS.publish(events.StatsChanged(self.owner))
+
     @property
     def power(self):
-        """int: Calculates and returns the current total power of the creature.
+        """int: Returns the current total power of the creature.
 
         Takes into account the creature's attack points (base attack + bonuses) and any
         equipment/item/spell bonuses.
         """
-        total_power = self.attack_points
-
-        return total_power
+        return self.stat_totals[0]
 
     @property
     def defence(self):
-        """int: Calculates and returns the current total defence of the creature.
+        """int: Returns the current total defence of the creature.
 
         Takes into account the base defence of the creature as well as any equipment/item/spell
         bonuses.
         """
-        total_defence = self.base_def
-
-        if self.owner.container:
-            equipment_def_bonuses = [obj.equipment.defence_bonus
-                                     for obj in self.owner.container.equipped_inventory]
-            for def_bonus in equipment_def_bonuses:
-                total_defence += def_bonus
-
-        return total_defence
+        return self.stat_totals[1]
 
     @property
     def hp_percent(self):
@@ -99,14 +163,88 @@ class ComCreature:
     @property
     def attack_points(self):
         """int: Returns the raw attack points of the PLAYER (base stat plus weapon bonuses)"""
-        raw_damage = self.base_atk
-        if self.owner.container:
-            equipment_power_bonuses = [obj.equipment.attack_bonus
-                                       for obj in self.owner.container.equipped_inventory]
-            for power_bonus in equipment_power_bonuses:
-                raw_damage += power_bonus
+        return self.stat_totals[0]
+
+    @property
+    def stat_totals(self):
+        """tuple: Gets the (attack points, defence) totals of the creature.
+
+        The totals are the base stats (which level ups raise) plus every modifier in
+        stat_modifiers(). They are only added up again after invalidate_stats() was called, which
+        happens when the base stats change, equipment is equipped, unequipped, picked up or
+        dropped, or an effect is applied or removed.
+        """
+        if self._stat_totals is None:
+            attack, defence = self.base_atk, self.base_def
+            for attack_bonus, defence_bonus in self.stat_modifiers():
+                attack += attack_bonus
+                defence += defence_bonus
+
+            self._stat_totals = (attack, defence)
+
+        return self._stat_totals
+
+    def stat_modifiers(self):
+        """Returns the (attack bonus, defence bonus) of every equipped item and temporary effect.
+
+        Returns
+        -------
+        list
+            The modifiers, equipment first.
+        """
+        modifiers = []
+        if self.owner is not None and self.owner.container:
+            modifiers += [(obj.equipment.attack_bonus, obj.equipment.defence_bonus)
+                          for obj in self.owner.container.slot_items.values()]
 
-        return raw_damage
+        return modifiers + list(self.effects)
+
+    def invalidate_stats(self):
+        """Makes the stat totals get added up again the next time they are read.
+
+        Returns
+        -------
+        None
+        """
+        self._stat_totals = None
+
+    def apply_effect(self, attack_bonus=0, defence_bonus=0):
+        """Applies a temporary effect that changes the creature's attack points and defence.
+
+        Parameters
+        ----------
+        attack_bonus : int, optional
+            The attack points the effect adds (negative to take away).
+        defence_bonus : int, optional
+            The defence the effect adds (negative to take away).
+
+        Returns
+        -------
+        tuple
+            The effect, to pass to remove_effect() when it wears off.
+        """
+        effect = (attack_bonus, defence_bonus)
+        self.effects += (effect,)
+        self.invalidate_stats()
+
+        return effect
+
+    def remove_effect(self, effect):
+        """Removes a temporary effect that was applied with apply_effect().
+
+        Parameters
+        ----------
+        effect : tuple
+            The effect returned by apply_effect().
+
+        Returns
+        -------
+        None
+        """
+        effects = list(self.effects)
+        effects.remove(effect)
+        self.effects = tuple(effects)
+        self.invalidate_stats()
 
     def level_up(self):
         globalvars.ASSETS.sfx_level_up.play()
@@ -136,7 +274,6 @@ class ComCreature:
         -------
         None
         """
-        self.was_hit = False
         tile_is_wall = globalvars.GAME.current_map[self.owner.x + dx][self.owner.y + dy].block_path
 
         creature_there = map.creature_at_coords(self.owner.x + dx, self.owner.y + dy,
@@ -154,10 +291,7 @@ class ComCreature:
         if not tile_is_wall and creature_there is None:
             self.owner.x += dx
             self.owner.y += dy
-
-            for objActor in globalvars.GAME.current_objects:
-                if objActor.is_visible and objActor.creature:
-                    objActor.creature.was_hit = False
+            globalvars.EVENT_BUS.publish(events.ActorMoved(self.owner, dx, dy))
 
     def move_towards(self, target):
         """Moves this creature one tile closer towards `target`.
@@ -326,9 +460,9 @@ class ComCreature:
         None
 
         """
-        self.was_hit = True
         self.dmg_received = damage
         self.current_hp = max(self.current_hp - damage, 0)
+        globalvars.EVENT_BUS.publish(events.DamageDealt(self.owner, damage))
 
         if self.owner is globalvars.PLAYER:
             msg_color = constants.COLOR_RED
@@ -1,7 +1,7 @@
-from src import constants, globalvars, game
+from src import constants, globalvars, game, slotted, events
 
 
-class ComItem:
+class ComItem(slotted.Slotted):
     """Item component that gives actor objects item-like properties and functionality.
 
     Attributes
@@ -19,6 +19,10 @@ class ComItem:
     container : ComContainer
         The specific container object the item resides in. Initialized to None.
     """
+
+    __slots__ = ("owner", "item_desc", "weight", "item_type", "use_function", "value", "container",
+                 "hover_sound_played")
+
     def __init__(self, item_desc, weight=0,
                  item_type=None,
                  use_function=None,
@@ -66,8 +70,7 @@ class ComItem:
         if actor.container:
             if self.item_type == "Pure Soul":
                 globalvars.ASSETS.sfx_pure_soul_consume.play()
-                actor.container.inventory.append(self.owner)
-                self.container = actor.container
+                actor.container.add(self.owner)
                 self.use()
                 globalvars.GAME.current_objects.remove(self.owner)
                 return
@@ -78,12 +81,15 @@ class ComItem:
             else:
                 globalvars.ASSETS.sfx_item_pickup.play()
                 game.game_message(f"Picked up [{self.owner.display_name}]")
-                actor.container.inventory.append(self.owner)
+                actor.container.add(self.owner)
 
                 self.owner.animation_del()
                 globalvars.GAME.current_objects.remove(self.owner)
 
-                self.container = actor.container
+                if self.owner.equipment is not None:
+                    self.owner.equipment.wielder_stats_changed()
+
+                globalvars.EVENT_BUS.publish(events.ItemPickedUp(self.owner, actor))
 
     def drop(self, new_x, new_y):
         """Drops this item onto the ground specified by the (`new_x`,`new_y`) map-grid coordinates.
@@ -100,25 +106,22 @@ class ComItem:
         None
         """
 
-        # inserting underneath any creature or PLAYER but above any objects already on that tile
-        insert_position = 0
-        for i, obj in enumerate(reversed(globalvars.GAME.current_objects)):
-            if obj.item and obj.x == new_x and obj.y == new_y:
-                insert_position = i
-                break
-
-        globalvars.GAME.current_objects.insert(insert_position, self.owner)
+        # the items layer is drawn underneath any creature or PLAYER, with the newest item on top
+        globalvars.GAME.current_objects.add(self.owner)
 
         self.owner.animation_init()
 
-        if self.owner in self.container.inventory:
-            self.container.inventory.remove(self.owner)
-        elif self.owner in self.container.equipped_inventory:
-            self.container.equipped_inventory.remove(self.owner)
+        if self.owner in self.container:
+            self.container.remove(self.owner)
+
+        if self.owner.equipment is not None:
+            self.owner.equipment.wielder_stats_changed()
 
         self.owner.x, self.owner.y = new_x, new_y
         game.game_message(f"Dropped [{self.owner.display_name}]")
 
+        globalvars.EVENT_BUS.publish(events.ItemDropped(self.owner, self.container.owner))
+
     def use(self):
         """Uses the item to produce an effect and removes it from the inventory.
 
@@ -135,13 +138,11 @@ class ComItem:
 
         if self.use_function:
             used = self.use_function(self.container.owner, self.value)
-            if used:
-                self.container.inventory.remove(self.owner)
-            elif self.item_type == "Pure Soul":
-                self.container.inventory.remove(self.owner)
+            if used or self.item_type == "Pure Soul":
+                self.container.remove(self.owner)
 
 
-class ComEquipment:
+class ComEquipment(slotted.Slotted):
     """Equipment component class that gives item objects extra combat bonuses and statuses.
 
     Attributes
@@ -155,6 +156,9 @@ class ComEquipment:
     equipped : bool
         True if the item is equipped.
     """
+
+    __slots__ = ("owner", "attack_bonus", "defence_bonus", "slot", "equipped")
+
     def __init__(self, attack_bonus=0, defence_bonus=0, slot=None):
 
         self.attack_bonus = attack_bonus
@@ -179,23 +183,20 @@ class ComEquipment:
         """Equips the item and sets the equipped attribute to True.
 
         Checks the slot of the equipment to see if that particular slot is already occupied.
-        If the slot is empty, set equipped attribute to true.
+        If the slot is empty, the item is put in it and the equipped attribute is set to true.
 
         Returns
         -------
         None
         """
-        all_equipped_items = self.owner.item.container.equipped_inventory
-
-        if len(all_equipped_items) > 0:
-            for equipped_item in all_equipped_items:
-                if equipped_item.equipment.slot == self.slot:
-                    game.game_message(f"There is already an item in the {self.slot} slot!",
-                                      constants.COLOR_WHITE)
-                    self.equipped = False
-                    return
+        if not self.owner.item.container.fill_slot(self.owner):
+            game.game_message(f"There is already an item in the {self.slot} slot!",
+                              constants.COLOR_WHITE)
+            self.equipped = False
+            return
 
         self.equipped = True
+        self.wielder_stats_changed()
         game.game_message(f"Equipped [{self.owner.object_name}] in the {self.slot} slot")
 
     def unequip(self):
@@ -206,4 +207,17 @@ class ComEquipment:
         None
         """
         self.equipped = False
+        self.owner.item.container.empty_slot(self.owner)
+        self.wielder_stats_changed()
         game.game_message(f"Unequipped [{self.owner.display_name}]")
+
+    def wielder_stats_changed(self):
+        """Makes the creature holding this equipment add up its stat totals again.
+
+        Returns
+        -------
+        None
+        """
+        container = self.owner.item.container
+        if container is not None and container.owner.creature is not None:
+            container.owner.creature.invalidate_stats()
@@ -1,12 +1,14 @@
-import os
 import datetime
 
 import pygame
 
-from src import constants, globalvars, gui, text
+from src import constants, globalvars, gui, text, savefile, slotted
 
+# the item the PLAYER has to hold for the portals to open
+RELIC_NAME = "MAGIC ROCK"
 
-class ComStairs:
+
+class ComStairs(slotted.Slotted):
     """Stairs component class that gives the actor object properties and functionality of stairs.
 
     Leads PLAYER up a floor (default) or down a floor.
@@ -17,6 +19,8 @@ class ComStairs:
         True if the user (PLAYER) will go up a floor, False if down a floor.
     """
 
+    __slots__ = ("owner", "upwards")
+
     def __init__(self, upwards=True):
         self.upwards = upwards
 
@@ -35,7 +39,7 @@ class ComStairs:
             globalvars.GAME.map_transition_prev()
 
 
-class ComPortal:
+class ComPortal(slotted.Slotted):
     """Portal component class that gives the actor object properties and functionality of a portal.
 
     Attributes
@@ -45,6 +49,9 @@ class ComPortal:
     closed_animation : str
         String that corresponds to an animation dictionary key in ASSETS indicating the portal is closed.
     """
+
+    __slots__ = ("owner", "open_animation", "closed_animation")
+
     def __init__(self):
         self.open_animation = "A_PORTAL_OPEN"
         self.closed_animation = "S_PORTAL_CLOSED"
@@ -52,15 +59,14 @@ class ComPortal:
     def update(self):
         """Updates the status and animation of the portal depending on if the PLAYER has the relic.
 
+        Portals are only updated when the PLAYER picks up or drops the relic (see relic_moved) and
+        when the PLAYER arrives on a floor (see update_portals).
+
         Returns
         -------
         None
         """
-        found_relic = False
-
-        for obj in globalvars.PLAYER.container.inventory:
-            if obj.object_name == "MAGIC ROCK":
-                found_relic = True
+        found_relic = globalvars.PLAYER.container.count_name(RELIC_NAME) > 0
 
         # open the portal if player has relic in their inventory
         if found_relic and self.owner.status != "STATUS_OPEN":
@@ -110,12 +116,9 @@ class ComPortal:
 
                 win_file.write("Deleted any game save files\n")
 
-            # delete save game file if there is one
-            save_to_rm = "data/saves/savegame"
-            try:
-                os.remove(save_to_rm)
-            except OSError:
-                print("No prior save file to delete")
+            # delete save game file if there is one (after any autosave in progress is written)
+            globalvars.SAVE_WRITER.wait()
+            savefile.delete_save(globalvars.GAME.save_slot)
 
             # deinitialize pygame Surface objects (animation sprites)
             for obj in globalvars.GAME.current_objects:
@@ -146,3 +149,38 @@ class ComPortal:
 
                 quit_button.draw()
                 pygame.display.update()
+
+
+def update_portals(event=None):
+    """Opens or closes every portal on the current floor depending on if the PLAYER has the relic.
+
+    Also the event handler of events.FloorChanged.
+
+    Parameters
+    ----------
+    event : events.FloorChanged, optional
+        The floor change that brought the PLAYER to the current floor.
+
+    Returns
+    -------
+    None
+    """
+    for obj in globalvars.GAME.current_objects.portals:
+        obj.portal.update()
+
+
+def relic_moved(event):
+    """Event handler that updates the portals when the PLAYER picks up or drops the relic.
+
+    Parameters
+    ----------
+    event : events.ItemPickedUp or events.ItemDropped
+        The item that was picked up or dropped.
+
+    Returns
+    -------
+    None
+    """
+    if event.item.object_name == RELIC_NAME and event.actor is globalvars.PLAYER:
+        update_portals()
+
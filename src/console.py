@@ -0,0 +1,125 @@
+import pygame
+
+from src import constants, globalvars, text
+
+
+class ObjMessageConsole:
+    """A message console object class that keeps the visible game messages as one cached surface.
+
+    The surface is only rebuilt when game.game_message adds lines, the console is scrolled or a
+    different game is loaded. Only the NUM_MESSAGES lines in view are ever rendered, so the size
+    of the scrollback (GAME.message_history) doesn't affect the cost of drawing the console.
+
+    Attributes
+    ----------
+    surface : pygame Surface obj or None
+        The pre-rendered lines in view (oldest at the top).
+    history : collections.deque or None
+        The message history that `surface` was rendered from.
+    scroll : int
+        The number of lines the console is scrolled back from the most recent message.
+    dirty : bool
+        True if `surface` has to be rebuilt before it is drawn.
+    rect : pygame.Rect obj
+        Where the console was last drawn (used to scroll with the mouse wheel over it).
+    """
+
+    def __init__(self):
+        self.surface = None
+        self.history = None
+        self.scroll = 0
+        self.dirty = True
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    @property
+    def max_scroll(self):
+        """int: The furthest the console can be scrolled back."""
+        return max(len(globalvars.GAME.message_history) - constants.NUM_MESSAGES, 0)
+
+    def invalidate(self, new_lines=0):
+        """Marks the console to be rebuilt after `new_lines` lines were added to the history.
+
+        A console that is scrolled back stays on the same lines instead of jumping to the newest.
+
+        Parameters
+        ----------
+        new_lines : int, optional
+            The number of lines that were added.
+
+        Returns
+        -------
+        None
+        """
+        if self.scroll > 0:
+            self.scroll = min(self.scroll + new_lines, self.max_scroll)
+        self.dirty = True
+
+    def scroll_by(self, lines):
+        """Scrolls the console back (positive `lines`) or forward (negative `lines`).
+
+        Parameters
+        ----------
+        lines : int
+            The number of lines to scroll by.
+
+        Returns
+        -------
+        None
+        """
+        new_scroll = max(0, min(self.scroll + lines, self.max_scroll))
+        if new_scroll != self.scroll:
+            self.scroll = new_scroll
+            self.dirty = True
+
+    def visible_lines(self):
+        """Returns the (message, color) lines in view, oldest first."""
+        history = globalvars.GAME.message_history
+        end = len(history) - self.scroll
+        start = max(end - constants.NUM_MESSAGES, 0)
+
+        # deque indexing is cheap near either end, which is where the view is
+        return [history[i] for i in range(start, end)]
+
+    def rebuild(self):
+        """Renders the lines in view onto a new console surface.
+
+        Returns
+        -------
+        None
+        """
+        font = constants.FONT_BEST
+        text_height = text.get_text_height(font)
+        lines = self.visible_lines()
+        width = max([text.get_text_width(font, message) for message, color in lines] + [1])
+
+        self.surface = pygame.Surface((width, constants.NUM_MESSAGES * text_height),
+                                      pygame.SRCALPHA)
+        for i, (message, color) in enumerate(lines):
+            text.draw_text(self.surface, message, font, (0, i * text_height), color,
+                           constants.COLOR_GAME_BG)
+
+        self.history = globalvars.GAME.message_history
+        self.dirty = False
+
+    def draw(self, surface, coords):
+        """Draws the console onto `surface`, rebuilding it first if it's out of date.
+
+        Parameters
+        ----------
+        surface : pygame Surface obj
+            The surface to draw the console on.
+        coords : tuple
+            The pixel topleft-aligned coordinates of where the console will be drawn.
+
+        Returns
+        -------
+        None
+        """
+        if globalvars.GAME.message_history is not self.history:
+            self.scroll = 0
+            self.dirty = True
+
+        if self.dirty:
+            self.rebuild()
+
+        self.rect = surface.blit(self.surface, coords)
@@ -1,10 +1,5 @@
 import os
 
-import tcod
-import pygame
-
-pygame.init()
-
 # GAME SIZES
 CELL_WIDTH = 32
 CELL_HEIGHT = 32
@@ -12,9 +7,7 @@ CELL_HEIGHT = 32
 CAMERA_WIDTH_DEFAULT = 900
 CAMERA_HEIGHT_DEFAULT = 700
 
-game_info = pygame.display.Info()
-screen_width = game_info.current_w
-screen_height = game_info.current_h
+# screen_width and screen_height (the desktop size) are looked up on first use (see __getattr__)
 
 CAMERA_WIDTH = CAMERA_WIDTH_DEFAULT
 CAMERA_HEIGHT = CAMERA_HEIGHT_DEFAULT
@@ -25,6 +18,22 @@ PLAYER_MAX_LV = 20
 # FPS LIMIT
 GAME_FPS = 60
 
+# SAVES
+SAVE_DIR = os.path.join("data", "saves")
+SAVE_INDEX_PATH = os.path.join(SAVE_DIR, "index.json")
+SAVE_FORMAT_VERSION = 1
+LEGACY_SAVE_PATH = os.path.join(SAVE_DIR, "savegame")
+AUTOSAVE_TURN_INTERVAL = 50
+
+# SPRITE ATLAS CACHE (built with "python -m src.atlas")
+ATLAS_DIR = os.path.join("data", "cache")
+ATLAS_PATH = os.path.join(ATLAS_DIR, "atlas.rgba")
+ATLAS_INDEX_PATH = os.path.join(ATLAS_DIR, "atlas.json")
+ATLAS_FORMAT_VERSION = 2
+
+# FRAME PROFILER DUMPS (see profiler.dump)
+PROFILE_DIR = os.path.join("data", "profiles")
+
 # MAP VARS
 MAP_WIDTH = 90
 MAP_HEIGHT = 70
@@ -39,14 +48,14 @@ ROOM_MAX_WIDTH = 14
 ROOM_MIN_HEIGHT = 6
 ROOM_MIN_WIDTH = 7
 
-# FOV SETTINGS
-FOV_ALG = tcod.FOV_BASIC
+# FOV SETTINGS (FOV_ALG is tcod.FOV_BASIC, see __getattr__)
 FOV_LIGHT_WALLS = True
 TORCH_RADIUS = 6
 
 # MESSAGE DEFAULTS
 NUM_MESSAGES = 8
 MSG_MAX_CHARS = 80
+MSG_HISTORY_LINES = 2000  # lines of scrollback kept in GAME.message_history
 
 
 # Color definitions
@@ -81,22 +90,59 @@ COLOR_BROWN = (213, 178, 171)
 # FONTS
 font_path = os.path.join("data", "fonts")
 
-FONT_DEBUG_MESSAGE2 = pygame.font.Font(os.path.join(font_path, "AppleII.ttf"), 16)
-FONT_GAME_TITLE = pygame.font.Font(os.path.join(font_path, "Future_TimeSplitters.otf"), 60)
-FONT_PLAYER_DEATH = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), 50)
-FONT_VIGA = pygame.font.Font(os.path.join(font_path, "Viga-Regular.ttf"), 16)
+# font name -> (file name in font_path or system font name, size, is system font, underlined)
+# fonts are opened on first use (see __getattr__ and runtime.font)
+FONTS = {
+    "FONT_DEBUG_MESSAGE2": ("AppleII.ttf", 16, False, False),
+    "FONT_GAME_TITLE": ("Future_TimeSplitters.otf", 60, False, False),
+    "FONT_PLAYER_DEATH": ("fixedsys300.ttf", 50, False, False),
+    "FONT_VIGA": ("Viga-Regular.ttf", 16, False, False),
+
+    "FONT_BEST": ("fixedsys300.ttf", 16, False, False),
+    "FONT_BEST_20": ("fixedsys300.ttf", 20, False, False),
+    "FONT_BEST_18": ("fixedsys300.ttf", 18, False, False),
+
+    "FONT_OSRS_BOLD": ("runescape_chat_bold_2.ttf", 16, False, False),
+    "FONT_OSRS_NPC": ("runescape_npc_chat_2.ttf", 20, False, False),
+
+    "FONT_MENU_TITLE": ("fixedsys300.ttf", 20, False, True),
+
+    "FONT_TARGET_X": ("fixedsys300.ttf", CELL_HEIGHT + 10, False, False),
+
+    "FONT_CREDITS": ("arial", 14, True, False),
+    "FONT_CREDIT_LABELS": (os.path.join(font_path, "fixedsys300.ttf"), 20, True, False),
+}
+
+
+def __getattr__(name):
+    """Looks up the constants that need pygame or tcod, so importing constants doesn't load them.
+
+    Each value is stored as a module attribute once it's looked up, so this only runs once per name.
+
+    Parameters
+    ----------
+    name : str
+        The constant name.
 
-FONT_BEST = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), 16)
-FONT_BEST_20 = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), 20)
-FONT_BEST_18 = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), 18)
+    Returns
+    -------
+    pygame Font obj or int
+        The font (see FONTS), the desktop width or height, or the FOV algorithm.
+    """
+    if name in FONTS:
+        from src import runtime
+        value = runtime.font(name)
 
-FONT_OSRS_BOLD = pygame.font.Font(os.path.join(font_path, "runescape_chat_bold_2.ttf"), 16)
-FONT_OSRS_NPC = pygame.font.Font(os.path.join(font_path, "runescape_npc_chat_2.ttf"), 20)
+    elif name == "screen_width" or name == "screen_height":
+        from src import runtime
+        value = runtime.screen_size()[name == "screen_height"]
 
-FONT_MENU_TITLE = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), 20)
-FONT_MENU_TITLE.set_underline(True)
+    elif name == "FOV_ALG":
+        import tcod
+        value = tcod.FOV_BASIC
 
-FONT_TARGET_X = pygame.font.Font(os.path.join(font_path, "fixedsys300.ttf"), CELL_HEIGHT + 10)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
-FONT_CREDITS = pygame.font.SysFont('arial', 14)
-FONT_CREDIT_LABELS = pygame.font.SysFont(os.path.join(font_path, "fixedsys300.ttf"), 20)
+    globals()[name] = value
+    return value
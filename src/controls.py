@@ -0,0 +1,130 @@
+import collections
+
+import pygame
+
+
+def compile_keybindings(keybindings, handlers):
+    """Compiles the keybindings into a table that looks up the handler of a key press at once.
+
+    A keybinding is a (key char, key) tuple, or a (key char, key, shift key) tuple for an action
+    that is only done while shift is held (see data.StructPreferences). An action bound without
+    shift is done whether shift is held or not.
+
+    Parameters
+    ----------
+    keybindings : dict
+        Maps every action name to its keybinding.
+    handlers : dict
+        Maps action names to the function that does the action (actions without one are skipped).
+
+    Returns
+    -------
+    dict
+        Maps (key, shift) pairs to the handler of the action bound to them, where `shift` is True
+        for the actions bound with shift and False for the rest.
+    """
+    dispatch = {}
+
+    for action, binding in keybindings.items():
+        handler = handlers.get(action)
+        if handler is None:
+            continue
+
+        shift = len(binding) == 3 and binding[2] in (pygame.K_LSHIFT, pygame.K_RSHIFT)
+        dispatch[(binding[1], shift)] = handler
+
+    return dispatch
+
+
+def find_handler(dispatch, event):
+    """Returns the handler of the action bound to the key press `event` (None if there is none).
+
+    An action bound with shift wins over an action bound to the same key without it while shift
+    is held.
+    """
+    if event.mod & pygame.KMOD_SHIFT:
+        handler = dispatch.get((event.key, True))
+        if handler is not None:
+            return handler
+
+    return dispatch.get((event.key, False))
+
+
+class ObjInputQueue:
+    """An input queue object class that holds the key presses the game has yet to act on.
+
+    The game acts on one key press that takes a turn per frame, so the key presses that came in
+    after it wait here for the next frames instead of being thrown away. A key that is held down
+    sends a key press every key repeat (see pygame.key.set_repeat); while one of those is still
+    waiting, the next ones are coalesced into it, so a long frame doesn't queue up turns the
+    player never asked for and no press is applied twice.
+
+    Attributes
+    ----------
+    events : collections.deque
+        The KEYDOWN events waiting to be acted on, oldest first.
+    held : set
+        The keys that are held down (pressed and not released yet).
+    waiting : collections.Counter
+        The number of KEYDOWN events of every key in `events`.
+    """
+
+    def __init__(self):
+        self.events = collections.deque()
+        self.held = set()
+        self.waiting = collections.Counter()
+
+    def __len__(self):
+        return len(self.events)
+
+    def push(self, event):
+        """Queues a KEYDOWN event or notes a KEYUP event (other events are ignored).
+
+        Parameters
+        ----------
+        event : pygame Event obj
+            The event to queue.
+
+        Returns
+        -------
+        None
+        """
+        if event.type == pygame.KEYUP:
+            self.held.discard(event.key)
+
+        elif event.type == pygame.KEYDOWN:
+            # a repeat of a held key while its last press is still waiting
+            if event.key in self.held and self.waiting[event.key]:
+                return
+
+            self.held.add(event.key)
+            self.waiting[event.key] += 1
+            self.events.append(event)
+
+    def extend(self, events_list):
+        """Queues every key press in `events_list` (see push)."""
+        for event in events_list:
+            self.push(event)
+
+    def pop(self):
+        """Returns the oldest waiting KEYDOWN event and takes it out of the queue.
+
+        Returns
+        -------
+        pygame Event obj
+        """
+        event = self.events.popleft()
+        self.waiting[event.key] -= 1
+
+        return event
+
+    def clear(self):
+        """Throws away every waiting key press (eg. when a game is started).
+
+        Returns
+        -------
+        None
+        """
+        self.events.clear()
+        self.held.clear()
+        self.waiting.clear()
@@ -3,10 +3,10 @@ import random
 
 import pygame
 
-from src import globalvars
+from src import globalvars, slotted
 
 
-class StructTile:
+class StructTile(slotted.Slotted):
     """A tile object class that tracks the data of a tile (wall/floor) within a map.
 
     Attributes
@@ -23,6 +23,9 @@ class StructTile:
         The index that assigns a random floor tile design accordingly.
     """
 
+    __slots__ = ("block_path", "explored", "wall_assignment", "_floor_assignment",
+                 "floor_rand_index")
+
     def __init__(self, block_path):
         self.block_path = block_path
         self.explored = False
@@ -30,6 +33,18 @@ class StructTile:
         self._floor_assignment = 0
         self.floor_rand_index = 0
 
+    # every floor is saved and loaded with thousands of tiles, so their state is packed directly
+    def __getstate__(self):
+        return StructTile.__slots__, (self.block_path, self.explored, self.wall_assignment,
+                                      self._floor_assignment, self.floor_rand_index)
+
+    def __setstate__(self, state):
+        if type(state) is tuple and state[0] == StructTile.__slots__:
+            (self.block_path, self.explored, self.wall_assignment, self._floor_assignment,
+             self.floor_rand_index) = state[1]
+        else:
+            super().__setstate__(state)
+
     @property
     def floor_assignment(self):
         """int: Gets the floor bit-mask value and assigns a random floor design when set."""
@@ -1,9 +1,8 @@
 import datetime
-import os
 
 import pygame
 
-from src import constants, gui, globalvars, text, game
+from src import constants, gui, globalvars, text, game, savefile
 from src.generators import itemgen
 
 
@@ -44,11 +43,9 @@ def death_player(player):
 
         legacy_file.write("Deleted any previous game save files\n")
 
-    save_to_rm = "data/saves/savegame"
-    try:
-        os.remove(save_to_rm)
-    except OSError:
-        print("No prior save file to delete")
+    # let any autosave still in progress finish first so it can't recreate the file
+    globalvars.SAVE_WRITER.wait()
+    savefile.delete_save(globalvars.GAME.save_slot)
 
     # deinitialize pygame Surface objects (animation sprites)
     for obj in globalvars.GAME.current_objects:
@@ -105,10 +102,11 @@ def death_enemy(mob):
     mob.animation_speed = 1.5
 
     coin_drop = itemgen.gen_coins((mob.x, mob.y), 10)
-    globalvars.GAME.current_objects.insert(0, coin_drop)
+    globalvars.GAME.current_objects.add(coin_drop)
 
     mob.creature = None
     mob.ai = None
+    globalvars.GAME.current_objects.refresh(mob)
 
 
 def death_friendly(mob):
@@ -136,4 +134,5 @@ def death_friendly(mob):
 
     mob.creature = None
     mob.ai = None
+    globalvars.GAME.current_objects.refresh(mob)
 
@@ -1,8 +1,10 @@
 import pygame
-import tcod
 import numpy
 
-from src import constants, globalvars, text, hud
+from src import constants, globalvars, text, hud, map, profiler, animclock, gui
+
+# the creatures whose damage number is fading (actor -> None), added when they are hit in view
+damage_floats = {}
 
 
 def draw_game():
@@ -28,7 +30,8 @@ def draw_game():
 
     globalvars.SURFACE_MAIN.blit(globalvars.SURFACE_MAP, (0, 0), globalvars.CAMERA.rectangle)
 
-    draw_window_ui()
+    with profiler.scope("draw_window_ui"):
+        draw_window_ui()
 
 
 def draw_map(target_map):
@@ -46,6 +49,8 @@ def draw_map(target_map):
     None
     """
 
+    animclock.begin_frame()
+
     # render only the visible portion of the map
     cam_grid_x, cam_grid_y = globalvars.CAMERA.map_address
 
@@ -67,62 +72,78 @@ def draw_map(target_map):
     if render_max_y > constants.MAP_HEIGHT:
         render_max_y = constants.MAP_HEIGHT
 
-    # draw floor and walls
-    for x in range(render_min_x, render_max_x):
-        for y in range(render_min_y, render_max_y):
-
-            wall_num = target_map[x][y].wall_assignment
-            floor_num = target_map[x][y].floor_assignment
-
-            is_visible = tcod.map_is_in_fov(globalvars.FOV_MAP, x, y)
-            index = target_map[x][y].floor_rand_index
-            if is_visible:
-                target_map[x][y].explored = True
-
-                if target_map[x][y].block_path is True:
-                    globalvars.SURFACE_MAP.blit(
-                        globalvars.ASSETS.wall_dict[wall_num],
-                        (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
-
-                else:
-                    if floor_num in (0, 1, 2, 4, 8):
-                        globalvars.SURFACE_MAP.blit(
-                            globalvars.ASSETS.floor_dict[floor_num][index],
-                            (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
-                    else:
-                        globalvars.SURFACE_MAP.blit(
-                            globalvars.ASSETS.floor_dict[floor_num],
-                            (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
-            else:
-                if target_map[x][y].explored:
-
-                    if target_map[x][y].block_path is True:
-                        globalvars.SURFACE_MAP.blit(
-                            globalvars.ASSETS.wall_explored_dict[wall_num],
-                            (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
-
-                    else:
-                        if floor_num in (0, 1, 2, 4, 8):
-                            globalvars.SURFACE_MAP.blit(
-                                globalvars.ASSETS.floor_explored_dict[floor_num][index],
-                                (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
-                        else:
-                            globalvars.SURFACE_MAP.blit(
-                                globalvars.ASSETS.floor_explored_dict[floor_num],
-                                (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
+    # draw floor and walls: the lit or explored sprite of every tile in view or explored, in one
+    # batched blit (tile_dict holds lit sprites at even and explored sprites at odd keys)
+    with profiler.scope("map tiles"):
+        sprite_ids, explored = map.floor_arrays(target_map)
+        window = (slice(render_min_x, render_max_x), slice(render_min_y, render_max_y))
+
+        is_visible = globalvars.FOV_MAP.fov.T[window]
+        tile_x, tile_y = numpy.nonzero(is_visible | explored[window])
+        sprite_keys = sprite_ids[window][tile_x, tile_y] * 2 + ~is_visible[tile_x, tile_y]
+
+        tile_dict = globalvars.ASSETS.tile_dict
+        globalvars.SURFACE_MAP.blits(
+            [(tile_dict[key], (x * constants.CELL_WIDTH, y * constants.CELL_HEIGHT))
+             for key, x, y in zip(sprite_keys.tolist(), (tile_x + render_min_x).tolist(),
+                                  (tile_y + render_min_y).tolist())],
+            doreturn=False)
 
     # draw all objects onto the map
-    for obj in globalvars.GAME.current_objects:
-        obj.draw(globalvars.SURFACE_MAP)
+    with profiler.scope("map actors"):
+        for obj in globalvars.GAME.current_objects:
+            obj.draw(globalvars.SURFACE_MAP)
 
     # draw little health bar ui and damage taken values on visible mobs
-    for objActor in globalvars.GAME.current_objects:
-        if objActor.is_visible and objActor.creature:
-            if objActor is not globalvars.PLAYER:
+    with profiler.scope("map health bars"):
+        for objActor in globalvars.GAME.current_objects.creatures:
+            if objActor.is_visible and objActor is not globalvars.PLAYER:
                 objActor.creature.draw_health()
 
-            if objActor.creature.dmg_alpha > 0:
-                objActor.creature.draw_damage_taken()
+        draw_damage_floats()
+
+
+def draw_damage_floats():
+    """Draws the fading damage numbers of the creatures in view that were hit recently.
+
+    Creatures are dropped from damage_floats once their number has faded out, they died or they
+    are no longer on the current floor.
+
+    Returns
+    -------
+    None
+    """
+    for obj in list(damage_floats):
+        if obj.creature is None or obj.creature.dmg_alpha <= 0 \
+                or obj not in globalvars.GAME.current_objects:
+            del damage_floats[obj]
+
+        elif obj.is_visible:
+            obj.creature.draw_damage_taken()
+
+
+def damage_dealt(event):
+    """Event handler that starts the damage number and health bar fades of a creature hit in view.
+
+    Parameters
+    ----------
+    event : events.DamageDealt
+        The damage that was dealt.
+
+    Returns
+    -------
+    None
+    """
+    target = event.target
+    if not target.is_visible:
+        return
+
+    if target is not globalvars.PLAYER:
+        target.creature.internal_timer = pygame.time.get_ticks()
+        target.creature.health_bar_alpha = 255
+
+    target.creature.dmg_alpha = 255
+    damage_floats[target] = None
 
 
 def draw_window_ui():
@@ -151,12 +172,10 @@ def draw_window_ui():
     text.draw_text(globalvars.SURFACE_MAIN, floor_text,
                    floor_font, (floor_x, 0), pygame.Color('aquamarine1'))
 
-    # draw PLAYER health bar, pfp, and level
-    hud.draw_player_health(globalvars.SURFACE_MAIN, (68, 0), globalvars.PLAYER.creature.hp_percent)
-    hud.draw_player_exp(globalvars.SURFACE_MAIN, (68, 27))
-    hud.pfp(globalvars.SURFACE_MAIN, (0, 0))
-    hud.level_sign(globalvars.SURFACE_MAIN, (0, 66))
-    hud.draw_mini_map(globalvars.GAME.current_map)
+    # draw PLAYER health bar, exp bar, pfp, and level (only re-rendered when they change)
+    globalvars.HUD_LAYER.draw(globalvars.SURFACE_MAIN)
+    with profiler.scope("draw_mini_map"):
+        hud.draw_mini_map(globalvars.GAME.current_map)
 
     # draw PLAYER messages
     hud.draw_messages()
@@ -233,11 +252,11 @@ def fade_to_solid(width, height, redraw_func, redraw_args, color=pygame.Color('b
 
 
 def draw_button_update_cursor(buttons):
-    pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+    gui.set_cursor(pygame.cursors.tri_left)
     for button in buttons:
         button.draw()
         if button.mouse_hover:
-            pygame.mouse.set_cursor(*pygame.cursors.diamond)
+            gui.set_cursor(pygame.cursors.diamond)
 
 
 def draw_menu_background(surface, menu_wh, top_l, top_r, bot_l, bot_r, assets=None):
@@ -0,0 +1,458 @@
+import numpy
+
+from src import globalvars, shapes
+
+# render layers, drawn from the bottom (first) to the top (last)
+LAYER_STRUCTURES = 0
+LAYER_ITEMS = 1
+LAYER_CORPSES = 2
+LAYER_CREATURES = 3
+LAYER_PLAYER = 4
+NUM_LAYERS = 5
+
+# the components that the store keeps a view of (every actor that has that component)
+VIEW_COMPONENTS = ("creature", "ai", "portal", "stairs")
+
+# item types of the souls that dead mobs leave behind
+CORPSE_ITEM_TYPES = ("Red Soul", "Pure Soul")
+
+# number of rows a component table starts with (it doubles whenever it runs out)
+TABLE_START_ROWS = 64
+
+# the ComCreature stats mirrored by the component table (table array name -> creature attribute)
+CREATURE_STATS = {"hp": "current_hp", "max_hp": "max_hp", "atk": "base_atk", "defence": "base_def"}
+
+
+def layer_of(obj):
+    """Returns the render layer that an actor belongs on, going by its components.
+
+    Parameters
+    ----------
+    obj : ObjActor obj
+        The actor to place.
+
+    Returns
+    -------
+    int
+        One of the LAYER_* constants.
+    """
+    if obj is globalvars.PLAYER:
+        return LAYER_PLAYER
+    if obj.creature is not None:
+        return LAYER_CREATURES
+    if obj.item is not None and obj.item.item_type in CORPSE_ITEM_TYPES:
+        return LAYER_CORPSES
+    if obj.item is not None:
+        return LAYER_ITEMS
+    return LAYER_STRUCTURES
+
+
+class ObjComponentTable:
+    """A component table object class that keeps the fields of an entity store in NumPy arrays.
+
+    Every actor added to the store gets a row (its entity ID), in the order the actors were added.
+    The row holds the actor's position, its creature stats and its AI state, so questions about the
+    whole floor (which creatures are in a radius, which AI can act this turn) are answered by
+    vectorized operations instead of a Python loop over the actors.
+
+    The actors stay the owners of their values. ObjActor.x/y and the ComCreature stats are
+    properties that write through to the row of the table the actor is bound to (see
+    ObjActor.entity_table), so reading them is still a plain attribute lookup.
+
+    Attributes
+    ----------
+    actors : list
+        The actor in every row (None for rows that were freed).
+    count : int
+        The number of rows in use.
+    x, y : numpy array
+        The map-grid coordinates of every row.
+    hp, max_hp, atk, defence : numpy array
+        The current hp, max hp, base attack and base defence of every row with a creature.
+    creature : numpy array
+        True for every row whose actor has a creature component.
+    ai : numpy array
+        True for every row whose actor has an ai component.
+    wake_radius : numpy array
+        The wake radius of the ai of every row (see the ai classes, inf for ai that always act).
+    """
+
+    def __init__(self):
+        self.actors = []
+        self.count = 0
+
+        self.x = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.y = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.hp = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.max_hp = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.atk = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.defence = numpy.zeros(TABLE_START_ROWS, dtype=numpy.int32)
+        self.creature = numpy.zeros(TABLE_START_ROWS, dtype=bool)
+        self.ai = numpy.zeros(TABLE_START_ROWS, dtype=bool)
+        self.wake_radius = numpy.zeros(TABLE_START_ROWS, dtype=numpy.float32)
+
+    @property
+    def arrays(self):
+        """dict: Every per row array (array name -> array)."""
+        return {"x": self.x, "y": self.y, "hp": self.hp, "max_hp": self.max_hp, "atk": self.atk,
+                "defence": self.defence, "creature": self.creature, "ai": self.ai,
+                "wake_radius": self.wake_radius}
+
+    def insert(self, obj):
+        """Gives an actor the next row and binds it to this table.
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor to insert.
+
+        Returns
+        -------
+        None
+        """
+        if len(self.actors) == len(self.x):
+            # rather than growing, close the gaps when at least half of the rows were freed
+            if self.count <= len(self.actors) // 2:
+                self.compact()
+            else:
+                for name, array in self.arrays.items():
+                    setattr(self, name, numpy.concatenate((array, numpy.zeros_like(array))))
+
+        self.actors.append(obj)
+        self.count += 1
+        self.update(obj, len(self.actors) - 1)
+
+    def delete(self, obj):
+        """Frees the row of an actor (and unbinds the actor if it's bound to this table).
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor to delete.
+
+        Returns
+        -------
+        None
+        """
+        row = self.row_of(obj)
+        self.actors[row] = None
+        self.count -= 1
+        self.creature[row] = False
+        self.ai[row] = False
+
+        if obj.entity_table is self:
+            obj.entity_table = None
+            obj.entity_id = None
+
+    def row_of(self, obj):
+        """Returns the row of an actor in this table."""
+        if obj.entity_table is self:
+            return obj.entity_id
+
+        # actors that are in several floors (the PLAYER) are only bound to one table at a time
+        return self.actors.index(obj)
+
+    def update(self, obj, row=None):
+        """Binds an actor to this table and writes all of its fields to its row again.
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor to update (eg. after it died or its ai changed).
+        row : int, optional
+            The row of the actor if it's already known.
+
+        Returns
+        -------
+        None
+        """
+        if row is None:
+            row = self.row_of(obj)
+
+        obj.entity_table = self
+        obj.entity_id = row
+
+        self.x[row] = obj.x
+        self.y[row] = obj.y
+
+        self.creature[row] = obj.creature is not None
+        if obj.creature is not None:
+            for name, attribute in CREATURE_STATS.items():
+                getattr(self, name)[row] = getattr(obj.creature, attribute)
+
+        self.ai[row] = obj.ai is not None
+        if obj.ai is not None:
+            wake_radius = obj.ai.wake_radius
+            self.wake_radius[row] = numpy.inf if wake_radius is None else wake_radius
+
+    def compact(self):
+        """Closes the gaps left by freed rows, keeping the rows in the same order.
+
+        Returns
+        -------
+        None
+        """
+        rows = [row for row, obj in enumerate(self.actors) if obj is not None]
+        for name, array in self.arrays.items():
+            compacted = numpy.zeros_like(array)
+            compacted[:len(rows)] = array[rows]
+            setattr(self, name, compacted)
+
+        self.actors = [self.actors[row] for row in rows]
+        for row, obj in enumerate(self.actors):
+            if obj.entity_table is self:
+                obj.entity_id = row
+
+    def creature_rows(self):
+        """Returns the rows in use of every creature (in row order)."""
+        rows = len(self.actors)
+        return numpy.flatnonzero(self.creature[:rows])
+
+    def in_radius(self, center_coords, radius, shape=shapes.SHAPE_SQUARE, direction=None):
+        """Returns the rows of the creatures within the area of map.tiles_in_radius.
+
+        Parameters
+        ----------
+        center_coords : tuple
+            The center map-grid coordinates of the area.
+        radius : int
+            The radius of the area.
+        shape : str, optional
+            The shape of the area, one of shapes.SHAPES.
+        direction : tuple, optional
+            The (dx, dy) direction a cone points in (only for shapes.SHAPE_CONE).
+
+        Returns
+        -------
+        numpy array
+            The rows, in row order.
+        """
+        rows = self.creature_rows()
+        dx = self.x[rows] - center_coords[0]
+        dy = self.y[rows] - center_coords[1]
+
+        return rows[shapes.in_area(dx, dy, radius, shape, direction)]
+
+    def turn_rows(self, player, fov):
+        """Returns the rows of the ai that take a turn when the creatures take their turns.
+
+        Parameters
+        ----------
+        player : ObjActor obj
+            The PLAYER (whose position wakes up the ai around it).
+        fov : numpy array
+            True for every tile in the PLAYER's fov (indexed [y, x] like the tcod FOV map).
+
+        Returns
+        -------
+        numpy array
+            The rows of every ai that is awake (in the fov or within its wake radius of the
+            PLAYER), in row order.
+        """
+        rows = self.creature_rows()
+        x, y = self.x[rows], self.y[rows]
+
+        distance = numpy.hypot(x - player.x, y - player.y)
+        visit = self.ai[rows] & (fov[y, x] | (distance <= self.wake_radius[rows]))
+
+        return rows[visit]
+
+
+class ObjEntityStore:
+    """An entity store object class that holds every actor on a floor (GAME.current_objects).
+
+    Actors are kept in one insertion ordered dict per render layer with the actor itself as the
+    handle, so adding and removing an actor is O(1) no matter how crowded the floor is. Iterating
+    the store yields every actor in draw order (by layer, then in the order they were added).
+    The store also keeps a view per component in VIEW_COMPONENTS so that the game loop, the map
+    and the mini map only visit the actors they actually care about, and a component table (see
+    ObjComponentTable) for the queries that would otherwise have to look at every actor.
+
+    Attributes
+    ----------
+    layers : list
+        One dict (actor -> None) per render layer, bottom layer first.
+    layer_index : dict
+        Maps every actor in the store to the layer it's in.
+    views : dict
+        Maps every component name in VIEW_COMPONENTS to a dict (actor -> None) of the actors in
+        the store that currently have that component.
+    table : ObjComponentTable obj
+        The positions, creature stats and ai state of the actors in the store.
+    """
+
+    def __init__(self, objects=()):
+        self.layers = [{} for _ in range(NUM_LAYERS)]
+        self.layer_index = {}
+        self.views = {component: {} for component in VIEW_COMPONENTS}
+        self.table = ObjComponentTable()
+
+        for obj in objects:
+            self.add(obj)
+
+    def __iter__(self):
+        for layer in self.layers:
+            yield from layer
+
+    def __len__(self):
+        return len(self.layer_index)
+
+    def __contains__(self, obj):
+        return obj in self.layer_index
+
+    @property
+    def creatures(self):
+        """dict_keys: Every actor with a creature component (including the PLAYER)."""
+        return self.views["creature"].keys()
+
+    @property
+    def ai_actors(self):
+        """dict_keys: Every actor with an ai component."""
+        return self.views["ai"].keys()
+
+    @property
+    def portals(self):
+        """dict_keys: Every actor with a portal component."""
+        return self.views["portal"].keys()
+
+    @property
+    def stairs(self):
+        """dict_keys: Every actor with a stairs component."""
+        return self.views["stairs"].keys()
+
+    def add(self, obj, layer=None):
+        """Adds an actor on top of the other actors in its layer.
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor to add (adding an actor that is already in the store does nothing).
+        layer : int, optional
+            The LAYER_* constant of the layer to add to (worked out from the components if None).
+
+        Returns
+        -------
+        None
+        """
+        if obj in self.layer_index:
+            return
+
+        if layer is None:
+            layer = layer_of(obj)
+
+        self.layers[layer][obj] = None
+        self.layer_index[obj] = layer
+        self._index_components(obj)
+        self.table.insert(obj)
+
+    def remove(self, obj):
+        """Removes an actor from the store.
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor to remove.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the actor is not in the store.
+        """
+        layer = self.layer_index.pop(obj, None)
+        if layer is None:
+            raise ValueError(f"{obj.object_name} is not in the entity store")
+
+        del self.layers[layer][obj]
+        for view in self.views.values():
+            view.pop(obj, None)
+        self.table.delete(obj)
+
+    def refresh(self, obj):
+        """Moves an actor whose components changed (eg. a mob that died) to its new layer and views.
+
+        Also binds the actor to the store's component table again, which is how the PLAYER's
+        position and stats follow it to the floor it moved to.
+
+        Parameters
+        ----------
+        obj : ObjActor obj
+            The actor that changed.
+
+        Returns
+        -------
+        None
+        """
+        layer = layer_of(obj)
+        if self.layer_index[obj] != layer:
+            del self.layers[self.layer_index[obj]][obj]
+            self.layers[layer][obj] = None
+            self.layer_index[obj] = layer
+
+        self._index_components(obj)
+        self.table.update(obj)
+
+    def clear(self):
+        """Removes every actor from the store.
+
+        Returns
+        -------
+        None
+        """
+        for layer in self.layers:
+            layer.clear()
+        self.layer_index.clear()
+        for view in self.views.values():
+            view.clear()
+
+        for obj in self.table.actors:
+            if obj is not None and obj.entity_table is self.table:
+                obj.entity_table = None
+                obj.entity_id = None
+        self.table = ObjComponentTable()
+
+    def creatures_in_radius(self, center_coords, radius, shape=shapes.SHAPE_SQUARE,
+                            direction=None):
+        """Returns every creature within the area of map.tiles_in_radius.
+
+        Parameters
+        ----------
+        center_coords : tuple
+            The center map-grid coordinates of the area.
+        radius : int
+            The radius of the area.
+        shape : str, optional
+            The shape of the area, one of shapes.SHAPES.
+        direction : tuple, optional
+            The (dx, dy) direction a cone points in (only for shapes.SHAPE_CONE).
+
+        Returns
+        -------
+        list
+            The creatures, in the order they were added to the store.
+        """
+        rows = self.table.in_radius(center_coords, radius, shape, direction)
+        return [self.table.actors[row] for row in rows]
+
+    def turn_takers(self):
+        """Returns the creatures that take a turn when creatures take their turns.
+
+        Returns
+        -------
+        list
+            Every creature whose ai is awake (see ObjComponentTable.turn_rows), in the order they
+            were added to the store.
+        """
+        rows = self.table.turn_rows(globalvars.PLAYER, globalvars.FOV_MAP.fov)
+        return [self.table.actors[row] for row in rows]
+
+    def _index_components(self, obj):
+        """Adds the actor to the views of the components it has and takes it out of the rest."""
+        for component, view in self.views.items():
+            if getattr(obj, component) is not None:
+                view[obj] = None
+            else:
+                view.pop(obj, None)
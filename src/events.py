@@ -0,0 +1,93 @@
+import collections
+
+# the events of the game that other parts of the game react to, published through the event bus
+# (see ObjEventBus) by whatever made the change
+
+# a creature (`target`) had `damage` applied to its health
+DamageDealt = collections.namedtuple("DamageDealt", ("target", "damage"))
+
+# an actor moved by (`dx`, `dy`) tiles
+ActorMoved = collections.namedtuple("ActorMoved", ("actor", "dx", "dy"))
+
+# `actor` picked up or dropped the item actor `item`
+ItemPickedUp = collections.namedtuple("ItemPickedUp", ("item", "actor"))
+ItemDropped = collections.namedtuple("ItemDropped", ("item", "actor"))
+
+# the PLAYER arrived on the floor `floor` (also published when a game is started or loaded)
+FloorChanged = collections.namedtuple("FloorChanged", ("floor",))
+
+# the status of `actor` was set to `status` (eg. STATUS_DEAD)
+StatusChanged = collections.namedtuple("StatusChanged", ("actor", "status"))
+
+# the health, max health, exp or level of `actor` (the PLAYER) changed
+StatsChanged = collections.namedtuple("StatsChanged", ("actor",))
+
+EVENT_TYPES = (DamageDealt, ActorMoved, ItemPickedUp, ItemDropped, FloorChanged, StatusChanged,
+               StatsChanged)
+
+
+class ObjEventBus:
+    """An event bus object class that passes game events on to the handlers subscribed to them.
+
+    Events are delivered synchronously: publish() calls every handler of the event's type, in the
+    order they subscribed, before it returns. The game reacts to what happened when it happens,
+    instead of checking every object every frame for something that might have changed.
+
+    Attributes
+    ----------
+    subscribers : dict
+        Maps every event type in EVENT_TYPES to the list of handlers subscribed to it.
+    """
+
+    def __init__(self):
+        self.subscribers = {event_type: [] for event_type in EVENT_TYPES}
+
+    def subscribe(self, event_type, handler):
+        """Calls `handler` with every event of `event_type` that is published from now on.
+
+        Parameters
+        ----------
+        event_type : type
+            One of the event types in EVENT_TYPES.
+        handler : function
+            A function that takes the event as its only argument.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If `event_type` is not an event type of the game.
+        """
+        if event_type not in self.subscribers:
+            raise ValueError(f"{event_type!r} is not an event type")
+
+        if handler not in self.subscribers[event_type]:
+            self.subscribers[event_type].append(handler)
+
+    def unsubscribe(self, event_type, handler):
+        """Stops calling `handler` with the events of `event_type` (if it was subscribed).
+
+        Returns
+        -------
+        None
+        """
+        if handler in self.subscribers.get(event_type, ()):
+            self.subscribers[event_type].remove(handler)
+
+    def publish(self, event):
+        """Calls every handler subscribed to the type of `event` with it.
+
+        Parameters
+        ----------
+        event : namedtuple
+            An event of one of the types in EVENT_TYPES.
+
+        Returns
+        -------
+        None
+        """
+        for handler in self.subscribers[type(event)]:
+            handler(event)
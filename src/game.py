@@ -1,13 +1,19 @@
+import collections
+import copy
 import gzip
+import os
 import pickle
 import sys
 import textwrap
+import zlib
 
 import pygame
 
-from src import constants, globalvars, map, draw, actions, hud
+from src import constants, globalvars, map, draw, actions, hud, savefile, profiler, entities, \
+    events, controls, slotted, gui
 from src.menu import inventory, options, popup, mainmenu
 from src.generators import playergen
+from src.components import structure, container
 
 
 class ObjGame:
@@ -17,10 +23,10 @@ class ObjGame:
 
      Attributes
     ----------
-    current_objects : list
-        List of objects on the current map (excluding inventory objects).
-    message_history : list
-        List of messages that have been displayed on the game screen.
+    current_objects : ObjEntityStore obj
+        The objects on the current map (excluding inventory objects), see entities.ObjEntityStore.
+    message_history : collections.deque
+        The most recent (constants.MSG_HISTORY_LINES) lines of messages displayed on the game screen.
     maps_next : list of tuples
         List of map data for encountered maps, where maps are saved to before transitioning to a lower floor.
     maps_prev : list of tuples
@@ -35,24 +41,27 @@ class ObjGame:
         The max floor number the PLAYER has reached.
     floor_transition_alpha : int
         The alpha value [0, 255], that is used to fade out the floor title text when entering a new floor.
-    from_main_menu : bool
-        Tracks if the PLAYER has just started a game from the main menu.
     hover_sound_played : bool
         True if the hover audio has already played once when cursor is hovering over the player pfp.
         (check hud.update_pfp)
+    turn_count : int
+        The number of turns the PLAYER has taken in this game (used to schedule autosaves).
+    save_slot : int
+        The save slot number this game is saved to (assigned when the game is created).
 
     """
     def __init__(self):
-        self.current_objects = []
-        self.message_history = []
+        self.current_objects = entities.ObjEntityStore()
+        self.message_history = collections.deque(maxlen=constants.MSG_HISTORY_LINES)
         self.maps_next = []
         self.maps_prev = []
         self.current_map, self.current_rooms = map.map_create()
         self.cur_floor = 1
         self.max_floor_reached = 1
         self.floor_transition_alpha = 0
-        self.from_main_menu = True
         self.hover_sound_played = False
+        self.turn_count = 0
+        self.save_slot = None
 
     def map_transition_next(self):
         """Transitions the PLAYER to a higher floor map when using stairs that go upwards.
@@ -65,6 +74,9 @@ class ObjGame:
 
         """
 
+        # the floors kept in maps_prev/maps_next are pickled live by the autosave in progress
+        globalvars.SAVE_WRITER.wait()
+
         globalvars.FOV_CALCULATE = True
         for obj in self.current_objects:
             obj.animation_del()
@@ -83,7 +95,7 @@ class ObjGame:
         if len(self.maps_next) == 0:
 
             # erase all items from previous map except the PLAYER
-            self.current_objects = [globalvars.PLAYER]
+            self.current_objects = entities.ObjEntityStore([globalvars.PLAYER])
             globalvars.PLAYER.animation_init()
 
             self.current_map, self.current_rooms = map.map_create()
@@ -94,6 +106,7 @@ class ObjGame:
 
             (globalvars.PLAYER.x, globalvars.PLAYER.y,
              self.current_map, self.current_rooms, self.current_objects) = self.maps_next[-1]
+            self.current_objects.refresh(globalvars.PLAYER)
 
             for obj in self.current_objects:
                 obj.animation_init()
@@ -105,6 +118,7 @@ class ObjGame:
             del self.maps_next[-1]
 
         game_message(f"{globalvars.PLAYER.display_name} moved up a floor!", constants.COLOR_BLUE)
+        globalvars.EVENT_BUS.publish(events.FloorChanged(self.cur_floor))
 
     def map_transition_prev(self):
         """Transitions the PLAYER to a lower floor map when using stairs that go downwards.
@@ -117,6 +131,9 @@ class ObjGame:
 
         """
         if len(self.maps_prev) != 0:
+            # the floors kept in maps_prev/maps_next are pickled live by the autosave in progress
+            globalvars.SAVE_WRITER.wait()
+
             for obj in self.current_objects:
                 obj.animation_del()
 
@@ -124,6 +141,7 @@ class ObjGame:
             self.maps_next.append(save_data)
 
             (globalvars.PLAYER.x, globalvars.PLAYER.y, self.current_map, self.current_rooms, self.current_objects) = self.maps_prev[-1]
+            self.current_objects.refresh(globalvars.PLAYER)
 
             for obj in self.current_objects:
                 obj.animation_init()
@@ -136,6 +154,7 @@ class ObjGame:
 
         game_message(f"{globalvars.PLAYER.display_name} moved down a floor!", constants.COLOR_BLUE)
         self.cur_floor -= 1
+        globalvars.EVENT_BUS.publish(events.FloorChanged(self.cur_floor))
 
 
 def game_main_loop(new_game=True):
@@ -151,17 +170,23 @@ def game_main_loop(new_game=True):
     """
     pygame.mixer.music.load(globalvars.ASSETS.ingame_music)
     pygame.mixer.music.play(-1)
-    pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+    gui.set_cursor(pygame.cursors.tri_left)
 
     # set flags and counters
     globalvars.GAME_QUIT = False
     globalvars.FLOOR_CHANGED = False
+    globalvars.INPUT_QUEUE.clear()
+
+    # the PLAYER arrives on the floor the game starts on (shows the floor title)
+    globalvars.EVENT_BUS.publish(events.FloorChanged(globalvars.GAME.cur_floor))
 
     while not globalvars.GAME_QUIT:
 
-        draw.draw_game()
+        with profiler.scope("draw_game"):
+            draw.draw_game()
 
-        player_action = game_handle_keys()
+        with profiler.scope("input"):
+            player_action = game_handle_keys()
         if player_action == "QUIT":
             popup.confirmation_popup()
             # game_exit()
@@ -170,57 +195,84 @@ def game_main_loop(new_game=True):
             popup.game_story_popup()
             new_game = False
 
-        for objActor in globalvars.GAME.current_objects:
-            if objActor.is_visible and objActor.creature is not None:
+        # the damage numbers of creatures that were hit (see draw.damage_dealt) fade out
+        draw.draw_damage_floats()
 
-                if objActor.creature.was_hit and objActor is not globalvars.PLAYER:
-                    objActor.creature.internal_timer = pygame.time.get_ticks()
-                    objActor.creature.dmg_alpha = 255
-                    objActor.creature.health_bar_alpha = 255
+        # display floor title for a few seconds when floor changes and when game first starts
+        if globalvars.GAME.floor_transition_alpha > 0:
+            hud.draw_floor_title()
 
-                elif objActor.creature.was_hit and objActor is globalvars.PLAYER:
-                    objActor.creature.dmg_alpha = 255
+        with profiler.scope("update_fov"):
+            map.update_fov()
 
-                if objActor.creature.dmg_alpha > 0:
-                    objActor.creature.draw_damage_taken()
+        # creatures takes their turn once the PLAYER acted
+        with profiler.scope("ai"):
+            # only the ai that are awake (the rest would do nothing) are visited
+            if player_action != "no-action" and player_action != "QUIT":
+                for obj in globalvars.GAME.current_objects.turn_takers():
+                    if obj.ai is not None:
+                        obj.ai.take_turn()
 
-        # makes sure that damage taken ui gets applied to player as well (since creature takes turn in next for loop)
-        globalvars.PLAYER.creature.was_hit = False
+        # autosave every few turns and whenever the PLAYER reaches another floor (unless the game
+        # just ended, see player_status_changed)
+        if not globalvars.GAME_QUIT and player_action != "no-action" and player_action != "QUIT":
+            globalvars.GAME.turn_count += 1
 
-        # display floor title for a few seconds when floor changes and when game first starts
-        if (globalvars.FLOOR_CHANGED and player_action == "Just Changed Floors") or globalvars.GAME.from_main_menu:
-            globalvars.GAME.floor_transition_alpha = 255
-            if globalvars.GAME.from_main_menu:
-                globalvars.FLOOR_CHANGED = False
+            if (globalvars.FLOOR_CHANGED and player_action == "Just Changed Floors") or \
+                    globalvars.GAME.turn_count % constants.AUTOSAVE_TURN_INTERVAL == 0:
+                game_autosave()
 
-        if globalvars.GAME.floor_transition_alpha > 0:
-            hud.draw_floor_title()
+        profiler.draw_overlay(globalvars.SURFACE_MAIN)
 
-        map.update_fov()
+        with profiler.scope("display.flip"):
+            pygame.display.flip()
+        globalvars.CLOCK.tick(constants.GAME_FPS)
+        profiler.end_frame()
 
-        # creatures takes their turn
-        for obj in globalvars.GAME.current_objects:
-            if obj.ai is not None:
-                if player_action != "no-action" and player_action != "QUIT":
-                    obj.ai.take_turn()
 
-            if obj.is_visible and obj.creature is not None and obj is not globalvars.PLAYER:
-                obj.creature.was_hit = False
+def game_subscribe_events():
+    """Subscribes the parts of the game that react to game events to the event bus.
 
-            if obj.portal is not None:
-                obj.portal.update()
+    Returns
+    -------
+    None
+    """
+    bus = globalvars.EVENT_BUS
 
-        if globalvars.PLAYER.status == "STATUS_DEAD" or globalvars.PLAYER.status == "STATUS_WIN":
-            globalvars.GAME_QUIT = True
+    bus.subscribe(events.DamageDealt, draw.damage_dealt)
+    bus.subscribe(events.ActorMoved, map.actor_moved)
+    bus.subscribe(events.ItemPickedUp, structure.relic_moved)
+    bus.subscribe(events.ItemDropped, structure.relic_moved)
+    bus.subscribe(events.FloorChanged, structure.update_portals)
+    bus.subscribe(events.FloorChanged, hud.floor_changed)
+    bus.subscribe(events.FloorChanged, globalvars.HUD_LAYER.floor_changed)
+    bus.subscribe(events.StatsChanged, globalvars.HUD_LAYER.stats_changed)
+    bus.subscribe(events.StatusChanged, player_status_changed)
 
-        globalvars.GAME.from_main_menu = False
-        pygame.display.flip()
-        globalvars.CLOCK.tick(constants.GAME_FPS)
+
+def player_status_changed(event):
+    """Event handler that ends the game loop once the PLAYER died or won.
+
+    Parameters
+    ----------
+    event : events.StatusChanged
+        The status change.
+
+    Returns
+    -------
+    None
+    """
+    if event.actor is globalvars.PLAYER and event.status in ("STATUS_DEAD", "STATUS_WIN"):
+        globalvars.GAME_QUIT = True
 
 
 def game_handle_keys():
     """Handles player keyboard and mouse inputs and executes them accordingly.
 
+    Key presses are queued in the input queue (see controls.ObjInputQueue) and looked up in the
+    key dispatch table compiled from the keybindings (see game_compile_keybindings). At most one
+    key press that takes a turn is acted on per call, the presses after it wait for the next one.
+
     Returns
     -------
     str
@@ -231,164 +283,166 @@ def game_handle_keys():
     # get player input
     events_list = pygame.event.get()
     mouse_pos = pygame.mouse.get_pos()
-    pressed_key_list = pygame.key.get_pressed()
 
     # check if player clicked on profile
     player_input = (events_list, mouse_pos)
     if hud.update_pfp(globalvars.ASSETS.S_PLAYER_PFP, player_input):
-        inventory.menu_inventory()
-
-    # load in keybindings from preferences (note this is not a copy of the keybindings dict, just a reference/alias)
-    keys = globalvars.PREFERENCES.keybindings
-
-    shift_pressed = (pressed_key_list[pygame.K_RSHIFT] or pressed_key_list[pygame.K_LSHIFT])
+        key_inventory()
 
     # process input
     for event in events_list:
         if event.type == pygame.QUIT:
             return "QUIT"
 
-        # keyboard events
-        if event.type == pygame.KEYDOWN:
-
-            # 'up arrow' key: move player one tile up, hold down to continuing moving automatically
-            if event.key == keys["up"][1]:
-                if len(keys["up"]) == 2:
-                    actions.move_one_tile("up")
-                    return "player moved"
-
-                elif len(keys["up"]) == 3 and \
-                        (keys["up"][2] == pygame.K_LSHIFT or keys["up"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        actions.move_one_tile("up")
-                        return "player moved"
-
-            # 'down arrow' key: move player one tile down, hold down to continuing moving automatically
-            if event.key == keys["down"][1]:
-                if len(keys["down"]) == 2:
-                    actions.move_one_tile("down")
-                    return "player moved"
-
-                elif len(keys["down"]) == 3 and \
-                        (keys["down"][2] == pygame.K_LSHIFT or keys["down"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        actions.move_one_tile("down")
-                        return "player moved"
-
-            # 'left arrow' key: move player one tile to the left, hold down to continuing moving automatically
-            if event.key == keys["left"][1]:
-                if len(keys["left"]) == 2:
-                    globalvars.PLAYER.animation_key = "A_PLAYER_LEFT"
-                    actions.move_one_tile("left")
-                    return "player moved"
-
-                elif len(keys["left"]) == 3 and \
-                        (keys["left"][2] == pygame.K_LSHIFT or keys["left"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        globalvars.PLAYER.animation_key = "A_PLAYER_LEFT"
-                        actions.move_one_tile("left")
-                        return "player moved"
-
-            # 'right arrow' key: move player one tile to the right, hold down to continuing moving automatically
-            if event.key == keys["right"][1]:
-                if len(keys["right"]) == 2:
-                    globalvars.PLAYER.animation_key = "A_PLAYER_RIGHT"
-                    actions.move_one_tile("right")
-                    return "player moved"
-
-                elif len(keys["right"]) == 3 and \
-                        (keys["right"][2] == pygame.K_LSHIFT or keys["right"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        globalvars.PLAYER.animation_key = "A_PLAYER_RIGHT"
-                        actions.move_one_tile("right")
-                        return "player moved"
-
-            # 'space bar' key: stay in place but advance turn by 1
-            if event.key == keys["stay"][1]:
-                if len(keys["stay"]) == 2:
-                    return "player moved"
-
-                elif len(keys["stay"]) == 3 and \
-                        (keys["stay"][2] == pygame.K_LSHIFT or keys["stay"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        return "player moved"
-
-            # 'g' key: pickup item at the player's current position
-            if event.key == keys["grab"][1]:
-                if len(keys["grab"]) == 2:
-                    actions.grab_item()
-
-                elif len(keys["grab"]) == 3 and \
-                        (keys["grab"][2] == pygame.K_LSHIFT or keys["grab"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        actions.grab_item()
-
-            # 'd' key: drop object from inventory
-            if event.key == keys["drop"][1]:
-                if len(keys["drop"]) == 2:
-                    actions.drop_item()
-
-                elif len(keys["drop"]) == 3 and \
-                        (keys["drop"][2] == pygame.K_LSHIFT or keys["drop"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        actions.drop_item()
-
-            # 'i' key: open inventory menu
-            if event.key == keys["inventory"][1]:
-                if len(keys["inventory"]) == 2:
-                    inventory.menu_inventory()
-
-                elif len(keys["inventory"]) == 3 and \
-                        (keys["inventory"][2] == pygame.K_LSHIFT or keys["inventory"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        inventory.menu_inventory()
-
-            # '>' key: use stairs or portal
-            if event.key == keys["next"][1]:
-                # for when user sets use stairs to only one key
-                if len(keys["next"]) == 2:
-                    actions.use_stairs()
-
-                # default is ">" which is a shift and a period (2 keys)
-                elif len(keys["next"]) == 3 and \
-                        (keys["next"][2] == pygame.K_LSHIFT or keys["next"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        actions.use_stairs()
-                return "Just Changed Floors"
-
-            # access in-game options menu or exit from a popup/menu
-            if event.key == keys["back"][1]:
-                if len(keys["back"]) == 2:
-                    previous_display = globalvars.PREFERENCES.display_window
-
-                    options.main_options_menu(in_game=True)
-                    pygame.mouse.set_cursor(*pygame.cursors.tri_left)
-
-                    # Change display after exiting options menu (only if there was a change)
-                    if previous_display != globalvars.PREFERENCES.display_window and \
-                            globalvars.PREFERENCES.display_window == "fullscreen":
-                        globalvars.SURFACE_MAIN = pygame.display.set_mode(
-                            (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT),
-                            flags=pygame.FULLSCREEN)
-
-                    elif previous_display != globalvars.PREFERENCES.display_window:
-                        globalvars.SURFACE_MAIN = pygame.display.set_mode((constants.CAMERA_WIDTH,
-                                                                           constants.CAMERA_HEIGHT))
-
-                elif len(keys["back"]) == 3 and \
-                        (keys["back"][2] == pygame.K_LSHIFT or keys["back"][2] == pygame.K_RSHIFT):
-                    if shift_pressed:
-                        options.main_options_menu(in_game=True)
-                        pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+        # mouse wheel over the message console: scroll it back/forward by a line
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button in (4, 5) and \
+                globalvars.MESSAGE_CONSOLE.rect.collidepoint(mouse_pos):
+            globalvars.MESSAGE_CONSOLE.scroll_by(1 if event.button == 4 else -1)
+
+    # keyboard events
+    globalvars.INPUT_QUEUE.extend(events_list)
+
+    while globalvars.INPUT_QUEUE:
+        event = globalvars.INPUT_QUEUE.pop()
+
+        handler = controls.find_handler(globalvars.KEY_DISPATCH, event)
+        if handler is not None:
+            player_action = handler()
+            if player_action is not None:
+                return player_action
+
+        # 'page up'/'page down' keys: scroll the message console back/forward by a page
+        if event.key == pygame.K_PAGEUP:
+            globalvars.MESSAGE_CONSOLE.scroll_by(constants.NUM_MESSAGES)
+
+        if event.key == pygame.K_PAGEDOWN:
+            globalvars.MESSAGE_CONSOLE.scroll_by(-constants.NUM_MESSAGES)
+
+        # 'F3' key: show/hide the frame profiler, 'F4' key: write the recorded frame times to a file
+        if event.key == pygame.K_F3:
+            profiler.toggle()
+
+        if event.key == pygame.K_F4 and profiler.enabled:
+            profile_path = profiler.dump()
+            if profile_path is not None:
+                game_message(f"Frame profile saved to {profile_path}", constants.COLOR_WHITE)
 
     return "no-action"
 
 
+# ==================== KEY HANDLERS ==================== #
+# The actions that can be bound to a key (see KEY_HANDLERS). A handler returns the status of the
+# action the PLAYER took if it takes a turn, or None if the next key press can be handled. A
+# handler that opens a menu clears the input queue when the menu closes, so the key presses that
+# came in before the menu opened aren't acted on after it.
+
+def key_move_up():
+    """'up arrow' key: move player one tile up, hold down to continuing moving automatically."""
+    actions.move_one_tile("up")
+    return "player moved"
+
+
+def key_move_down():
+    """'down arrow' key: move player one tile down, hold down to continuing moving automatically."""
+    actions.move_one_tile("down")
+    return "player moved"
+
+
+def key_move_left():
+    """'left arrow' key: move player one tile to the left, hold down to continuing moving."""
+    globalvars.PLAYER.animation_key = "A_PLAYER_LEFT"
+    actions.move_one_tile("left")
+    return "player moved"
+
+
+def key_move_right():
+    """'right arrow' key: move player one tile to the right, hold down to continuing moving."""
+    globalvars.PLAYER.animation_key = "A_PLAYER_RIGHT"
+    actions.move_one_tile("right")
+    return "player moved"
+
+
+def key_stay():
+    """'space bar' key: stay in place but advance turn by 1."""
+    return "player moved"
+
+
+def key_grab():
+    """'g' key: pickup item at the player's current position."""
+    actions.grab_item()
+
+
+def key_drop():
+    """'d' key: drop object from inventory."""
+    actions.drop_item()
+
+
+def key_inventory():
+    """'i' key: open inventory menu."""
+    inventory.menu_inventory()
+    globalvars.INPUT_QUEUE.clear()
+
+
+def key_next():
+    """'>' key: use stairs or portal."""
+    actions.use_stairs()
+    return "Just Changed Floors"
+
+
+def key_back():
+    """'Esc' key: access in-game options menu or exit from a popup/menu."""
+    previous_display = globalvars.PREFERENCES.display_window
+
+    options.main_options_menu(in_game=True)
+    gui.set_cursor(pygame.cursors.tri_left)
+
+    # Change display after exiting options menu (only if there was a change)
+    if previous_display != globalvars.PREFERENCES.display_window and \
+            globalvars.PREFERENCES.display_window == "fullscreen":
+        globalvars.SURFACE_MAIN = pygame.display.set_mode(
+            (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT),
+            flags=pygame.FULLSCREEN)
+
+    elif previous_display != globalvars.PREFERENCES.display_window:
+        globalvars.SURFACE_MAIN = pygame.display.set_mode((constants.CAMERA_WIDTH,
+                                                           constants.CAMERA_HEIGHT))
+
+    globalvars.INPUT_QUEUE.clear()
+
+
+# the handler of every action in the keybindings (see data.StructPreferences)
+KEY_HANDLERS = {"up": key_move_up,
+                "down": key_move_down,
+                "left": key_move_left,
+                "right": key_move_right,
+                "stay": key_stay,
+                "grab": key_grab,
+                "drop": key_drop,
+                "inventory": key_inventory,
+                "next": key_next,
+                "back": key_back,
+                }
+
+
+def game_compile_keybindings():
+    """Compiles the keybindings of the preferences into the key dispatch table.
+
+    Must be called again whenever the keybindings change (see options.controls_options_menu).
+
+    Returns
+    -------
+    None
+    """
+    globalvars.KEY_DISPATCH = controls.compile_keybindings(globalvars.PREFERENCES.keybindings,
+                                                           KEY_HANDLERS)
+
+
 def game_message(text, color=constants.COLOR_GREY):
     """Adds a game message to the list of messages.
 
     Separates lines of text that is longer than the specified msg width (constants.MSG_MAX_CHARS) into different
-    message pieces to be appended to the list of messages separately.
+    message pieces to be appended to the list of messages separately. The oldest lines are dropped once the history
+    holds constants.MSG_HISTORY_LINES lines.
 
     Parameters
     ----------
@@ -404,13 +458,8 @@ def game_message(text, color=constants.COLOR_GREY):
     """
     new_msg_lines = textwrap.wrap(text, constants.MSG_MAX_CHARS)
 
-    for line in new_msg_lines:
-
-        # if the buffer is full, remove the first line to make room for the new one
-        if len(globalvars.GAME.message_history) == constants.NUM_MESSAGES:
-            del globalvars.GAME.message_history[0]
-
-        globalvars.GAME.message_history.append((line, color))
+    globalvars.GAME.message_history.extend((line, color) for line in new_msg_lines)
+    globalvars.MESSAGE_CONSOLE.invalidate(len(new_msg_lines))
 
 
 def game_new():
@@ -425,6 +474,7 @@ def game_new():
     """
 
     globalvars.GAME = ObjGame()
+    globalvars.GAME.save_slot = savefile.next_free_slot()
 
     # position doesn't matter as it will be set when every actor is placed with map_place_items_creatures
     playergen.gen_player((0, 0))
@@ -443,48 +493,147 @@ def game_exit():
     mainmenu.perform_exit_sequence()
 
 
+def game_snapshot():
+    """Takes a cheap in-memory snapshot of the current game for the save writer to pickle.
+
+    The game keeps running while the SAVE_WRITER worker pickles the game, so the state of every
+    object the main loop changes from turn to turn (the game, the entity store and component
+    table of the current floor, the actors on it and in their inventories and their components)
+    is copied here, and the worker pickles those objects with the copied state instead of their
+    live state (see autosave.pickle_snapshot). Only the state is copied, the objects it refers to
+    are not, so the tiles (whose explored flag only ever turns True) and the floors stored in
+    maps_prev/maps_next (floor transitions wait for the save writer) aren't copied at all. The
+    animation sprites (pygame Surface objects, which can't be pickled) are left out of the copy.
+
+    Returns
+    -------
+    tuple
+        The ([GAME, PLAYER] list to pickle, copied states) snapshot, where the copied states map
+        the id of every object whose state was copied to the (object, state) pair.
+    """
+    game = globalvars.GAME
+
+    # the game, the floor's store and table, and every slotted object reachable from its actors
+    objects = {id(obj): obj for obj in (game, game.current_objects, game.current_objects.table)}
+    pending = [globalvars.PLAYER, *game.current_objects]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in objects:
+            continue
+
+        objects[id(obj)] = obj
+        pending += [getattr(obj, name, None) for name in slotted.slot_names(type(obj))
+                    if isinstance(getattr(obj, name, None), slotted.Slotted)]
+        if isinstance(obj, container.ComContainer):
+            pending += obj.held_items
+
+    # objects in the memo are referred to as they are instead of being copied
+    memo = dict(objects)
+    for floor in game.maps_prev + game.maps_next:
+        memo[id(floor)] = floor
+    memo[id(game.current_map)] = game.current_map
+    memo[id(game.current_rooms)] = game.current_rooms
+    for animation_seq in globalvars.ASSETS.animation_dict.values():
+        memo[id(animation_seq)] = None
+
+    states = {key: (obj, obj.__getstate__() if isinstance(obj, slotted.Slotted) else obj.__dict__)
+              for key, obj in objects.items()}
+
+    return [game, globalvars.PLAYER], copy.deepcopy(states, memo)
+
 
-def game_save(in_game=False):
-    """Saves the game into a compressed binary file.
+def game_save():
+    """Saves the game into its save slot.
 
-    Reinitialize animations if saving in-game from options menu.
+    Blocks until the save file is written, including any autosave that is still in progress.
 
     Returns
     -------
     None
     """
-    with gzip.open("data/saves/savegame", "wb") as save_file:
-        try:
-            # destroy Surface objects so pickle can save the data
-            for obj in globalvars.GAME.current_objects:
-                obj.animation_del()
+    game_autosave()
+    globalvars.SAVE_WRITER.wait()
 
-            pickle.dump([globalvars.GAME, globalvars.PLAYER], save_file)
-        except TypeError:
-            print("TypeError, couldn't save game")
 
-    if in_game:
-        # reinitialize animations
-        for obj in globalvars.GAME.current_objects:
-            obj.animation_init()
+def game_autosave():
+    """Saves the game in the background without blocking the main game loop.
 
+    Only the snapshot is taken on the main thread, pickling, compressing and writing the save file
+    is done by the SAVE_WRITER worker thread.
 
-def game_load():
-    """Load previous game from save file.
+    Returns
+    -------
+    None
+    """
+    header = savefile.make_header(globalvars.GAME, globalvars.PLAYER)
+    globalvars.SAVE_WRITER.submit(globalvars.GAME.save_slot, header, game_snapshot())
+
+
+def game_load(slot=None):
+    """Load previous game from a save slot.
+
+    Parameters
+    ----------
+    slot : int, optional
+        The save slot to load. Loads the most recent valid save if not specified.
 
     Returns
     -------
     None
+
+    Raises
+    ------
+    FileNotFoundError
+        If there is no save to load.
+    ValueError
+        If the save is corrupt (see savefile.read_save).
     """
+    globalvars.SAVE_WRITER.wait()
 
-    with gzip.open("data/saves/savegame", "rb") as load_file:
-        globalvars.GAME, globalvars.PLAYER = pickle.load(load_file)
+    if slot is None:
+        slot = savefile.latest_save()
+
+    if slot is not None:
+        globalvars.GAME, globalvars.PLAYER = savefile.read_save(slot)
+
+    else:
+        # games saved before save slots existed are moved into a slot of their own
+        with gzip.open(constants.LEGACY_SAVE_PATH, "rb") as load_file:
+            try:
+                globalvars.GAME, globalvars.PLAYER = pickle.load(load_file)
+            except (OSError, EOFError, zlib.error, pickle.UnpicklingError) as error:
+                raise ValueError(f"{constants.LEGACY_SAVE_PATH} is corrupt") from error
+
+        globalvars.GAME.save_slot = savefile.next_free_slot()
+
+    # saves made before autosaving was added do not track turns
+    if not hasattr(globalvars.GAME, "turn_count"):
+        globalvars.GAME.turn_count = 0
+
+    # saves made before the message scrollback kept their messages in a short list
+    if not isinstance(globalvars.GAME.message_history, collections.deque):
+        globalvars.GAME.message_history = collections.deque(globalvars.GAME.message_history,
+                                                            maxlen=constants.MSG_HISTORY_LINES)
+
+    # saves made before the entity store existed kept each floor's objects in one ordered list, and
+    # stores saved before the component table existed are built again to get one
+    loaded_game = globalvars.GAME
+    if not hasattr(loaded_game.current_objects, "table"):
+        loaded_game.current_objects = entities.ObjEntityStore(loaded_game.current_objects)
+        loaded_game.maps_prev = [(*floor[:4], entities.ObjEntityStore(floor[4]))
+                                 for floor in loaded_game.maps_prev]
+        loaded_game.maps_next = [(*floor[:4], entities.ObjEntityStore(floor[4]))
+                                 for floor in loaded_game.maps_next]
+
+    loaded_game.current_objects.refresh(globalvars.PLAYER)
 
     # reinitialize animations
     for obj in globalvars.GAME.current_objects:
         obj.animation_init()
 
-    globalvars.GAME.from_main_menu = True
+    if slot is None:
+        game_save()
+        os.remove(constants.LEGACY_SAVE_PATH)
 
     map.create_fov_map(globalvars.GAME.current_map)
     globalvars.FOV_CALCULATE = True
@@ -514,9 +663,16 @@ def preferences_load():
         globalvars.PREFERENCES = pickle.load(load_file)
 
 
-def game_start(new=True):
+def game_start(new=True, slot=None):
     """Loads a saved game or generate a new game if there is a no save data
 
+    Parameters
+    ----------
+    new : bool, optional
+        True to start a new game, False to load a saved game.
+    slot : int, optional
+        The save slot to load (the most recent save is loaded if not specified).
+
     Returns
     -------
     None
@@ -526,10 +682,10 @@ def game_start(new=True):
         new = True
     else:
         try:
-            game_load()
+            game_load(slot)
             new = False
 
-        except FileNotFoundError:
+        except (FileNotFoundError, ValueError):
             # TODO indicate that a new game was initiated instead (pop up notice)
             game_new()
             new = True
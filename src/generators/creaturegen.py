@@ -8,7 +8,7 @@ from src.components import creature, ai, itemcom
 def gen_enemy(room_range_x, room_range_y, floor_num):
     """Generates random enemies at random positions in a room.
 
-    Inserts a randomly generated enemy creature object at the end of the GAME.current_objects list.
+    Adds a randomly generated enemy creature object to the creatures layer of GAME.current_objects.
 
     Parameters
     ----------
@@ -68,13 +68,13 @@ def gen_enemy(room_range_x, room_range_y, floor_num):
     # choose one of the mobs according to their spawn probability
     new_enemy = numpy.random.choice(mob_dict[floor_num][1], p=mob_dict[floor_num][0])
 
-    globalvars.GAME.current_objects.insert(-1, new_enemy)
+    globalvars.GAME.current_objects.add(new_enemy)
 
 
 def gen_friendly_mob(room_range_x, room_range_y, floor_num):
     """Generates random friendly creature in a random position in a room.
 
-    Inserts a randomly generated enemy creature object at the end of the GAME.current_objects list.
+    Adds a randomly generated enemy creature object to the creatures layer of GAME.current_objects.
 
     Parameters
     ----------
@@ -93,7 +93,7 @@ def gen_friendly_mob(room_range_x, room_range_y, floor_num):
 
     if choice_num <= 80:
         new_healer = gen_healer_slime(room_range_x, room_range_y)
-        globalvars.GAME.current_objects.insert(-1, new_healer)
+        globalvars.GAME.current_objects.add(new_healer)
 
 
 # ---------------------------------------- #
@@ -10,7 +10,7 @@ from src.components import itemcom
 def gen_item(floor_num, coord):
     """Generates a random item at the given coordinates specified by coord.
 
-    Inserts a randomly generated item object onto the front of the GAME.current_objects list.
+    Adds a randomly generated item object to the items layer of GAME.current_objects.
 
     Parameters
     ----------
@@ -81,7 +81,7 @@ def gen_item(floor_num, coord):
     new_item = numpy.random.choice(item_dict[floor_num][1], p=item_dict[floor_num][0])
 
     if new_item:
-        globalvars.GAME.current_objects.insert(0, new_item)
+        globalvars.GAME.current_objects.add(new_item)
 
 
 def gen_none_item():
@@ -22,4 +22,4 @@ def gen_player(coord):
                                        creature=creature_com,
                                        container=container_com)
 
-    globalvars.GAME.current_objects.append(globalvars.PLAYER)
+    globalvars.GAME.current_objects.add(globalvars.PLAYER)
@@ -24,7 +24,7 @@ def gen_stairs(coord, up=True):
         stairs_com = structure.ComStairs(upwards=False)
         stairs_obj = actor.ObjActor(*coord, "Downwards stairs", "S_STAIRS_DOWN", stairs=stairs_com)
 
-    globalvars.GAME.current_objects.insert(0, stairs_obj)
+    globalvars.GAME.current_objects.add(stairs_obj)
 
 
 def gen_magic_rock(coord):
@@ -42,7 +42,7 @@ def gen_magic_rock(coord):
     item_com = itemcom.ComItem("A mysterious ancient relic.")
     rock_obj = actor.ObjActor(*coord, "MAGIC ROCK", "S_MAGIC_ROCK", item=item_com)
 
-    globalvars.GAME.current_objects.insert(0, rock_obj)
+    globalvars.GAME.current_objects.add(rock_obj)
 
 
 def gen_portal(coord):
@@ -60,4 +60,4 @@ def gen_portal(coord):
     portal_com = structure.ComPortal()
     portal_obj = actor.ObjActor(*coord, "Portal", "S_PORTAL_CLOSED", portal=portal_com)
 
-    globalvars.GAME.current_objects.insert(0, portal_obj)
+    globalvars.GAME.current_objects.add(portal_obj)
@@ -12,3 +12,10 @@ PLAYER = None
 FLOOR_CHANGED = None
 GAME_QUIT = None
 DISPLAY_CHANGE = None
+SAVE_WRITER = None
+MINI_MAP = None
+MESSAGE_CONSOLE = None
+HUD_LAYER = None
+EVENT_BUS = None
+KEY_DISPATCH = None
+INPUT_QUEUE = None
@@ -6,6 +6,22 @@ import numpy
 from src import constants, globalvars, text
 
 
+def set_cursor(cursor):
+    """Sets the shape of the mouse cursor (eg. pygame.cursors.diamond).
+
+    Some video drivers (eg. the dummy driver of headless runs) have no cursor, the cursor is then
+    left as it is.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        pygame.mouse.set_cursor(*cursor)
+    except pygame.error:
+        pass
+
+
 class GuiButton:
     """A button object class that creates simple rectangular buttons.
 
@@ -282,7 +298,7 @@ def hovered_clickable_element(mouse_hovered, mouse_clicked, hover_sound, change_
     element_clicked = False
     if mouse_hovered:
         if change_cursor:
-            pygame.mouse.set_cursor(*pygame.cursors.diamond)
+            set_cursor(pygame.cursors.diamond)
 
         if not hover_sound:
             globalvars.ASSETS.sfx_rollover.play()
@@ -294,7 +310,7 @@ def hovered_clickable_element(mouse_hovered, mouse_clicked, hover_sound, change_
 
     else:
         if change_cursor:
-            pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+            set_cursor(pygame.cursors.tri_left)
         globalvars.ASSETS.sfx_rollover.fadeout(60)
         hover_sound = False
 
@@ -1,32 +1,29 @@
 import pygame
-import tcod
 
-from src import constants, text, globalvars, gui
+from src import constants, text, globalvars, gui, minimap
 
 
-def draw_player_health(surface, coords, percentage):
-    """Displays the player's health onto the screen.
+def render_player_health(current_hp, max_hp):
+    """Renders the player's health bar.
 
     Parameters
     ----------
-    surface : pygame Surface obj
-        The surface that the health bar will be drawn on.
-    coords : tuple
-        The pixel topleft-aligned coordinates of where the health bar will be drawn.
-    percentage : float
-        The percentage of total health remaining.
+    current_hp : int
+        The player's current health.
+    max_hp : int
+        The player's total health.
 
     Returns
     -------
-    None
+    pygame Surface obj
+        The health bar.
     """
-    if percentage < 0:
-        percentage = 0
+    percentage = max(current_hp / max_hp, 0)
 
     bar_width = 260
     bar_height = 26
     bg_color = (71, 84, 97, 170)
-    health_text = f"hp   {globalvars.PLAYER.creature.current_hp}/{globalvars.PLAYER.creature.max_hp}"
+    health_text = f"hp   {current_hp}/{max_hp}"
     font = constants.FONT_BEST
     text_coords = (10 + (text.get_text_width(font, health_text) // 2), bar_height // 2)
 
@@ -52,29 +49,30 @@ def draw_player_health(surface, coords, percentage):
     pygame.draw.rect(back_surface, constants.COLOR_BLACK, outline_rect, 2)
     text.draw_text(back_surface, health_text, font, text_coords, (247, 247, 247), center=True)
 
-    surface.blit(back_surface, coords)
+    return back_surface
 
 
-def draw_player_exp(surface, coords):
-    """Displays the player's exp progress onto the screen.
+def render_player_exp(exp, exp_to_next):
+    """Renders the player's exp progress bar.
 
     Parameters
     ----------
-    surface : pygame Surface obj
-        The surface that the progress bar will be drawn on.
-    coords : tuple
-        The pixel topleft-aligned coordinates of where the progress bar will be drawn.
+    exp : int
+        The exp the player has gained towards the next level.
+    exp_to_next : int
+        The exp needed to reach the next level.
 
     Returns
     -------
-    None
+    pygame Surface obj
+        The exp progress bar.
     """
-    percentage = globalvars.PLAYER.exp / globalvars.PLAYER.exp_to_next
+    percentage = exp / exp_to_next
 
     bar_width = 190
     bar_height = 18
     bg_color = (71, 84, 97, 170)
-    exp_text = f"exp  {globalvars.PLAYER.exp}/{globalvars.PLAYER.exp_to_next}"
+    exp_text = f"exp  {exp}/{exp_to_next}"
     font = constants.FONT_BEST
     text_coords = (10 + (text.get_text_width(font, exp_text) // 2), bar_height // 2)
 
@@ -95,46 +93,31 @@ def draw_player_exp(surface, coords):
     pygame.draw.rect(back_surface, constants.COLOR_BLACK, outline_rect, 2)
     text.draw_text(back_surface, exp_text, font, text_coords, (247, 247, 247), center=True)
 
-    surface.blit(back_surface, coords)
-
+    return back_surface
 
-def pfp(surface, coord):
-    """Draws the player profile square onto the window ui.
 
-    Parameters
-    ----------
-    surface : pygame Surface obj
-        The surface to draw the pfp on (normally main surface).
-    coord : tuple
-        Appropriate coordinates (usually in px) to position the pfp relative to its topleft corner.
+def render_pfp():
+    """Returns the player profile square of the window ui."""
+    return globalvars.ASSETS.S_PLAYER_PFP
 
-    Returns
-    -------
-    None
-    """
 
-    pfp_img = globalvars.ASSETS.S_PLAYER_PFP
-    surface.blit(pfp_img, coord)
-
-
-def level_sign(surface, coord):
-    """Draws the player level onto the window ui.
+def render_level_sign(level):
+    """Renders the player level indicator of the window ui.
 
     Parameters
     ----------
-    surface : pygame Surface obj
-        The surface to draw the level indicator on (normally main surface).
-    coord : tuple
-        The coordinates (usually in px) to position the indicator relative to the topleft corner.
+    level : int
+        The player's level.
 
     Returns
     -------
-    None
+    pygame Surface obj
+        The level indicator.
     """
     level_img = globalvars.ASSETS.S_PLAYER_LVL
-    level_txt = f"LV {globalvars.PLAYER.level}"
+    level_txt = f"LV {level}"
 
-    if globalvars.PLAYER.level != constants.PLAYER_MAX_LV:
+    if level != constants.PLAYER_MAX_LV:
         txt_color = (109, 227, 176)
     else:
         txt_color = constants.COLOR_WHITE
@@ -145,7 +128,7 @@ def level_sign(surface, coord):
     sign_surface.blit(level_img, (0, 0))
     text.draw_text(sign_surface, level_txt, constants.FONT_BEST, (34, 15), txt_color, center=True)
 
-    surface.blit(sign_surface, coord)
+    return sign_surface
 
 
 def update_pfp(surface, player_input):
@@ -205,27 +188,40 @@ def draw_messages():
 
     Displays a number of messages from GAME.message_history in sequence.
     The order of messages starts from the most recent at the bottom and older at the top.
+    The console is kept pre-rendered by globalvars.MESSAGE_CONSOLE (see console.ObjMessageConsole).
 
     Returns
     -------
     None
     """
-    if len(globalvars.GAME.message_history) <= constants.NUM_MESSAGES:
-        globalvars.GAME.message_history = globalvars.GAME.message_history
-    else:
-        del globalvars.GAME.message_history[0]
-
     text_height = text.get_text_height(constants.FONT_BEST)
     text_x = 10
     start_y = constants.CAMERA_HEIGHT - (constants.NUM_MESSAGES * text_height) - 16
 
-    for i, (message, color) in enumerate(globalvars.GAME.message_history):
-        text.draw_text(globalvars.SURFACE_MAIN, message, constants.FONT_BEST,
-                       (text_x, start_y + (i * text_height)), color, constants.COLOR_GAME_BG)
+    globalvars.MESSAGE_CONSOLE.draw(globalvars.SURFACE_MAIN, (text_x, start_y))
+
+    if globalvars.MESSAGE_CONSOLE.scroll > 0:
+        text.draw_text(globalvars.SURFACE_MAIN,
+                       f"{globalvars.MESSAGE_CONSOLE.scroll} newer lines (PgDn)", constants.FONT_BEST,
+                       (text_x, start_y - text_height), constants.COLOR_WHITE, constants.COLOR_GAME_BG)
+
+
+def floor_changed(event):
+    """Event handler that starts fading in the floor title when the PLAYER arrives on a floor.
+
+    Parameters
+    ----------
+    event : events.FloorChanged
+        The floor change.
+
+    Returns
+    -------
+    None
+    """
+    globalvars.GAME.floor_transition_alpha = 255
 
 
-def draw_floor_title(text_color=pygame.Color('aquamarine1'), font=constants.FONT_BEST_20,
-                     change_alpha=True):
+def draw_floor_title(text_color=pygame.Color('aquamarine1'), font=None, change_alpha=True):
     """Displays the fading title text when entering game from the main menu or entering a floor.
 
     Parameters
@@ -233,7 +229,7 @@ def draw_floor_title(text_color=pygame.Color('aquamarine1'), font=constants.FONT
     text_color : tuple, optional
         The color of the text.
     font : pygame Font obj, optional
-        The font of the text.
+        The font of the text (constants.FONT_BEST_20 if not specified).
     change_alpha : bool, optional
         True if the alpha value needs to be decremented.
 
@@ -241,6 +237,9 @@ def draw_floor_title(text_color=pygame.Color('aquamarine1'), font=constants.FONT
     -------
     None
     """
+    if font is None:
+        font = constants.FONT_BEST_20
+
     text_coords = (constants.CAMERA_WIDTH / 2, constants.CAMERA_HEIGHT / 2 - constants.CELL_HEIGHT - 5)
     floor_num = globalvars.GAME.cur_floor
 
@@ -260,6 +259,9 @@ def draw_floor_title(text_color=pygame.Color('aquamarine1'), font=constants.FONT
 def draw_mini_map(target_map):
     """Draws the mini map onto the the main display surface SURFACE_MAIN.
 
+    The mini map is kept by globalvars.MINI_MAP, which only updates tiles that changed since the
+    last FOV computation (see minimap.ObjMiniMap).
+
     Parameters
     ----------
     target_map : list
@@ -269,61 +271,9 @@ def draw_mini_map(target_map):
     -------
     None
     """
-    mini_cell_w, mini_cell_h = 2, 2
-    cam_grid_x, cam_grid_y = globalvars.CAMERA.map_address
-    back_color = (0, 0, 0, 150)
-
-    mini_cam_width, mini_cam_height = 180, 180
-    mini_cam_surface = pygame.Surface((mini_cam_width, mini_cam_height))
-    mini_cam_surface.fill(back_color)
-    mini_cam_rect = mini_cam_surface.get_rect()
-    mini_cam_rect.center = (cam_grid_x * mini_cell_w, cam_grid_y * mini_cell_h)
-
-    mini_surface = pygame.Surface((constants.MAP_WIDTH * mini_cell_w,
-                                   constants.MAP_HEIGHT * mini_cell_h))
-    mini_surface.fill(back_color)
-
-    cam_grid_width = mini_cam_width // mini_cell_w
-    cam_grid_height = mini_cam_height // mini_cell_h
-
-    render_min_x = max(0, cam_grid_x - (cam_grid_width // 2))
-    render_min_y = max(0, cam_grid_y - (cam_grid_height // 2))
-
-    render_max_x = min(constants.MAP_WIDTH, cam_grid_x + (cam_grid_width // 2))
-    render_max_y = min(constants.MAP_HEIGHT, cam_grid_y + (cam_grid_height // 2))
+    globalvars.MINI_MAP.update(target_map)
 
     fps_msg_height = text.get_text_height(constants.FONT_BEST)
-
-    # draw floor and walls
-    for x in range(render_min_x, render_max_x):
-        for y in range(render_min_y, render_max_y):
-
-            is_visible = tcod.map_is_in_fov(globalvars.FOV_MAP, x, y)
-            if is_visible:
-                target_map[x][y].explored = True
-
-                if target_map[x][y].block_path is True:
-                    mini_surface.blit(globalvars.ASSETS.S_MINI_WALL, (x * 2, y * 2))
-
-                else:
-                    mini_surface.blit(globalvars.ASSETS.S_MINI_FLOOR, (x * 2, y * 2))
-
-            else:
-                if target_map[x][y].explored:
-
-                    if target_map[x][y].block_path is True:
-                        mini_surface.blit(globalvars.ASSETS.S_MINI_WALL_EXPLORED, (x * 2, y * 2))
-
-                    else:
-                        mini_surface.blit(globalvars.ASSETS.S_MINI_FLOOR_EXPLORED, (x * 2, y * 2))
-
-    for obj in globalvars.GAME.current_objects:
-        if obj.stairs is not None and target_map[obj.x][obj.y].explored:
-            mini_surface.blit(globalvars.ASSETS.S_MINI_STAIRS, (obj.x * 2, obj.y * 2))
-
-        if obj.portal is not None and target_map[obj.x][obj.y].explored:
-            mini_surface.blit(globalvars.ASSETS.S_MINI_PORTAL, (obj.x * 2, obj.y * 2))
-
-    mini_cam_surface.blit(mini_surface, (0, 0), mini_cam_rect)
-    globalvars.SURFACE_MAIN.blit(mini_cam_surface,
-                                 (constants.CAMERA_WIDTH - mini_cam_width, fps_msg_height))
+    globalvars.MINI_MAP.draw(globalvars.SURFACE_MAIN,
+                             (constants.CAMERA_WIDTH - minimap.MINI_VIEW_SIZE[0], fps_msg_height),
+                             globalvars.CAMERA.map_address)
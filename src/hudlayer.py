@@ -0,0 +1,120 @@
+import pygame
+
+from src import globalvars, hud
+
+# widget name -> (render function in hud, topleft position on the HUD layer), drawn in this order
+HUD_WIDGETS = {
+    "health": (hud.render_player_health, (68, 0)),
+    "exp": (hud.render_player_exp, (68, 27)),
+    "pfp": (hud.render_pfp, (0, 0)),
+    "level_sign": (hud.render_level_sign, (0, 66)),
+}
+
+
+def widget_values():
+    """Returns the values that every HUD widget displays (widget name -> tuple of render args)."""
+    player = globalvars.PLAYER
+    return {"health": (player.creature.current_hp, player.creature.max_hp),
+            "exp": (player.exp, player.exp_to_next),
+            "pfp": (),
+            "level_sign": (player.level,)}
+
+
+class ObjHudLayer:
+    """A HUD layer object class that composes the player health, exp, pfp and level widgets.
+
+    Every widget surface is cached along with the values it displays and is only rendered again
+    when those values change (which happens on turns, not frames). The values are only looked at
+    again after the layer was made stale by an event (see stats_changed and floor_changed). The
+    widgets are composed onto one layer so that drawing the HUD is a single blit.
+
+    Attributes
+    ----------
+    widgets : dict
+        Maps widget names (see HUD_WIDGETS) to the (values, surface) they were last rendered with.
+    surface : pygame Surface obj or None
+        The composed HUD layer (transparent outside of the widgets).
+    stale : bool
+        True if the PLAYER's stats may have changed since the layer was last updated.
+    """
+
+    def __init__(self):
+        self.widgets = {}
+        self.surface = None
+        self.stale = True
+
+    def stats_changed(self, event):
+        """Event handler that makes the layer stale when the PLAYER's stats changed.
+
+        Parameters
+        ----------
+        event : events.StatsChanged
+            The actor whose stats changed.
+
+        Returns
+        -------
+        None
+        """
+        if event.actor is globalvars.PLAYER:
+            self.stale = True
+
+    def floor_changed(self, event):
+        """Event handler that makes the layer stale when a floor is entered (or a game started).
+
+        Parameters
+        ----------
+        event : events.FloorChanged
+            The floor change.
+
+        Returns
+        -------
+        None
+        """
+        self.stale = True
+
+    def update(self):
+        """Renders the widgets whose values changed and composes the layer again if any did.
+
+        Does nothing unless the layer is stale.
+
+        Returns
+        -------
+        None
+        """
+        if not self.stale:
+            return
+
+        self.stale = False
+        changed = False
+        for name, values in widget_values().items():
+            cached = self.widgets.get(name)
+            if cached is None or cached[0] != values:
+                render, position = HUD_WIDGETS[name]
+                self.widgets[name] = (values, render(*values))
+                changed = True
+
+        if not changed:
+            return
+
+        rects = [self.widgets[name][1].get_rect(topleft=position)
+                 for name, (render, position) in HUD_WIDGETS.items()]
+        layer_rect = rects[0].unionall(rects[1:])
+
+        self.surface = pygame.Surface(layer_rect.bottomright, pygame.SRCALPHA)
+        for name, (render, position) in HUD_WIDGETS.items():
+            self.surface.blit(self.widgets[name][1], position)
+
+    def draw(self, surface):
+        """Draws the HUD layer onto the topleft corner of `surface` (updating it first).
+
+        Parameters
+        ----------
+        surface : pygame Surface obj
+            The surface to draw the HUD on (normally the main surface).
+
+        Returns
+        -------
+        None
+        """
+        self.update()
+        surface.blit(self.surface, (0, 0))
@@ -1,4 +1,4 @@
-from src import constants, map, game
+from src import constants, globalvars, map, game
 from src.menu import tileselect
 from src.components import ai
 
@@ -106,14 +106,12 @@ def cast_fireball(caster, dmg_range_radius):
     if selected_tile_address:
         game.game_message(f"{caster.creature.personal_name} casts fireball", constants.COLOR_WHITE)
 
-        list_of_tiles_to_damage = map.tiles_in_radius(selected_tile_address, spell_radius)
-
-        # damage all creatures in the aoe sphere
-        for (x, y) in list_of_tiles_to_damage:
-            target_creature = map.creature_at_coords(x, y)
-            if target_creature:
-                target_creature.creature.take_damage(damage)
-                damaged_something = True
+        # damage all creatures in the aoe sphere (the area of map.tiles_in_radius)
+        targets = globalvars.GAME.current_objects.creatures_in_radius(selected_tile_address,
+                                                                      spell_radius)
+        for target_creature in targets:
+            target_creature.creature.take_damage(damage)
+            damaged_something = True
 
         if not damaged_something:
             game.game_message("Nothing was hit, what a waste.", constants.COLOR_WHITE)
@@ -155,6 +153,7 @@ def cast_confusion(caster, effect_length):
 
             target_creature.ai = ai.AiConfuse(original_ai=normal_ai, num_turns=effect_length)
             target_creature.ai.owner = target_creature
+            globalvars.GAME.current_objects.refresh(target_creature)
 
             game.game_message(
                 f"{target_creature.display_name} is confused for {effect_length} turns!",
@@ -1,10 +1,15 @@
 import random
 
+import numpy
 import tcod
 
-from src import constants, globalvars, data
+from src import constants, globalvars, data, assets, shapes
 from src.generators import itemgen, creaturegen, specialgen
 
+# the map that the arrays returned by floor_arrays() currently describe, and those arrays
+_arrays_map = None
+_arrays = None
+
 
 class ObjRoom:
     """Rectangular room object containing relevant properties such boundary and center coordinates.
@@ -308,8 +313,8 @@ def creature_at_coords(x, y, exclude=None):
         A creature object or None if there is no creature there.
     """
 
-    for obj in globalvars.GAME.current_objects:
-        if obj is not exclude and obj.x == x and obj.y == y and obj.creature is not None:
+    for obj in globalvars.GAME.current_objects.creatures:
+        if obj is not exclude and obj.x == x and obj.y == y:
             return obj
 
     return None
@@ -337,8 +342,24 @@ def create_fov_map(target_map):
                                     not target_map[x][y].block_path)
 
 
+def actor_moved(event):
+    """Event handler that has the fov computed again (see update_fov) when the PLAYER moved.
+
+    Parameters
+    ----------
+    event : events.ActorMoved
+        The move.
+
+    Returns
+    -------
+    None
+    """
+    if event.actor is globalvars.PLAYER:
+        globalvars.FOV_CALCULATE = True
+
+
 def update_fov():
-    """Update the fov based on the PLAYER's current position on the map.
+    """Update the fov based on the PLAYER's current position on the map and mark the tiles in view explored.
 
     Returns
     -------
@@ -350,6 +371,16 @@ def update_fov():
                              constants.TORCH_RADIUS, constants.FOV_LIGHT_WALLS, constants.FOV_ALG)
         globalvars.FOV_CALCULATE = False
 
+        # every tile in view is explored (the FOV map is indexed [y, x])
+        sprite_ids, explored = floor_arrays(globalvars.GAME.current_map)
+        visible = globalvars.FOV_MAP.fov.T
+
+        newly_explored = visible & ~explored
+        if newly_explored.any():
+            for x, y in zip(*(coords.tolist() for coords in newly_explored.nonzero())):
+                globalvars.GAME.current_map[x][y].explored = True
+            explored |= visible
+
 
 def objects_at_coords(x, y):
     """Returns a list of all actor objects at the map-grid (x, y) coordinate.
@@ -391,15 +422,22 @@ def tiles_in_line(coords1, coords2):
     return list(coords_iter)
 
 
-def tiles_in_radius(center_coords, radius):
+def tiles_in_radius(center_coords, radius, shape=shapes.SHAPE_SQUARE, direction=None):
     """Generates a list of map-grid coordinates of tiles in a `radius` around the center `coords`
 
+    The area is placed from the offsets of a precomputed shape (see shapes.stencil), and only the
+    tiles that are on the map are kept.
+
     Parameters
     ----------
     center_coords :tuple
         The center map-grid coordinates of this area of tiles.
     radius : int
         The radius of the circle area.
+    shape : str, optional
+        The shape of the area, one of shapes.SHAPES (a square without its corners by default).
+    direction : tuple, optional
+        The (dx, dy) direction a cone points in (only for shapes.SHAPE_CONE).
 
     Returns
     -------
@@ -407,24 +445,9 @@ def tiles_in_radius(center_coords, radius):
         A list of map-grid coordinates in the area.
 
     """
-    center_x, center_y = center_coords
-
-    coords_list = []
-    start_x = center_x - radius
-    end_x = center_x + radius
-
-    start_y = center_y - radius
-    end_y = center_y + radius
-
-    for tile_in_radius_x in range(start_x, end_x + 1):
-        for tile_in_radius_y in range(start_y, end_y + 1):
-            coords_list.append((tile_in_radius_x, tile_in_radius_y))
-
-    if radius >= 2:
-        coords_remove = ((start_x, start_y), (end_x, end_y), (start_x, end_y), (end_x, start_y))
-        coords_list = [coord for coord in coords_list if coord not in coords_remove]
+    coords = shapes.area_coords(center_coords, radius, shape, direction)
 
-    return coords_list
+    return [(x, y) for x, y in coords.tolist()]
 
 
 def wall_at_coords(target_map, x, y):
@@ -544,3 +567,61 @@ def assign_tiles(target_map):
                     floor_assign_num += 8
 
                 target_map[x][y].floor_assignment = floor_assign_num
+
+
+def tile_sprite_ids(target_map):
+    """Looks up the tile sprite ID (see assets.TILE_SPRITE_IDS) of every tile on a map.
+
+    Uses the wall and floor bitmask values that assign_tiles gave each tile.
+
+    Parameters
+    ----------
+    target_map : list (2d array)
+        The map to look up.
+
+    Returns
+    -------
+    numpy array
+        The tile sprite IDs, indexed [x, y].
+    """
+    sprite_ids = numpy.zeros((len(target_map), len(target_map[0])), dtype=numpy.intp)
+
+    for x, column in enumerate(target_map):
+        for y, tile in enumerate(column):
+            if tile.block_path:
+                key = ("wall", tile.wall_assignment)
+            elif isinstance(assets.FLOOR_NAMES[tile.floor_assignment], tuple):
+                key = ("floor", tile.floor_assignment, tile.floor_rand_index)
+            else:
+                key = ("floor", tile.floor_assignment, 0)
+
+            sprite_ids[x, y] = assets.TILE_SPRITE_IDS[key]
+
+    return sprite_ids
+
+
+def floor_arrays(target_map):
+    """Returns the tile sprite IDs and explored tiles of `target_map` as numpy arrays.
+
+    The arrays are kept for the map they were last asked for and only made again (from the
+    tiles) when a different map is passed in. update_fov keeps the explored array up to date.
+
+    Parameters
+    ----------
+    target_map : list (2d array)
+        The map to describe.
+
+    Returns
+    -------
+    tuple
+        The (tile sprite IDs, explored) numpy arrays, both indexed [x, y].
+    """
+    global _arrays_map, _arrays
+
+    if target_map is not _arrays_map:
+        explored = numpy.array([[tile.explored for tile in column] for column in target_map],
+                               dtype=bool)
+        _arrays_map = target_map
+        _arrays = (tile_sprite_ids(target_map), explored)
+
+    return _arrays
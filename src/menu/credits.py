@@ -88,9 +88,9 @@ def menu_credits():
             menu_close = True
 
         if menu_button.mouse_hover:
-            pygame.mouse.set_cursor(*pygame.cursors.diamond)
+            gui.set_cursor(pygame.cursors.diamond)
         else:
-            pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+            gui.set_cursor(pygame.cursors.tri_left)
         # draw functions
 
         text.draw_text(credits_surface, "Credits", constants.FONT_MENU_TITLE,
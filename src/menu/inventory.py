@@ -1,7 +1,7 @@
 import pygame
 import textwrap
 
-from src import constants, globalvars, text, draw, game, gui
+from src import constants, globalvars, text, game, gui, modal
 
 # initialize potential buttons
 use_btn = gui.GuiButton(globalvars.SURFACE_MAIN, "", (0, 0), (0, 0))
@@ -31,12 +31,15 @@ def menu_inventory():
 
     inventory_surface = pygame.Surface((menu_width, menu_height))
 
-    pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+    # the game behind the menu is only drawn again when it animates
+    backdrop = modal.ObjModalBackdrop()
+
+    gui.set_cursor(pygame.cursors.tri_left)
     menu_close = False
     globalvars.PLAYER.container.currently_displayed_item_info = None
     while not menu_close:
 
-        draw.draw_game()
+        backdrop.draw()
 
         # mouse control inside menu
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -89,8 +92,7 @@ def menu_inventory():
 
             # transfer equipment items to the equipment menu if equipped
             if item.equipment is not None and item.equipment.equipped:
-                globalvars.PLAYER.container.equipped_inventory.append(item)
-                globalvars.PLAYER.container.inventory.remove(item)
+                globalvars.PLAYER.container.move_to_equipped(item)
                 break
 
             inventory_surface.blit(globalvars.ASSETS.animation_dict[item.animation_key][0],
@@ -176,8 +178,7 @@ def equipment_menu(surface, player_input):
 
         # transfer equipment item to inventory if unequipped
         if not equipped_item.equipment.equipped:
-            globalvars.PLAYER.container.inventory.append(equipped_item)
-            globalvars.PLAYER.container.equipped_inventory.remove(equipped_item)
+            globalvars.PLAYER.container.move_to_inventory(equipped_item)
             break
 
         surface.blit(globalvars.ASSETS.animation_dict[equipped_item.animation_key][0], (item_x, item_y))
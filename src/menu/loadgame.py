@@ -0,0 +1,136 @@
+import numpy
+import pygame
+
+from src import constants, globalvars, text, gui, draw, savefile
+from src.menu import mainmenu
+
+
+def menu_load_game():
+    """Displays the load game menu that lists every save slot (most recent first).
+
+    Only the save index is read to build the list, so opening the menu never decompresses a save.
+    Saves that fail validation are listed in grey and cannot be loaded.
+
+    Returns
+    -------
+    int or None
+        The save slot chosen by the user or None if the menu was closed without choosing one.
+    """
+
+    # ----- menu specs ----- #
+    menu_width = 448
+    menu_height = 352
+    center_x, center_y = constants.CAMERA_WIDTH / 2, constants.CAMERA_HEIGHT / 2
+
+    # ----- initialize menu surface ----- #
+    surface_menu = pygame.Surface((constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT))
+    menu_rect = pygame.Rect((0, 0), (menu_width, menu_height))
+    menu_rect.center = (center_x, center_y)
+
+    title_x = center_x
+    title_y = menu_rect.top + 30
+
+    # ----- button specs ----- #
+    slot_button_wh = (menu_width - 64, 32)
+    slot_offset_y = slot_button_wh[1] + 8
+    slot_first_y = menu_rect.top + 80
+    num_rows = (menu_height - 150) // slot_offset_y + 1
+
+    back_button = gui.GuiButton(surface_menu, "BACK", (center_x, menu_rect.bottom - 30), (64, 32))
+
+    # ----- save slot rows ----- #
+    saves = savefile.list_saves()
+    first_row = 0
+    shown_row = None
+    slot_buttons = []
+
+    # menu background tile positions
+    top_r = tuple(numpy.subtract(menu_rect.topright, (32, 0)))
+    bot_l = tuple(numpy.subtract(menu_rect.bottomleft, (0, 32)))
+    bot_r = tuple(numpy.subtract(menu_rect.bottomright, (32, 32)))
+    corner_positions = (menu_rect.topleft, top_r, bot_l, bot_r)
+
+    # ==================== MENU LOOP ==================== #
+    chosen_slot = None
+    menu_close = False
+    while not menu_close:
+        # ---- retrieve user input and events ----- #
+        mouse_pos = pygame.mouse.get_pos()
+        events_list = pygame.event.get()
+        player_events = (events_list, mouse_pos)
+
+        # ----- event listeners (user keyboard and mouse wheel input) ----- #
+        for event in events_list:
+            if event.type == pygame.QUIT:
+                mainmenu.perform_exit_sequence()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    menu_close = True
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 4:
+                    first_row = max(first_row - 1, 0)
+                elif event.button == 5:
+                    first_row = max(min(first_row + 1, len(saves) - num_rows), 0)
+
+        # only the visible rows get buttons (rebuilt when the list is scrolled)
+        if first_row != shown_row:
+            shown_row = first_row
+            slot_buttons = []
+            for row, save in enumerate(saves[first_row:first_row + num_rows]):
+                slot_y = slot_first_y + slot_offset_y * row
+                slot_buttons.append((save, gui.GuiButton(surface_menu, save_description(save),
+                                                         (center_x, slot_y), slot_button_wh)))
+
+        # ----- button event listeners ----- #
+        if back_button.update(player_events):
+            menu_close = True
+
+        for save, slot_button in slot_buttons:
+            if save["valid"] and slot_button.update(player_events):
+                chosen_slot = save["slot"]
+                menu_close = True
+
+        # ----- display functions ----- #
+        text.draw_text(surface_menu, "Load Game", constants.FONT_MENU_TITLE,
+                       (title_x, title_y),
+                       constants.COLOR_BLACK,
+                       center=True)
+
+        if not saves:
+            text.draw_text(surface_menu, "No saved games", constants.FONT_BEST,
+                           (center_x, slot_first_y), constants.COLOR_BLACK, center=True)
+
+        draw.draw_button_update_cursor([back_button] + [button for save, button in slot_buttons
+                                                        if save["valid"]])
+        for save, slot_button in slot_buttons:
+            if not save["valid"]:
+                text.draw_text(surface_menu, slot_button.text, constants.FONT_BEST,
+                               slot_button.coords_center, constants.COLOR_GREY, center=True)
+
+        # update display
+        globalvars.SURFACE_MAIN.blit(surface_menu, menu_rect.topleft, menu_rect)
+        draw.draw_menu_background(surface_menu, (menu_width, menu_height), *corner_positions)
+        pygame.display.update()
+
+    return chosen_slot
+
+
+def save_description(save):
+    """Builds the line of text that describes a save slot in the load game menu.
+
+    Parameters
+    ----------
+    save : dict
+        A save index entry (see savefile.list_saves).
+
+    Returns
+    -------
+    str
+        The description (player name, level, floor and when it was saved).
+    """
+    if not save["valid"]:
+        return f"Slot {save['slot']}  (corrupt save)"
+
+    saved_at = save.get("timestamp", "").replace("T", " ")[:16]
+    return (f"{save.get('player_name', '???')}  LV {save.get('level', '?')}  "
+            f"{save.get('floor', '?')}F  {saved_at}")
@@ -2,8 +2,8 @@ import sys
 
 import pygame
 
-from src import constants, globalvars, text, startup, gui, game, draw
-from src.menu import options, credits
+from src import constants, globalvars, text, startup, gui, game, draw, assets, startuptrace
+from src.menu import options, credits, loadgame
 
 
 def menu_main():
@@ -14,7 +14,12 @@ def menu_main():
     None
     """
 
-    startup.game_initialize()
+    with startuptrace.phase("game_initialize"):
+        startup.game_initialize()
+
+    # load the in-game assets in the background while the menu is shown
+    asset_loader = assets.ObjAssetLoader(globalvars.ASSETS)
+
     center_x = constants.CAMERA_WIDTH / 2
     title_y = constants.CAMERA_HEIGHT / 4
 
@@ -23,7 +28,7 @@ def menu_main():
     # button sizes (px)
     button_wh = (160, 32)
     button_offset_y = int(round(5/4 * button_wh[1]))
-    button_y = [(title_y + 100) + button_offset_y * i for i in range(5)]
+    button_y = [(title_y + 100) + button_offset_y * i for i in range(6)]
 
     # ------ create buttons ----- #
     new_game_button = gui.GuiButton(globalvars.SURFACE_MAIN, "New Game",
@@ -32,18 +37,21 @@ def menu_main():
     cont_button = gui.GuiButton(globalvars.SURFACE_MAIN, "Continue",
                                 (center_x, button_y[1]), button_wh)
 
+    load_button = gui.GuiButton(globalvars.SURFACE_MAIN, "Load Game",
+                                (center_x, button_y[2]), button_wh)
+
     options_button = gui.GuiButton(globalvars.SURFACE_MAIN, "Options",
-                                   (center_x, button_y[2]), button_wh)
+                                   (center_x, button_y[3]), button_wh)
 
     credits_button = gui.GuiButton(globalvars.SURFACE_MAIN, "Credits",
-                                   (center_x, button_y[3]), button_wh)
+                                   (center_x, button_y[4]), button_wh)
 
     quit_button = gui.GuiButton(globalvars.SURFACE_MAIN, "QUIT",
-                                (center_x, button_y[4]), button_wh)
+                                (center_x, button_y[5]), button_wh)
 
     # Main menu buttons in vertical order along with relevant coords as last element
-    menu_buttons_tup = (new_game_button, cont_button, options_button, credits_button, quit_button,
-                        (center_x, title_y))
+    menu_buttons_tup = (new_game_button, cont_button, load_button, options_button, credits_button,
+                        quit_button, (center_x, title_y))
 
     # play background music (on loop)
     pygame.mixer.music.load(globalvars.ASSETS.main_menu_music)
@@ -54,6 +62,9 @@ def menu_main():
     menu_running = True
 
     while menu_running:
+        if not asset_loader.done:
+            asset_loader.update()
+
         # ---- retrieve user input and events ----- #
         mouse_pos = pygame.mouse.get_pos()
         events_list = pygame.event.get()
@@ -67,20 +78,33 @@ def menu_main():
         # ----- button event listeners ----- #
         # start new game
         if new_game_button.update(player_events):
+            asset_loader.finish()
             pygame.mixer.music.fadeout(1500)
             draw.fade_to_solid(constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT,
                                draw_main_menu, menu_buttons_tup)
             game.game_start()
             menu_main()
 
-        # load previous game
+        # load most recent game
         elif cont_button.update(player_events):
+            asset_loader.finish()
             pygame.mixer.music.fadeout(1500)
             draw.fade_to_solid(constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT,
                                draw_main_menu, menu_buttons_tup, color=pygame.Color('white'))
             game.game_start(new=False)
             menu_main()
 
+        # choose a saved game to load
+        elif load_button.update(player_events):
+            chosen_slot = loadgame.menu_load_game()
+            if chosen_slot is not None:
+                asset_loader.finish()
+                pygame.mixer.music.fadeout(1500)
+                draw.fade_to_solid(constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT,
+                                   draw_main_menu, menu_buttons_tup, color=pygame.Color('white'))
+                game.game_start(new=False, slot=chosen_slot)
+                menu_main()
+
         elif options_button.update(player_events):
             previous_display = globalvars.PREFERENCES.display_window
             options.main_options_menu()
@@ -96,8 +120,16 @@ def menu_main():
 
         # ------- display functions ------- #
         draw_main_menu(menu_buttons_tup)
+        if not asset_loader.done:
+            draw_loading_bar(asset_loader.progress)
         pygame.display.update()
 
+        # startup ends with the first main menu frame
+        if startuptrace.active:
+            startuptrace.finish()
+            if startuptrace.exit_after_startup:
+                perform_exit_sequence()
+
     if display_changed and globalvars.PREFERENCES.display_window == "fullscreen":
         globalvars.SURFACE_MAIN = pygame.display.set_mode(
             (constants.CAMERA_WIDTH, constants.CAMERA_HEIGHT), flags=pygame.FULLSCREEN)
@@ -127,6 +159,30 @@ def draw_main_menu(buttons):
     draw.draw_button_update_cursor(buttons[:-1])
 
 
+def draw_loading_bar(progress):
+    """Draws the asset loading progress bar at the bottom of the main menu.
+
+    Parameters
+    ----------
+    progress : float
+        The fraction (0 to 1) of assets that have been loaded.
+
+    Returns
+    -------
+    None
+    """
+    bar_rect = pygame.Rect((0, 0), (200, 8))
+    bar_rect.center = (constants.CAMERA_WIDTH / 2, constants.CAMERA_HEIGHT - 30)
+
+    fill_rect = bar_rect.copy()
+    fill_rect.width = int(bar_rect.width * progress)
+
+    text.draw_text(globalvars.SURFACE_MAIN, "Loading...", constants.FONT_BEST,
+                   (bar_rect.centerx, bar_rect.top - 12), constants.COLOR_WHITE, center=True)
+    pygame.draw.rect(globalvars.SURFACE_MAIN, constants.COLOR_BLUE, fill_rect)
+    pygame.draw.rect(globalvars.SURFACE_MAIN, constants.COLOR_WHITE, bar_rect, 1)
+
+
 def perform_exit_sequence():
     """Executes program termination procedures.
 
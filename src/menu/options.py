@@ -137,7 +137,7 @@ def main_options_menu(in_game=False):
                 menu_close = True
 
             if save_button.update(player_events):
-                game.game_save(in_game=True)
+                game.game_save()
                 popup.popup_menu("Saved game!")
 
             globalvars.CLOCK.tick(constants.GAME_FPS)
@@ -455,6 +455,9 @@ def controls_options_menu():
         globalvars.SURFACE_MAIN.blit(surface_menu, menu_rect.topleft, menu_rect)
         pygame.display.update()
 
+    # the game looks up key presses in the table compiled from the (possibly changed) keybindings
+    game.game_compile_keybindings()
+
 
 def menu_change_controls(action):
     """Displays a pop-up prompt when player clicks on a key button to change in the controls menu.
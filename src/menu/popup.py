@@ -3,7 +3,7 @@ import textwrap
 import pygame
 import numpy
 
-from src import constants, globalvars, text, draw, game, gui
+from src import constants, globalvars, text, draw, game, gui, modal
 
 
 def popup_menu(msg):
@@ -79,10 +79,13 @@ def game_story_popup():
     begin_text = "Your adventure begins now, " \
                  "as you finally managed to find and enter the Tower of Rak. Good luck!"
 
+    # the game behind the popup is only drawn again when it animates
+    backdrop = modal.ObjModalBackdrop()
+
     menu_close = False
     while not menu_close:
 
-        draw.draw_game()
+        backdrop.draw()
 
         # mouse control inside menu
         mouse_x, mouse_y = pygame.mouse.get_pos()
@@ -213,9 +216,9 @@ def confirmation_popup():
             menu_close = True
 
         if menu_button.mouse_hover:
-            pygame.mouse.set_cursor(*pygame.cursors.diamond)
+            gui.set_cursor(pygame.cursors.diamond)
         else:
-            pygame.mouse.set_cursor(*pygame.cursors.tri_left)
+            gui.set_cursor(pygame.cursors.tri_left)
 
         # draw functions
         text.draw_text(surface_menu, "Exit game?",
@@ -1,6 +1,169 @@
 import pygame
 
-from src import constants, globalvars, draw, map
+from src import constants, globalvars, draw, map, modal
+
+
+class ObjTargeting:
+    """A targeting object class that works out what a tile selection aimed at a tile covers.
+
+    Nothing on the map moves while a tile is being selected, so the creature positions are looked
+    up once, the line of fire to every tile within the max range is worked out when the selection
+    opens, and the tiles to highlight are only worked out the first time a tile is hovered over.
+
+    Attributes
+    ----------
+    coords_origin : tuple or None
+        The map-grid coordinate of the caster (None if any single tile can be selected).
+    max_range : int or None
+        Maximum number of tiles out from the caster.
+    radius : int or None
+        Number of tiles from the target that an area of effect covers.
+    wall_pen : bool
+        True if the line of fire goes through wall tiles.
+    creature_pen : bool
+        True if the line of fire goes past the first creature encountered.
+    base_color : tuple
+        Color of tile tint with no affected objects.
+    target_color : tuple
+        Color of tile tint when there is an affected object (creature).
+    single_tile : bool
+        True if the selection is a single tile and not a line or aoe.
+    creatures : dict
+        Maps map-grid coordinates to the creature there (the first one, as map.creature_at_coords).
+    lines : dict
+        Maps every target worked out so far to its line of fire (the tiles the selection covers).
+    highlights : dict
+        Maps every target hovered over so far to the (tile, color, alpha, mark) arguments of the
+        draw.draw_one_tile calls that highlight its selection.
+    """
+
+    def __init__(self, coords_origin=None, max_range=None, radius=None, wall_pen=True,
+                 creature_pen=True, base_color=constants.COLOR_WHITE,
+                 target_color=constants.COLOR_RED, single_tile=False):
+        self.coords_origin = coords_origin
+        self.max_range = max_range
+        self.radius = radius
+        self.wall_pen = wall_pen
+        self.creature_pen = creature_pen
+        self.base_color = base_color
+        self.target_color = target_color
+        self.single_tile = single_tile
+
+        self.creatures = {}
+        for obj in globalvars.GAME.current_objects.creatures:
+            self.creatures.setdefault((obj.x, obj.y), obj)
+
+        self.lines = {}
+        self.highlights = {}
+
+        # the line of fire to every tile in range is ready before the first tile is hovered over
+        if coords_origin is not None and max_range is not None:
+            origin_x, origin_y = coords_origin
+            for x in range(max(origin_x - max_range, 0),
+                           min(origin_x + max_range + 1, constants.MAP_WIDTH)):
+                for y in range(max(origin_y - max_range, 0),
+                               min(origin_y + max_range + 1, constants.MAP_HEIGHT)):
+                    self.line_to((x, y))
+
+    def is_wall(self, tile):
+        """Returns True if `tile` is a wall tile (or outside of the map)."""
+        x, y = tile
+        if not (0 <= x < constants.MAP_WIDTH and 0 <= y < constants.MAP_HEIGHT):
+            return True
+
+        return globalvars.GAME.current_map[x][y].block_path
+
+    def line_to(self, target):
+        """Returns the line of fire from the caster towards `target`.
+
+        The line stops at the max range, in front of the first wall tile (unless `wall_pen`) and on
+        the first creature other than the PLAYER (unless `creature_pen`), whichever comes first.
+
+        Parameters
+        ----------
+        target : tuple
+            The map-grid coordinate that is aimed at.
+
+        Returns
+        -------
+        list
+            The map-grid coordinates of the tiles the selection covers, the selected tile last.
+        """
+        line = self.lines.get(target)
+        if line is not None:
+            return line
+
+        if self.coords_origin is None:
+            line = [target]
+        else:
+            line = map.tiles_in_line(self.coords_origin, target)
+
+            for i, tile in enumerate(line):
+                # stop at wall
+                if not self.wall_pen and self.is_wall(tile):
+                    del line[i:]
+                    break
+
+                # stop at first creature encountered
+                creature = self.creatures.get(tile)
+                if not self.creature_pen and creature is not None \
+                        and creature is not globalvars.PLAYER:
+                    del line[i + 1:]
+                    break
+
+                # stop at max_range
+                if self.max_range is not None and i == self.max_range:
+                    del line[i + 1:]
+                    break
+
+        self.lines[target] = line
+        return line
+
+    def highlight(self, target):
+        """Returns how to highlight the selection when `target` is hovered over.
+
+        Parameters
+        ----------
+        target : tuple
+            The map-grid coordinate that is hovered over.
+
+        Returns
+        -------
+        list
+            The (tile, color, alpha, mark) arguments of the draw.draw_one_tile calls.
+        """
+        tiles = self.highlights.get(target)
+        if tiles is not None:
+            return tiles
+
+        tiles = []
+        line = self.line_to(target)
+        target_tile = line[-1]
+
+        for tile in line:
+            if tile == target_tile:
+                tiles.append((tile, self.base_color, 150, False))
+
+            creature = self.creatures.get(tile)
+            if creature is None:
+                tiles.append((tile, self.base_color, 150, False))
+            elif creature is not globalvars.PLAYER:
+                tiles.append((tile, self.target_color, 100, True))
+            elif self.single_tile:
+                tiles.append((tile, constants.COLOR_ORANGE, 150, True))
+
+        if self.radius:
+            for tile in map.tiles_in_radius(target_tile, self.radius):
+                # highlight tile in red if tile contains a monster, mark target with an "X"
+                if tile in self.creatures:
+                    tiles.append((tile, self.target_color, 150, True))
+                elif tile == target_tile:
+                    tiles.append((tile, constants.COLOR_ORANGE, 200, True))
+                else:
+                    tiles.append((tile, constants.COLOR_ORANGE, 125, False))
+
+        self.highlights[target] = tiles
+        return tiles
 
 
 def menu_tile_select(coords_origin=None,
@@ -40,39 +203,17 @@ def menu_tile_select(coords_origin=None,
     tuple
         The map-grid coordinate of the tile that the PLAYER clicked on.
     """
+    # the map underneath the selection is only drawn again when it animates
+    backdrop = modal.ObjMapBackdrop()
+    targeting = ObjTargeting(coords_origin, max_range, radius, wall_pen, creature_pen,
+                             base_color, target_color, single_tile)
+
     menu_close = False
     while not menu_close:
         mouse_x, mouse_y = pygame.mouse.get_pos()
 
         # convert mouse window address to map grid address
-        map_tile_x, map_tile_y = globalvars.CAMERA.window_to_map((mouse_x, mouse_y))
-
-        if coords_origin is not None:
-            list_of_tiles = map.tiles_in_line(coords_origin, (map_tile_x, map_tile_y))
-
-            # deal with "valid" tiles
-            for i, (tile_x, tile_y) in enumerate(list_of_tiles):
-
-                # stop at max_range
-                if max_range is not None and i == max_range:
-                    # only take the map address tuples before the range
-                    list_of_tiles = list_of_tiles[:i+1]
-
-                # stop at wall
-                if not wall_pen:
-                    # boolean checking if the tile is a wall or not (True if it is, False if not)
-                    tile_is_wall = globalvars.GAME.current_map[tile_x][tile_y].block_path is True
-                    if tile_is_wall:
-                        list_of_tiles = list_of_tiles[:i]
-
-                # stop at first creature encountered
-                if not creature_pen:
-                    target_creature = map.creature_at_coords(tile_x, tile_y)
-                    if target_creature and target_creature is not globalvars.PLAYER:
-                        del list_of_tiles[i+1:]
-
-        else:
-            list_of_tiles = [(map_tile_x, map_tile_y)]
+        map_tile = globalvars.CAMERA.window_to_map((mouse_x, mouse_y))
 
         event_list = pygame.event.get()
         for event in event_list:
@@ -84,71 +225,15 @@ def menu_tile_select(coords_origin=None,
             # mouse events
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:
-                    if (map_tile_x, map_tile_y) == list_of_tiles[-1]:
-                        return map_tile_x, map_tile_y
-                    else:
-                        return list_of_tiles[-1]
+                    return targeting.line_to(map_tile)[-1]
 
-        # Draw game
+        # Draw game (the map with every actor on it comes from the backdrop)
         globalvars.SURFACE_MAIN.fill(constants.COLOR_GAME_BG)
-        globalvars.SURFACE_MAP.fill(constants.COLOR_GAME_BG)
-
-        globalvars.CAMERA.update_pos()
-
-        # draw the map
-        draw.draw_map(globalvars.GAME.current_map)
+        backdrop.draw()
 
-        # draw the character
-        for obj in globalvars.GAME.current_objects:
-            obj.draw(globalvars.SURFACE_MAP)
-
-        # Draw line of selection
-        for (tile_x, tile_y) in list_of_tiles:
-            if (tile_x, tile_y) == list_of_tiles[-1]:
-                draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y), base_color)
-
-            target_creature = map.creature_at_coords(tile_x, tile_y)
-
-            if target_creature is not None:
-                if target_creature is not globalvars.PLAYER:
-                    draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y), target_color,
-                                       alpha=100, mark=True)
-
-                elif target_creature is globalvars.PLAYER and single_tile:
-                    draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y),
-                                       constants.COLOR_ORANGE, mark=True)
-            else:
-                draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y), base_color)
-
-        if radius:
-            area_of_effect = map.tiles_in_radius(list_of_tiles[-1], radius)
-            target_tile = list_of_tiles[-1]
-
-            # prevent tiles to be highlighted twice (as it changes the opaqueness of the highlight)
-            for (tile_x, tile_y) in area_of_effect:
-                target_creature = map.creature_at_coords(tile_x, tile_y)
-
-                for x, y in list_of_tiles:
-                    if (tile_x, tile_y) == (x, y):
-                        list_of_tiles.remove((x, y))
-
-                # highlight tile in red if tile contains a monster
-                if target_creature is not None:
-                    if (tile_x, tile_y) == target_tile:
-                        draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y), target_color,
-                                           mark=True)
-
-                    else:
-                        draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y), target_color,
-                                           mark=True)
-                else:
-                    # mark target with an "X"
-                    if (tile_x, tile_y) == target_tile:
-                        draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y),
-                                           constants.COLOR_ORANGE, alpha=200, mark=True)
-                    else:
-                        draw.draw_one_tile(globalvars.SURFACE_MAP, (tile_x, tile_y),
-                                           constants.COLOR_ORANGE, alpha=125)
+        # Draw line of selection (and its area of effect)
+        for tile, color, alpha, mark in targeting.highlight(map_tile):
+            draw.draw_one_tile(globalvars.SURFACE_MAP, tile, color, alpha=alpha, mark=mark)
 
         globalvars.SURFACE_MAIN.blit(globalvars.SURFACE_MAP, (0, 0), globalvars.CAMERA.rectangle)
         draw.draw_window_ui()
@@ -0,0 +1,164 @@
+import numpy
+import pygame
+
+from src import globalvars
+
+# pixels per map tile on the mini map
+MINI_CELL_SIZE = 2
+
+# (width, height) in pixels of the part of the mini map that is shown on screen
+MINI_VIEW_SIZE = (180, 180)
+
+# mini map tile states (index into ObjMiniMap.palette)
+TILE_UNEXPLORED = 0
+TILE_EXPLORED = 1
+TILE_VISIBLE = 2
+
+
+class ObjMiniMap:
+    """A mini map object class that keeps a persistent mini map surface of the current floor.
+
+    The floor is only redrawn from scratch when a different map is shown. Otherwise the pixels of
+    tiles whose state (unexplored, explored or visible) changed since the last FOV computation are
+    written directly through pygame.surfarray, so drawing the mini map is mostly one blit.
+
+    Attributes
+    ----------
+    target_map : list (nested) or None
+        The map that the mini map currently shows.
+    surface : pygame Surface obj or None
+        The whole floor, MINI_CELL_SIZE x MINI_CELL_SIZE pixels per tile.
+    view : pygame Surface obj
+        The part of `surface` around the camera that is drawn on screen.
+    walls : numpy array or None
+        True for every wall tile (indexed [x, y]).
+    explored : numpy array or None
+        True for every explored tile (indexed [x, y]).
+    tile_states : numpy array or None
+        The state of every tile as it is currently drawn on `surface` (indexed [x, y]).
+    fov : numpy array or None
+        The FOV that `tile_states` was last computed from (indexed [x, y]).
+    markers : list
+        The (x, y, sprite name) of every stairs and portal on the floor.
+    """
+
+    def __init__(self):
+        self.target_map = None
+        self.surface = None
+        self.view = pygame.Surface(MINI_VIEW_SIZE)
+        self.walls = None
+        self.explored = None
+        self.tile_states = None
+        self.fov = None
+        self.markers = []
+
+    @property
+    def palette(self):
+        """numpy array: The RGB color of every [tile state, is wall] pair."""
+        assets = globalvars.ASSETS
+        colors = ((pygame.Color("black"), pygame.Color("black")),
+                  (assets.S_MINI_FLOOR_EXPLORED.get_at((0, 0)),
+                   assets.S_MINI_WALL_EXPLORED.get_at((0, 0))),
+                  (assets.S_MINI_FLOOR.get_at((0, 0)), assets.S_MINI_WALL.get_at((0, 0))))
+
+        return numpy.array([[tuple(color)[:3] for color in pair] for pair in colors],
+                           dtype=numpy.uint8)
+
+    def reset(self, target_map):
+        """Starts showing `target_map`, reading its walls, explored tiles, stairs and portals.
+
+        Parameters
+        ----------
+        target_map : list (nested)
+            The map (2d array of StructTile objects) to show.
+
+        Returns
+        -------
+        None
+        """
+        width, height = len(target_map), len(target_map[0])
+
+        self.target_map = target_map
+        self.walls = numpy.array([[tile.block_path for tile in column] for column in target_map],
+                                 dtype=bool)
+        self.explored = numpy.array([[tile.explored for tile in column] for column in target_map],
+                                    dtype=bool)
+        self.tile_states = numpy.full((width, height), TILE_UNEXPLORED, dtype=numpy.uint8)
+        self.fov = None
+
+        self.surface = pygame.Surface((width * MINI_CELL_SIZE, height * MINI_CELL_SIZE), depth=32)
+        self.surface.fill(pygame.Color("black"))
+
+        # stairs and portals never move, so they only have to be found once per floor
+        self.markers = [(obj.x, obj.y, "S_MINI_STAIRS")
+                        for obj in globalvars.GAME.current_objects.stairs]
+        self.markers += [(obj.x, obj.y, "S_MINI_PORTAL")
+                         for obj in globalvars.GAME.current_objects.portals]
+
+    def update(self, target_map):
+        """Brings the mini map up to date with `target_map` and the current FOV.
+
+        Parameters
+        ----------
+        target_map : list (nested)
+            The map (2d array of StructTile objects) to show.
+
+        Returns
+        -------
+        None
+        """
+        if target_map is not self.target_map:
+            self.reset(target_map)
+
+        # the FOV map is indexed [y, x]
+        fov = globalvars.FOV_MAP.fov.T
+        if self.fov is not None and numpy.array_equal(fov, self.fov):
+            return
+
+        self.fov = fov.copy()
+        self.explored |= fov
+
+        tile_states = numpy.where(fov, TILE_VISIBLE, self.explored).astype(numpy.uint8)
+        changed = tile_states != self.tile_states
+        if not changed.any():
+            return
+
+        colors = self.palette[tile_states[changed], self.walls[changed].astype(numpy.intp)]
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        for dx in range(MINI_CELL_SIZE):
+            for dy in range(MINI_CELL_SIZE):
+                pixels[dx::MINI_CELL_SIZE, dy::MINI_CELL_SIZE][changed] = colors
+        # the surface stays locked while the pixel array exists
+        del pixels
+
+        self.tile_states = tile_states
+
+    def draw(self, surface, coords, center_tile):
+        """Draws the part of the mini map around `center_tile` onto `surface`.
+
+        Parameters
+        ----------
+        surface : pygame Surface obj
+            The surface to draw the mini map on.
+        coords : tuple
+            The pixel topleft-aligned coordinates of where the mini map will be drawn.
+        center_tile : tuple
+            The map-grid (x, y) coordinates of the tile in the center of the mini map.
+
+        Returns
+        -------
+        None
+        """
+        view_rect = self.view.get_rect()
+        view_rect.center = (center_tile[0] * MINI_CELL_SIZE, center_tile[1] * MINI_CELL_SIZE)
+
+        self.view.fill(pygame.Color("black"))
+        self.view.blit(self.surface, (0, 0), view_rect)
+
+        for x, y, sprite_name in self.markers:
+            if self.explored[x, y]:
+                self.view.blit(getattr(globalvars.ASSETS, sprite_name),
+                               (x * MINI_CELL_SIZE - view_rect.x, y * MINI_CELL_SIZE - view_rect.y))
+
+        surface.blit(self.view, coords)
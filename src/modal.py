@@ -0,0 +1,136 @@
+import pygame
+
+from src import constants, globalvars, draw, animclock
+
+
+class ObjModalBackdrop:
+    """A backdrop object class that keeps the game frame shown behind a modal menu (inventory etc.).
+
+    The game is drawn once when the menu opens and the frame is kept (dimmed and blurred once if
+    asked for), so every frame of the menu only has to put the backdrop back and draw the menu on
+    top of it. The game is only drawn again when something in it would look different: an
+    animation in view reached its next sprite (see animclock) or a damage number in view is fading
+    out.
+
+    Attributes
+    ----------
+    dim_alpha : int
+        Alpha value [0, 255] of the black layer the backdrop is dimmed with (0 to not dim).
+    blur : int
+        The factor the backdrop is scaled down by and back up to blur it (1 to not blur).
+    animated : bool
+        True if the backdrop is drawn again when the game underneath animates, False to keep the
+        frame the menu was opened on.
+    surface : pygame Surface obj
+        The captured (and dimmed/blurred) game frame.
+    """
+
+    def __init__(self, dim_alpha=0, blur=1, animated=True):
+        self.dim_alpha = dim_alpha
+        self.blur = blur
+        self.animated = animated
+        self.surface = None
+
+        self.capture()
+
+    @property
+    def is_stale(self):
+        """bool: True if the game underneath changed since the backdrop was captured."""
+        if not self.animated:
+            return False
+
+        if any(obj.is_visible for obj in draw.damage_floats):
+            return True
+
+        return animclock.ms_until_next_frame() == 0
+
+    def capture(self):
+        """Draws the game and keeps the frame as the backdrop.
+
+        Returns
+        -------
+        None
+        """
+        draw.draw_game()
+        self.surface = self.finish(globalvars.SURFACE_MAIN.copy())
+
+    def finish(self, surface):
+        """Blurs and dims a captured `surface` according to the backdrop settings (in place).
+
+        Parameters
+        ----------
+        surface : pygame Surface obj
+            The captured frame.
+
+        Returns
+        -------
+        pygame Surface obj
+            The finished backdrop.
+        """
+        if self.blur > 1:
+            width, height = surface.get_size()
+            small = pygame.transform.smoothscale(surface, (max(width // self.blur, 1),
+                                                           max(height // self.blur, 1)))
+            pygame.transform.smoothscale(small, (width, height), surface)
+
+        if self.dim_alpha > 0:
+            dim_surface = pygame.Surface(surface.get_size())
+            dim_surface.set_alpha(self.dim_alpha)
+            surface.blit(dim_surface, (0, 0))
+
+        return surface
+
+    def draw(self):
+        """Puts the backdrop back on the main surface (capturing it again first if it's stale).
+
+        Returns
+        -------
+        None
+        """
+        if self.is_stale:
+            self.capture()
+
+        globalvars.SURFACE_MAIN.blit(self.surface, (0, 0))
+
+
+class ObjMapBackdrop(ObjModalBackdrop):
+    """A backdrop object class that keeps the map view behind a mode that draws onto the map.
+
+    Unlike ObjModalBackdrop, only the camera's view of the map surface is kept, so that whatever
+    is drawn onto the map (like the tile selection) still ends up underneath the window ui.
+
+    Attributes
+    ----------
+    rect : pygame Rect obj
+        The area of the map surface that was captured (the camera's view of the map).
+    """
+
+    def __init__(self, dim_alpha=0, blur=1, animated=True):
+        self.rect = None
+        super().__init__(dim_alpha, blur, animated)
+
+    def capture(self):
+        """Draws the map and keeps the camera's view of it as the backdrop.
+
+        Returns
+        -------
+        None
+        """
+        globalvars.SURFACE_MAP.fill(constants.COLOR_GAME_BG)
+        globalvars.CAMERA.update_pos()
+        draw.draw_map(globalvars.GAME.current_map)
+
+        self.rect = globalvars.CAMERA.rectangle.clip(globalvars.SURFACE_MAP.get_rect())
+        self.surface = self.finish(globalvars.SURFACE_MAP.subsurface(self.rect).copy())
+
+    def draw(self):
+        """Puts the backdrop back on the map surface (capturing it again first if it's stale).
+
+        Returns
+        -------
+        None
+        """
+        if self.is_stale:
+            self.capture()
+
+        globalvars.SURFACE_MAP.blit(self.surface, self.rect.topleft)
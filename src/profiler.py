@@ -0,0 +1,217 @@
+import collections
+import datetime
+import json
+import os
+import time
+
+import pygame
+
+from src import constants, text
+
+# number of most recent frames that the percentiles are computed over
+WINDOW_FRAMES = 300
+
+# number of frames between recomputing the percentiles shown on the overlay
+STATS_REFRESH_FRAMES = 15
+
+# True while the frame profiler is recording (toggled in-game with F3)
+enabled = False
+
+# seconds spent in each scope during the current frame
+_frame_totals = {}
+
+# ms spent in each scope for each of the last WINDOW_FRAMES frames
+_history = {}
+
+# the (p50, p95, p99) ms of each scope shown on the overlay
+_stats = {}
+
+_frames_since_stats = 0
+_last_frame_end = None
+
+
+class ObjScope:
+    """A scoped timer object class that adds the time spent inside a `with` block to its scope.
+
+    Attributes
+    ----------
+    name : str
+        The name of the scope (subsystem) being timed.
+    start : float
+        The perf_counter time the block was entered.
+    """
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.start
+        _frame_totals[self.name] = _frame_totals.get(self.name, 0.0) + elapsed
+
+
+class ObjNullScope:
+    """A scoped timer stand-in that does nothing (used while the profiler is disabled)."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NULL_SCOPE = ObjNullScope()
+
+
+def scope(name):
+    """Returns a timer for a `with` block that is counted towards the scope `name`.
+
+    Parameters
+    ----------
+    name : str
+        The name of the scope (subsystem) being timed.
+
+    Returns
+    -------
+    ObjScope or ObjNullScope
+        The timer (a shared no-op when the profiler is disabled).
+    """
+    if not enabled:
+        return _NULL_SCOPE
+    return ObjScope(name)
+
+
+def toggle():
+    """Turns the profiler on (with an empty history) or off.
+
+    Returns
+    -------
+    None
+    """
+    global enabled, _last_frame_end
+
+    enabled = not enabled
+    _frame_totals.clear()
+    _history.clear()
+    _stats.clear()
+    _last_frame_end = None
+
+
+def end_frame():
+    """Moves the scope times of the frame that just ended into the rolling history.
+
+    The whole frame time (including waiting for the frame rate limit) is recorded as "frame".
+
+    Returns
+    -------
+    None
+    """
+    global _frames_since_stats, _last_frame_end
+
+    if not enabled:
+        return
+
+    now = time.perf_counter()
+    if _last_frame_end is not None:
+        _frame_totals["frame"] = now - _last_frame_end
+    _last_frame_end = now
+
+    for name in _frame_totals.keys() | _history.keys():
+        if name not in _history:
+            _history[name] = collections.deque(maxlen=WINDOW_FRAMES)
+        _history[name].append(_frame_totals.get(name, 0.0) * 1000)
+
+    _frame_totals.clear()
+    _frames_since_stats += 1
+
+
+def percentiles(samples):
+    """Returns the (p50, p95, p99) of `samples` (nearest rank).
+
+    Parameters
+    ----------
+    samples : iterable
+        The sample values.
+
+    Returns
+    -------
+    tuple
+        The 50th, 95th and 99th percentile values.
+    """
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    return tuple(ordered[int(round(last * p))] for p in (0.50, 0.95, 0.99))
+
+
+def draw_overlay(surface):
+    """Draws the rolling p50/p95/p99 time of every scope onto `surface` (if enabled).
+
+    Parameters
+    ----------
+    surface : pygame Surface obj
+        The surface to draw the overlay on.
+
+    Returns
+    -------
+    None
+    """
+    global _frames_since_stats
+
+    if not enabled or not _history:
+        return
+
+    if not _stats or _frames_since_stats >= STATS_REFRESH_FRAMES:
+        _stats.clear()
+        for name, samples in _history.items():
+            _stats[name] = percentiles(samples)
+        _frames_since_stats = 0
+
+    font = constants.FONT_BEST
+    line_height = text.get_text_height(font)
+    lines = [f"{'scope (ms)':<16}{'p50':>7}{'p95':>7}{'p99':>7}"]
+    for name in sorted(_stats):
+        p50, p95, p99 = _stats[name]
+        lines.append(f"{name:<16}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+    lines.append("F3: hide  F4: dump to file")
+
+    panel = pygame.Surface((max(text.get_text_width(font, line) for line in lines) + 10,
+                            line_height * len(lines) + 10), pygame.SRCALPHA)
+    panel.fill((0, 0, 0, 180))
+    for i, line in enumerate(lines):
+        text.draw_text(panel, line, font, (5, 5 + i * line_height), constants.COLOR_WHITE)
+
+    surface.blit(panel, (10, 110))
+
+
+def dump():
+    """Writes the recorded frame history and its percentiles to a JSON file in PROFILE_DIR.
+
+    Returns
+    -------
+    str or None
+        The path of the written file, or None if nothing has been recorded yet.
+    """
+    if not _history:
+        return None
+
+    scopes = {}
+    for name, samples in _history.items():
+        p50, p95, p99 = percentiles(samples)
+        scopes[name] = {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "max_ms": max(samples),
+                        "samples_ms": list(samples)}
+
+    os.makedirs(constants.PROFILE_DIR, exist_ok=True)
+    dump_time = datetime.datetime.now().strftime("%Y-%m-%dT%H%M%S")
+    file_path = os.path.join(constants.PROFILE_DIR, f"frame_profile_{dump_time}.json")
+
+    with open(file_path, "w") as profile_file:
+        json.dump({"frames": len(_history["frame"]) if "frame" in _history else 0,
+                   "scopes": scopes}, profile_file, indent=1)
+
+    return file_path
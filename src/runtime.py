@@ -0,0 +1,72 @@
+import os
+
+import pygame
+
+from src import constants
+
+# True once pygame (SDL) has been initialized through init()
+initialized = False
+
+# (width, height) of the desktop, queried once when pygame is initialized
+_screen_size = None
+
+# loaded fonts by constants.FONTS name
+_font_cache = {}
+
+
+def init():
+    """Initializes pygame the first time it's called (later calls do nothing).
+
+    Also records the desktop size before any game window is opened, so it isn't mistaken for the
+    window size afterwards.
+
+    Returns
+    -------
+    None
+    """
+    global initialized, _screen_size
+
+    if initialized:
+        return
+
+    pygame.init()
+    display_info = pygame.display.Info()
+    _screen_size = (display_info.current_w, display_info.current_h)
+    initialized = True
+
+
+def screen_size():
+    """Returns the (width, height) of the desktop in pixels (initializes pygame if needed)."""
+    init()
+    return _screen_size
+
+
+def font(name):
+    """Returns the font `name` from constants.FONTS, opening the font file on first use.
+
+    Parameters
+    ----------
+    name : str
+        The font name (e.g. "FONT_BEST").
+
+    Returns
+    -------
+    pygame Font obj
+        The loaded font.
+    """
+    try:
+        return _font_cache[name]
+    except KeyError:
+        pass
+
+    init()
+    file_name, size, system_font, underline = constants.FONTS[name]
+
+    if system_font:
+        new_font = pygame.font.SysFont(file_name, size)
+    else:
+        new_font = pygame.font.Font(os.path.join(constants.font_path, file_name), size)
+    new_font.set_underline(underline)
+
+    _font_cache[name] = new_font
+    return new_font
@@ -0,0 +1,335 @@
+import datetime
+import gzip
+import json
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+from src import constants
+
+# every save file starts with these bytes, followed by the header length and the header itself
+SAVE_MAGIC = b"RAKSAVE\x00"
+HEADER_LEN_FORMAT = ">I"
+HEADER_LEN_SIZE = struct.calcsize(HEADER_LEN_FORMAT)
+
+# guards the index file, which is updated by both the main thread and the save writer thread
+_index_lock = threading.RLock()
+
+
+def slot_path(slot):
+    """Returns the path of the save file for `slot`.
+
+    Parameters
+    ----------
+    slot : int
+        The save slot number.
+
+    Returns
+    -------
+    str
+        The save file path.
+    """
+    return os.path.join(constants.SAVE_DIR, f"slot_{slot}.sav")
+
+
+def make_header(game, player):
+    """Builds the small metadata header stored uncompressed at the front of a save file.
+
+    Parameters
+    ----------
+    game : ObjGame
+        The game being saved.
+    player : ObjActor
+        The PLAYER of the game being saved.
+
+    Returns
+    -------
+    dict
+        The header (player name, level, floor, turn count, timestamp and format version).
+    """
+    return {"format_version": constants.SAVE_FORMAT_VERSION,
+            "slot": game.save_slot,
+            "player_name": player.creature.personal_name,
+            "level": player.level,
+            "floor": game.cur_floor,
+            "turn_count": game.turn_count,
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds")}
+
+
+def write_save(slot, header, snapshot):
+    """Compresses `snapshot` and writes it with its `header` to the `slot` save file.
+
+    The file is written to a temporary file first and renamed over the old save, so a crash
+    mid-write leaves the previous save untouched. The save index is updated afterwards.
+
+    Parameters
+    ----------
+    slot : int
+        The save slot number.
+    header : dict
+        The metadata header (see make_header).
+    snapshot : bytes
+        The pickled game state.
+
+    Returns
+    -------
+    None
+    """
+    os.makedirs(constants.SAVE_DIR, exist_ok=True)
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    payload = gzip.compress(snapshot)
+    file_path = slot_path(slot)
+    temp_path = file_path + ".tmp"
+
+    with open(temp_path, "wb") as temp_file:
+        temp_file.write(SAVE_MAGIC)
+        temp_file.write(struct.pack(HEADER_LEN_FORMAT, len(header_bytes)))
+        temp_file.write(header_bytes)
+        temp_file.write(payload)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+
+    os.replace(temp_path, file_path)
+
+    index_entry = dict(header)
+    index_entry["file_size"] = os.path.getsize(file_path)
+    _index_update(slot, index_entry)
+
+
+def read_header(file_path):
+    """Reads only the metadata header of a save file (the game payload is never read).
+
+    Parameters
+    ----------
+    file_path : str
+        The save file path.
+
+    Returns
+    -------
+    tuple
+        The (header dict, payload offset in bytes).
+
+    Raises
+    ------
+    ValueError
+        If the file is not a save file or its header is unreadable.
+    """
+    with open(file_path, "rb") as save_file:
+        if save_file.read(len(SAVE_MAGIC)) != SAVE_MAGIC:
+            raise ValueError(f"{file_path} is not a save file")
+
+        try:
+            header_len, = struct.unpack(HEADER_LEN_FORMAT, save_file.read(HEADER_LEN_SIZE))
+            header = json.loads(save_file.read(header_len).decode("utf-8"))
+        except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as error:
+            raise ValueError(f"{file_path} has a corrupt header") from error
+
+    return header, len(SAVE_MAGIC) + HEADER_LEN_SIZE + header_len
+
+
+def read_save(slot):
+    """Loads the pickled game state stored in the `slot` save file.
+
+    Parameters
+    ----------
+    slot : int
+        The save slot number.
+
+    Returns
+    -------
+    list
+        The unpickled [GAME, PLAYER] list.
+
+    Raises
+    ------
+    ValueError
+        If the save file (header or payload) is corrupt or was written by an unsupported format
+        version.
+    """
+    file_path = slot_path(slot)
+    header, payload_offset = read_header(file_path)
+
+    if header.get("format_version") != constants.SAVE_FORMAT_VERSION:
+        raise ValueError(f"{file_path} has an unsupported save format")
+
+    with open(file_path, "rb") as save_file:
+        save_file.seek(payload_offset)
+        payload = save_file.read()
+
+    # the header's size check doesn't catch a payload that was truncated or corrupted
+    try:
+        return pickle.loads(gzip.decompress(payload))
+    except (OSError, EOFError, zlib.error, pickle.UnpicklingError) as error:
+        raise ValueError(f"{file_path} has a corrupt payload") from error
+
+
+def delete_save(slot):
+    """Deletes the `slot` save file and removes it from the save index.
+
+    Parameters
+    ----------
+    slot : int
+        The save slot number.
+
+    Returns
+    -------
+    None
+    """
+    try:
+        os.remove(slot_path(slot))
+    except OSError:
+        print("No prior save file to delete")
+
+    _index_update(slot, None)
+
+
+def list_saves():
+    """Lists every save slot using only the save index (no save file is opened).
+
+    Each entry is validated against the file on disk with a single stat call: the file has to
+    exist, be the size it was when it was written, and use a supported format version.
+
+    Returns
+    -------
+    list of dict
+        Index entries sorted from most to least recent, each with an extra "valid" key.
+    """
+    saves = []
+
+    for slot, entry in _index_load().items():
+        try:
+            file_size = os.path.getsize(slot_path(slot))
+        except OSError:
+            continue
+
+        entry = dict(entry)
+        entry["slot"] = int(slot)
+        entry["valid"] = (file_size == entry.get("file_size")
+                          and entry.get("format_version") == constants.SAVE_FORMAT_VERSION)
+        saves.append(entry)
+
+    saves.sort(key=lambda save: (save.get("timestamp", ""), save["slot"]), reverse=True)
+    return saves
+
+
+def latest_save():
+    """Returns the most recent valid save slot number or None if there are no valid saves."""
+    for save in list_saves():
+        if save["valid"]:
+            return save["slot"]
+
+    return None
+
+
+def next_free_slot():
+    """Returns a save slot number that isn't used by any existing save."""
+    used_slots = [int(slot) for slot in _index_load()]
+    return max(used_slots, default=0) + 1
+
+
+def rebuild_index():
+    """Recreates the save index by reading the header of every save file in the save directory.
+
+    Used when the index file is missing or unreadable.
+
+    Returns
+    -------
+    dict
+        The rebuilt index that maps slot numbers (as str) to their header entries.
+    """
+    slots = {}
+
+    try:
+        file_names = os.listdir(constants.SAVE_DIR)
+    except OSError:
+        file_names = []
+
+    for file_name in file_names:
+        if not (file_name.startswith("slot_") and file_name.endswith(".sav")):
+            continue
+
+        file_path = os.path.join(constants.SAVE_DIR, file_name)
+        try:
+            header, _ = read_header(file_path)
+        except (OSError, ValueError):
+            continue
+
+        header["file_size"] = os.path.getsize(file_path)
+        slots[file_name[len("slot_"):-len(".sav")]] = header
+
+    with _index_lock:
+        _index_write(slots)
+
+    return slots
+
+
+def _index_load():
+    """Loads the save index, rebuilding it from the save file headers if necessary.
+
+    Returns
+    -------
+    dict
+        Maps slot numbers (as str) to their header entries.
+    """
+    with _index_lock:
+        try:
+            with open(constants.SAVE_INDEX_PATH, "r") as index_file:
+                index = json.load(index_file)
+            return index["slots"]
+        except FileNotFoundError:
+            if not os.path.isdir(constants.SAVE_DIR):
+                return {}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    return rebuild_index()
+
+
+def _index_update(slot, entry):
+    """Sets (or removes if `entry` is None) the index entry of `slot`.
+
+    Parameters
+    ----------
+    slot : int
+        The save slot number.
+    entry : dict or None
+        The new header entry for the slot.
+
+    Returns
+    -------
+    None
+    """
+    with _index_lock:
+        slots = _index_load()
+
+        if entry is None:
+            slots.pop(str(slot), None)
+        else:
+            slots[str(slot)] = entry
+
+        _index_write(slots)
+
+
+def _index_write(slots):
+    """Atomically writes `slots` to the save index file (caller must hold the index lock).
+
+    Parameters
+    ----------
+    slots : dict
+        Maps slot numbers (as str) to their header entries.
+
+    Returns
+    -------
+    None
+    """
+    os.makedirs(constants.SAVE_DIR, exist_ok=True)
+    temp_path = constants.SAVE_INDEX_PATH + ".tmp"
+
+    with open(temp_path, "w") as index_file:
+        json.dump({"format_version": constants.SAVE_FORMAT_VERSION, "slots": slots}, index_file,
+                  indent=1)
+
+    os.replace(temp_path, constants.SAVE_INDEX_PATH)
@@ -0,0 +1,171 @@
+import functools
+
+import numpy
+
+from src import constants
+
+# the shapes of an area of effect around a center tile (see stencil)
+SHAPE_SQUARE = "square"  # a square without its corners (from radius 2 on)
+SHAPE_DISC = "disc"  # every tile within a (rounded) straight line distance of `radius`
+SHAPE_RING = "ring"  # the outer edge of the disc
+SHAPE_CONE = "cone"  # the tiles of the disc within 45 degrees either side of a direction
+
+SHAPES = (SHAPE_SQUARE, SHAPE_DISC, SHAPE_RING, SHAPE_CONE)
+
+
+@functools.lru_cache(maxsize=None)
+def stencil_box(shape, radius, direction=None):
+    """Returns which tiles of the (2 * `radius` + 1) square around a center a shape covers.
+
+    The boxes are only made once per shape, radius and direction and are shared, so they are made
+    read-only.
+
+    Parameters
+    ----------
+    shape : str
+        One of SHAPES.
+    radius : int
+        The number of tiles the shape reaches out from its center.
+    direction : tuple, optional
+        The (dx, dy) direction a cone points in (only for SHAPE_CONE).
+
+    Returns
+    -------
+    numpy array
+        True for every tile of the shape, indexed [dx + radius, dy + radius].
+
+    Raises
+    ------
+    ValueError
+        If `shape` is not one of SHAPES or a cone is not given a direction.
+    """
+    offsets = numpy.arange(-radius, radius + 1)
+    dx, dy = numpy.meshgrid(offsets, offsets, indexing="ij")
+    dist_sq = dx ** 2 + dy ** 2
+
+    # the disc reaches half a tile further than `radius` so that its edge has no lone tips
+    disc = dist_sq <= radius * (radius + 1)
+
+    if shape == SHAPE_SQUARE:
+        box = numpy.ones(dx.shape, dtype=bool)
+        if radius >= 2:
+            box &= ~((numpy.abs(dx) == radius) & (numpy.abs(dy) == radius))
+
+    elif shape == SHAPE_DISC:
+        box = disc
+
+    elif shape == SHAPE_RING:
+        # the disc without the disc of the next smaller radius
+        box = disc & (dist_sq > (radius - 1) * radius) if radius >= 1 else disc
+
+    elif shape == SHAPE_CONE:
+        if direction is None or direction == (0, 0):
+            raise ValueError("a cone needs a direction to point in")
+
+        # the angle to the direction is at most 45 degrees if cos(angle) >= 1 / sqrt(2)
+        dir_x, dir_y = direction
+        dot = dx * dir_x + dy * dir_y
+        in_angle = (dot > 0) & (2 * dot ** 2 >= dist_sq * (dir_x ** 2 + dir_y ** 2))
+        box = disc & in_angle
+
+    else:
+        raise ValueError(f"{shape!r} is not a shape")
+
+    box.setflags(write=False)
+    return box
+
+
+@functools.lru_cache(maxsize=None)
+def stencil(shape, radius, direction=None):
+    """Returns the offsets from its center of every tile a shape covers (see stencil_box).
+
+    Returns
+    -------
+    numpy array
+        The (dx, dy) offsets, one row per tile, ordered by dx and then by dy. Read-only.
+    """
+    offsets = numpy.argwhere(stencil_box(shape, radius, direction)) - radius
+    offsets.setflags(write=False)
+    return offsets
+
+
+def area_coords(center_coords, radius, shape=SHAPE_SQUARE, direction=None, mask=None):
+    """Returns the map-grid coordinates of the tiles of a shape placed on the map.
+
+    Parameters
+    ----------
+    center_coords : tuple
+        The map-grid coordinates the shape is centered on.
+    radius : int
+        The number of tiles the shape reaches out from its center.
+    shape : str, optional
+        One of SHAPES.
+    direction : tuple, optional
+        The (dx, dy) direction a cone points in (only for SHAPE_CONE).
+    mask : numpy array, optional
+        Only the tiles that are True in `mask` (indexed [x, y], like map.floor_arrays) are kept.
+
+    Returns
+    -------
+    numpy array
+        The (x, y) coordinates, one row per tile, of the tiles that are on the map.
+    """
+    center_x, center_y = center_coords
+    coords = stencil(shape, radius, direction) + center_coords
+
+    # only a shape that reaches past an edge of the map has to be clipped
+    if not (radius <= center_x < constants.MAP_WIDTH - radius
+            and radius <= center_y < constants.MAP_HEIGHT - radius):
+        on_map = (coords[:, 0] >= 0) & (coords[:, 0] < constants.MAP_WIDTH) & \
+                 (coords[:, 1] >= 0) & (coords[:, 1] < constants.MAP_HEIGHT)
+        coords = coords[on_map]
+
+    if mask is not None:
+        coords = coords[mask[coords[:, 0], coords[:, 1]]]
+
+    return coords
+
+
+def area_mask(center_coords, radius, shape=SHAPE_SQUARE, direction=None, mask=None):
+    """Returns a shape placed on the map as a mask of the map (see area_coords).
+
+    Returns
+    -------
+    numpy array
+        True for every tile of the shape, indexed [x, y] like map.floor_arrays.
+    """
+    area = numpy.zeros((constants.MAP_WIDTH, constants.MAP_HEIGHT), dtype=bool)
+    coords = area_coords(center_coords, radius, shape, direction)
+    area[coords[:, 0], coords[:, 1]] = True
+
+    if mask is not None:
+        area &= mask
+
+    return area
+
+
+def in_area(dx, dy, radius, shape=SHAPE_SQUARE, direction=None):
+    """Returns which of the offsets (`dx`, `dy`) from a center fall within a shape around it.
+
+    Parameters
+    ----------
+    dx : numpy array
+        The x-offsets from the center of the shape.
+    dy : numpy array
+        The y-offsets from the center of the shape.
+    radius : int
+        The number of tiles the shape reaches out from its center.
+    shape : str, optional
+        One of SHAPES.
+    direction : tuple, optional
+        The (dx, dy) direction a cone points in (only for SHAPE_CONE).
+
+    Returns
+    -------
+    numpy array
+        True for every offset within the shape.
+    """
+    inside = (numpy.abs(dx) <= radius) & (numpy.abs(dy) <= radius)
+    inside[inside] = stencil_box(shape, radius, direction)[dx[inside] + radius, dy[inside] + radius]
+
+    return inside
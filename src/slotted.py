@@ -0,0 +1,74 @@
+import functools
+import operator
+
+
+@functools.lru_cache(maxsize=None)
+def slot_names(cls):
+    """Returns the names of every slot of `cls`, including the slots of its base classes."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names += [slots] if isinstance(slots, str) else slots
+
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+@functools.lru_cache(maxsize=None)
+def slot_getter(cls):
+    """Returns a function that gets the values of every slot of `cls` (in slot_names order)."""
+    names = slot_names(cls)
+    if len(names) == 1:
+        return lambda obj: (getattr(obj, names[0]),)
+
+    return operator.attrgetter(*names)
+
+
+class Slotted:
+    """A base class for the game objects that are created by the thousands and saved with pickle.
+
+    Subclasses list their attributes in __slots__, so their instances don't carry a __dict__ of
+    their own. An object is pickled as its slot names and the tuple of their values (the names
+    tuple is shared by every object of a class, so pickle only writes it once per save), or as a
+    dict of the slots that are set if any slot was never assigned. Saves made before a class gained
+    or lost an attribute, including the saves made before the game objects had slots at all, are
+    loaded by name: attributes that were removed since are dropped, attributes that were renamed
+    are looked up in `state_renames` and attributes that were added since are set from
+    `state_defaults`.
+
+    Attributes
+    ----------
+    state_defaults : dict
+        Class attribute mapping the attributes that older saves may lack to their default value.
+    state_renames : dict
+        Class attribute mapping attribute names that older saves may use to their current name.
+    """
+    __slots__ = ()
+
+    state_defaults = {}
+    state_renames = {}
+
+    def __getstate__(self):
+        try:
+            return slot_names(type(self)), slot_getter(type(self))(self)
+        except AttributeError:
+            return {name: getattr(self, name) for name in slot_names(type(self))
+                    if hasattr(self, name)}
+
+    def __setstate__(self, state):
+        names = slot_names(type(self))
+
+        if type(state) is tuple:
+            state_names, values = state
+            if state_names == names:
+                for name, value in zip(names, values):
+                    setattr(self, name, value)
+                return
+
+            state = dict(zip(state_names, values))
+
+        for name, value in self.state_defaults.items():
+            setattr(self, name, value)
+        for name, value in state.items():
+            name = self.state_renames.get(name, name)
+            if name in names:
+                setattr(self, name, value)
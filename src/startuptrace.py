@@ -0,0 +1,160 @@
+import contextlib
+import importlib.abc
+import json
+import os
+import sys
+import time
+
+# the startup tracer only imports standard library modules so it can be started before the game
+
+# True while startup is being traced
+active = False
+
+# True if the game should quit as soon as the main menu is up (used by the startup benchmark)
+exit_after_startup = False
+
+_trace_path = None
+_start_time = None
+_events = []
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """A module loader wrapper that records how long the wrapped loader takes to run a module.
+
+    Attributes
+    ----------
+    loader : importlib.abc.Loader
+        The loader that actually loads the module (every other attribute is taken from it).
+    module_name : str
+        The full name of the module being loaded.
+    """
+
+    def __init__(self, loader, module_name):
+        self.loader = loader
+        self.module_name = module_name
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            _record(self.module_name, "import", start, time.perf_counter())
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """A meta path finder that wraps the loader of every newly imported module in a _TimedLoader."""
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, fullname)
+        return spec
+
+
+_import_timer = _ImportTimer()
+
+
+def _record(name, category, start, end):
+    """Adds a completed event to the trace (in the Chrome trace event format)."""
+    _events.append({"name": name, "cat": category, "ph": "X", "pid": os.getpid(), "tid": 0,
+                    "ts": round((start - _start_time) * 1e6), "dur": round((end - start) * 1e6)})
+
+
+def start(trace_path, exit_when_done=False):
+    """Starts tracing startup phases and module imports.
+
+    Parameters
+    ----------
+    trace_path : str
+        The file that the trace is written to when startup is finished.
+    exit_when_done : bool, optional
+        True if the game should quit once the main menu is up.
+
+    Returns
+    -------
+    None
+    """
+    global active, exit_after_startup, _trace_path, _start_time
+
+    active = True
+    exit_after_startup = exit_when_done
+    _trace_path = trace_path
+    _start_time = time.perf_counter()
+    _events.clear()
+    sys.meta_path.insert(0, _import_timer)
+
+
+@contextlib.contextmanager
+def phase(name):
+    """Context manager that records the wall time of a startup phase (does nothing if not tracing).
+
+    Parameters
+    ----------
+    name : str
+        The name of the phase.
+    """
+    if not active:
+        yield
+        return
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, "phase", start_time, time.perf_counter())
+
+
+def finish():
+    """Stops tracing and writes the trace file (does nothing if not tracing).
+
+    The file uses the Chrome trace event format (open it in chrome://tracing or Perfetto), with
+    the total startup time and the time of each phase summarized under "otherData".
+
+    Returns
+    -------
+    None
+    """
+    global active
+
+    if not active:
+        return
+
+    active = False
+    if _import_timer in sys.meta_path:
+        sys.meta_path.remove(_import_timer)
+
+    _record("startup", "startup", _start_time, time.perf_counter())
+
+    # only count outermost imports, nested imports are already part of the import that caused them
+    imports_us = 0
+    imports_end = 0
+    for event in sorted(_events, key=lambda event: event["ts"]):
+        if event["cat"] == "import" and event["ts"] >= imports_end:
+            imports_us += event["dur"]
+            imports_end = event["ts"] + event["dur"]
+
+    summary = {"total_ms": _events[-1]["dur"] / 1000,
+               "imports_ms": imports_us / 1000,
+               "phases_ms": {event["name"]: event["dur"] / 1000 for event in _events
+                             if event["cat"] == "phase"}}
+
+    with open(_trace_path, "w") as trace_file:
+        json.dump({"traceEvents": _events, "displayTimeUnit": "ms", "otherData": summary},
+                  trace_file, indent=1)
+
+    print(f"Startup took {summary['total_ms']:.1f} ms, trace written to {_trace_path}")
@@ -1,4 +1,62 @@
-import pygame
+import collections
+
+# the most memory (in bytes) that cached text surfaces can take up before the least recently used
+# ones are thrown away
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# (font, text, antialias, text color, background color) -> rendered text surface, least recently
+# used first
+_text_cache = collections.OrderedDict()
+_text_cache_bytes = 0
+
+
+def render_text(font, text, antialias, text_color, back_color=None):
+    """Renders `text`, reusing the surface from the last time the same text was rendered.
+
+    Rendered surfaces are kept in a least recently used cache that is bounded by
+    TEXT_CACHE_MAX_BYTES. The returned surface is shared, so it must not be drawn on.
+
+    Parameters
+    ----------
+    font : pygame Font obj
+        The font to render the text in.
+    text : str
+        The text to render.
+    antialias : bool
+        True if the text should be rendered with smooth edges (and per-pixel alpha).
+    text_color : tuple
+        Color of the text itself.
+    back_color : tuple, optional
+        Color of the text background (transparent if not given).
+
+    Returns
+    -------
+    pygame Surface obj
+        The rendered text.
+    """
+    global _text_cache_bytes
+
+    key = (font, text, antialias, tuple(text_color),
+           tuple(back_color) if back_color is not None else None)
+
+    text_surf = _text_cache.get(key)
+    if text_surf is not None:
+        _text_cache.move_to_end(key)
+        return text_surf
+
+    if back_color is not None:
+        text_surf = font.render(text, antialias, text_color, back_color)
+    else:
+        text_surf = font.render(text, antialias, text_color)
+
+    _text_cache[key] = text_surf
+    _text_cache_bytes += text_surf.get_pitch() * text_surf.get_height()
+
+    while _text_cache_bytes > TEXT_CACHE_MAX_BYTES and len(_text_cache) > 1:
+        old_surf = _text_cache.popitem(last=False)[1]
+        _text_cache_bytes -= old_surf.get_pitch() * old_surf.get_height()
+
+    return text_surf
 
 
 def draw_text(display_surface, text, font, coords, text_color, back_color=None, center=False):
@@ -25,10 +83,7 @@ def draw_text(display_surface, text, font, coords, text_color, back_color=None,
     -------
     None
     """
-    if back_color is not None:
-        text_surf = font.render(text, False, text_color, back_color)
-    else:
-        text_surf = font.render(text, False, text_color)
+    text_surf = render_text(font, text, False, text_color, back_color)
 
     text_rect = text_surf.get_rect()
 
@@ -69,17 +124,11 @@ def draw_fading_text(display_surface, text, font, coords, text_color, alpha_val,
     int
         The new alpha value (needed to modify the actual alpha variable that needs to be changed)
     """
-    orig_surface = font.render(text, True, text_color)
-    txt_surface = orig_surface.copy()
-    alpha_surface = pygame.Surface(txt_surface.get_size(), pygame.SRCALPHA)
+    txt_surface = render_text(font, text, True, text_color)
 
     # change alpha value
     alpha_val = max(alpha_val - speed, 0)
 
-    # Fill alpha_surf with this color to set its alpha value.
-    alpha_surface.fill((255, 255, 255, alpha_val))
-    txt_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-
     # set text alignment position
     text_rect = txt_surface.get_rect()
     if center:
@@ -87,7 +136,12 @@ def draw_fading_text(display_surface, text, font, coords, text_color, alpha_val,
     else:
         text_rect.topleft = coords
 
+    # the surface alpha is combined with the text's own per-pixel alpha, then reset since the
+    # rendered text is shared through the text cache
+    txt_surface.set_alpha(alpha_val)
     display_surface.blit(txt_surface, text_rect)
+    txt_surface.set_alpha(255)
+
     return alpha_val
 
 
@@ -104,10 +158,7 @@ def get_text_height(font):
     int
         The height of the text font in pixels.
     """
-    font_object = font.render('A', False, (0, 0, 0))
-    font_rect = font_object.get_rect()
-
-    return font_rect.height
+    return font.size('A')[1]
 
 
 def get_text_width(font, text):
@@ -125,7 +176,4 @@ def get_text_width(font, text):
     int
         The width of the text in pixels.
     """
-    font_object = font.render(text, False, (0, 0, 0))
-    font_rect = font_object.get_rect()
-
-    return font_rect.width
+    return font.size(text)[0]